@@ -18,6 +18,7 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 from app.core.config import get_settings
 from app.db.base import Base
 from app.db.models import * 
+from app.db.models.call_search import CALL_SEARCH_TABLE
 
 
 # this is the Alembic Config object
@@ -35,6 +36,13 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """DDL로 따로 만드는 검색 인덱스(call_search, FTS5 내부 테이블)는 autogenerate 비교에서 제외"""
+    if type_ == "table" and name.startswith(CALL_SEARCH_TABLE):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -51,6 +59,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -61,7 +70,7 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """실제 마이그레이션 실행"""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
 
     with context.begin_transaction():
         context.run_migrations()
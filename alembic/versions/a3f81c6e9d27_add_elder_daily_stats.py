@@ -0,0 +1,82 @@
+"""add_elder_daily_stats
+
+Revision ID: a3f81c6e9d27
+Revises: f2c9a7d4e816
+Create Date: 2026-10-19 18:12:44.906351
+
+"""
+from collections import Counter
+from datetime import timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f81c6e9d27'
+down_revision: Union[str, Sequence[str], None] = 'f2c9a7d4e816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    daily_stats = op.create_table('elder_daily_stats',
+    sa.Column('elder_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('completions', sa.Integer(), nullable=False),
+    sa.Column('total_duration_seconds', sa.Float(), nullable=False),
+    sa.Column('duration_count', sa.Integer(), nullable=False),
+    sa.Column('emotion_counts', sa.JSON(), nullable=False),
+    sa.Column('tag_counts', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['elder_id'], ['elders.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('elder_id', 'day')
+    )
+
+    # 기존 통화로 집계 채우기 (DailyStatsService.rebuild와 같은 규칙)
+    calls = sa.table(
+        'calls',
+        sa.column('elder_id', sa.Integer),
+        sa.column('started_at', sa.DateTime(timezone=True)),
+        sa.column('status', sa.String),
+        sa.column('duration_seconds', sa.Float),
+        sa.column('emotion', sa.String),
+        sa.column('tags', sa.JSON),
+    )
+    stats = {}
+    result = op.get_bind().execute(sa.select(calls))
+    for call in result.mappings():
+        started_at = call['started_at']
+        if started_at.tzinfo is not None:
+            started_at = started_at.astimezone(timezone.utc)
+        key = (call['elder_id'], started_at.date())
+        row = stats.setdefault(key, {
+            'elder_id': key[0], 'day': key[1], 'attempts': 0, 'completions': 0,
+            'total_duration_seconds': 0.0, 'duration_count': 0,
+            'emotion_counts': Counter(), 'tag_counts': Counter(),
+        })
+        row['attempts'] += 1
+        if call['status'] == 'completed':
+            row['completions'] += 1
+            if call['duration_seconds'] is not None:
+                row['total_duration_seconds'] += call['duration_seconds']
+                row['duration_count'] += 1
+        if call['emotion']:
+            row['emotion_counts'][call['emotion']] += 1
+        if isinstance(call['tags'], list):
+            row['tag_counts'].update(tag for tag in call['tags'] if isinstance(tag, str) and tag)
+
+    rows = [
+        {**row, 'emotion_counts': dict(row['emotion_counts']), 'tag_counts': dict(row['tag_counts'])}
+        for row in stats.values()
+    ]
+    if rows:
+        op.bulk_insert(daily_stats, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('elder_daily_stats')
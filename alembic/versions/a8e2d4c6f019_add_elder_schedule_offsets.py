@@ -0,0 +1,61 @@
+"""add_elder_schedule_offsets
+
+Revision ID: a8e2d4c6f019
+Revises: f1c6a2d8b430
+Create Date: 2026-10-19 22:14:36.870513
+
+"""
+from datetime import time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e2d4c6f019'
+down_revision: Union[str, Sequence[str], None] = 'f1c6a2d8b430'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# CallScheduleService.WEEKDAY_TO_NUM과 같은 값
+WEEKDAY_TO_NUM = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch 모드는 SQLite에서 테이블을 다시 만들므로 ADD COLUMN으로 추가
+    op.add_column('elders', sa.Column('schedule_offsets', sa.JSON(), nullable=True))
+
+    # 기존 스케줄로 채우기 (CallScheduleService.build_schedule_offsets와 같은 규칙)
+    bind = op.get_bind()
+    offsets: dict[int, list[int]] = {}
+    for elder_id, day_of_week, call_time in bind.execute(
+        sa.text('SELECT elder_id, day_of_week, time FROM call_schedules')
+    ):
+        weekday = WEEKDAY_TO_NUM.get(day_of_week.lower())
+        if weekday is None:
+            continue
+        if isinstance(call_time, str):
+            # SQLite는 TIME을 문자열로 반환
+            call_time = time.fromisoformat(call_time)
+        offsets.setdefault(elder_id, []).append(
+            weekday * 86400 + call_time.hour * 3600 + call_time.minute * 60 + call_time.second
+        )
+
+    elders = sa.table('elders', sa.column('id', sa.Integer), sa.column('schedule_offsets', sa.JSON))
+    bind.execute(
+        elders.update().values(schedule_offsets=[])
+    )
+    for elder_id, values in offsets.items():
+        bind.execute(
+            elders.update().where(elders.c.id == elder_id).values(schedule_offsets=sorted(values))
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('elders', 'schedule_offsets')
@@ -0,0 +1,74 @@
+"""use_bigram_call_search_on_sqlite
+
+Revision ID: b4f7e1a9c352
+Revises: a8e2d4c6f019
+Create Date: 2026-10-19 23:02:11.482906
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4f7e1a9c352'
+down_revision: Union[str, Sequence[str], None] = 'a8e2d4c6f019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CALL_TEXT_SQL = """
+SELECT c.id, coalesce(c.summary, ''), coalesce((
+    SELECT group_concat(message, char(10)) FROM (
+        SELECT m.message FROM call_messages m WHERE m.call_id = c.id ORDER BY m.timestamp, m.id
+    )
+), '')
+FROM calls c
+"""
+
+# CallSearchService.bigram_text와 같은 규칙
+WORD_PATTERN = re.compile(r"[^\W_]+")
+BIGRAM_BREAK_TOKEN = "x"
+BATCH_SIZE = 500
+
+
+def bigram_text(content: str) -> str:
+    grams = []
+    for word in WORD_PATTERN.findall(content.lower()):
+        if len(word) < 2:
+            continue
+        if grams and grams[-1][-1] == word[0]:
+            grams.append(BIGRAM_BREAK_TOKEN)
+        grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return " ".join(grams)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL(pg_trgm)은 그대로, SQLite만 trigram -> unicode61 + bigram으로 다시 만듦
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute('DROP TABLE IF EXISTS call_search')
+    op.execute("CREATE VIRTUAL TABLE call_search USING fts5(summary, transcript, tokenize='unicode61')")
+
+    bind = op.get_bind()
+    rows = []
+    for call_id, summary, transcript in bind.execute(sa.text(CALL_TEXT_SQL)):
+        rows.append({"call_id": call_id, "summary": bigram_text(summary), "transcript": bigram_text(transcript)})
+        if len(rows) >= BATCH_SIZE:
+            bind.execute(sa.text("INSERT INTO call_search (rowid, summary, transcript) VALUES (:call_id, :summary, :transcript)"), rows)
+            rows = []
+    if rows:
+        bind.execute(sa.text("INSERT INTO call_search (rowid, summary, transcript) VALUES (:call_id, :summary, :transcript)"), rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute('DROP TABLE IF EXISTS call_search')
+    op.execute("CREATE VIRTUAL TABLE call_search USING fts5(summary, transcript, tokenize='trigram')")
+    op.execute(f"INSERT INTO call_search (rowid, summary, transcript) {CALL_TEXT_SQL}")
@@ -0,0 +1,31 @@
+"""add_call_id_to_elder_started_at_index
+
+Revision ID: b6d2e8a4f013
+Revises: e5a7c3f1b924
+Create Date: 2026-10-19 16:41:27.530918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d2e8a4f013'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c3f1b924'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 통화 목록 cursor 페이지네이션 (started_at DESC, id DESC)을 인덱스 순서로 읽도록 id 추가
+    op.drop_index('ix_calls_elder_id_started_at', table_name='calls')
+    op.create_index('ix_calls_elder_id_started_at', 'calls', ['elder_id', sa.text('started_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_calls_elder_id_started_at', table_name='calls')
+    op.create_index('ix_calls_elder_id_started_at', 'calls', ['elder_id', sa.text('started_at DESC')], unique=False)
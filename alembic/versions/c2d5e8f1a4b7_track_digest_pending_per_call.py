@@ -0,0 +1,62 @@
+"""track_digest_pending_per_call
+
+Revision ID: c2d5e8f1a4b7
+Revises: b4f7e1a9c352
+Create Date: 2026-10-19 23:41:08.517320
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d5e8f1a4b7'
+down_revision: Union[str, Sequence[str], None] = 'b4f7e1a9c352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch 모드는 SQLite에서 테이블을 다시 만들므로 ADD COLUMN으로 추가
+    op.add_column('calls', sa.Column('digest_pending', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # digest 모드 보호자의 기준점(last_digest_call_id) 이후 통화를 digest 대기로 표시
+    op.execute(
+        """
+        UPDATE calls SET digest_pending = true
+        WHERE id > (
+            SELECT users.last_digest_call_id FROM users
+            WHERE users.id = calls.user_id AND users.report_email_mode = 'digest'
+        )
+        """
+    )
+    op.create_index(
+        'ix_calls_digest_pending_user_id_started_at', 'calls',
+        ['digest_pending', 'user_id', 'started_at'], unique=False
+    )
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('last_digest_call_id')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('last_digest_call_id', sa.Integer(), server_default='0', nullable=False))
+
+    # 기준점은 digest 대기 중인 첫 통화 직전 (대기 통화가 없으면 마지막 통화)
+    op.execute(
+        """
+        UPDATE users SET last_digest_call_id = COALESCE(
+            (SELECT MIN(calls.id) - 1 FROM calls WHERE calls.user_id = users.id AND calls.digest_pending),
+            (SELECT MAX(calls.id) FROM calls WHERE calls.user_id = users.id),
+            0
+        )
+        """
+    )
+
+    op.drop_index('ix_calls_digest_pending_user_id_started_at', table_name='calls')
+    op.drop_column('calls', 'digest_pending')
@@ -0,0 +1,65 @@
+"""add_call_search
+
+Revision ID: c7d4a9e2f561
+Revises: a3f81c6e9d27
+Create Date: 2026-10-19 19:03:27.215840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d4a9e2f561'
+down_revision: Union[str, Sequence[str], None] = 'a3f81c6e9d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 방언마다 구조가 다르므로 app/db/models/call_search.py와 같은 DDL을 직접 실행
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE call_search USING fts5(summary, transcript, tokenize='trigram')")
+
+        # 기존 통화로 인덱스 채우기 (CallSearchService.index_calls와 같은 규칙)
+        op.execute("""
+            INSERT INTO call_search (rowid, summary, transcript)
+            SELECT c.id, coalesce(c.summary, ''), coalesce((
+                SELECT group_concat(message, char(10)) FROM (
+                    SELECT m.message FROM call_messages m WHERE m.call_id = c.id ORDER BY m.timestamp, m.id
+                )
+            ), '')
+            FROM calls c
+        """)
+    else:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_table('call_search',
+        sa.Column('call_id', sa.Integer(), nullable=False),
+        sa.Column('elder_id', sa.Integer(), nullable=False),
+        sa.Column('summary', sa.Text(), server_default='', nullable=False),
+        sa.Column('transcript', sa.Text(), server_default='', nullable=False),
+        sa.ForeignKeyConstraint(['call_id'], ['calls.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('call_id')
+        )
+        op.create_index('ix_call_search_elder_id', 'call_search', ['elder_id'], unique=False)
+        op.create_index('ix_call_search_summary_trgm', 'call_search', ['summary'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'summary': 'gin_trgm_ops'})
+        op.create_index('ix_call_search_transcript_trgm', 'call_search', ['transcript'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'transcript': 'gin_trgm_ops'})
+
+        op.execute("""
+            INSERT INTO call_search (call_id, elder_id, summary, transcript)
+            SELECT c.id, c.elder_id, coalesce(c.summary, ''), coalesce((
+                SELECT string_agg(m.message, E'\\n' ORDER BY m.timestamp, m.id)
+                FROM call_messages m WHERE m.call_id = c.id
+            ), '')
+            FROM calls c
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TABLE IF EXISTS call_search')
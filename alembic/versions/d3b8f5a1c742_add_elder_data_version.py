@@ -0,0 +1,29 @@
+"""add_elder_data_version
+
+Revision ID: d3b8f5a1c742
+Revises: c7d4a9e2f561
+Create Date: 2026-10-19 20:41:05.318227
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3b8f5a1c742'
+down_revision: Union[str, Sequence[str], None] = 'c7d4a9e2f561'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch 모드는 SQLite에서 테이블을 다시 만들므로 ADD COLUMN으로 추가
+    op.add_column('elders', sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('elders', 'data_version')
@@ -0,0 +1,36 @@
+"""add_user_report_email_mode
+
+Revision ID: d91f3b6a2c58
+Revises: c4e8a1d2b7f3
+Create Date: 2026-10-19 10:03:47.915204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91f3b6a2c58'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1d2b7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('report_email_mode', sa.String(length=20), server_default='instant', nullable=False))
+        batch_op.add_column(sa.Column('digest_interval_hours', sa.Integer(), server_default='24', nullable=False))
+        batch_op.add_column(sa.Column('last_digest_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column('last_digest_call_id', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('last_digest_call_id')
+        batch_op.drop_column('last_digest_at')
+        batch_op.drop_column('digest_interval_hours')
+        batch_op.drop_column('report_email_mode')
@@ -0,0 +1,32 @@
+"""add_call_query_indexes
+
+Revision ID: e5a7c3f1b924
+Revises: d91f3b6a2c58
+Create Date: 2026-10-19 14:03:52.117406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3f1b924'
+down_revision: Union[str, Sequence[str], None] = 'd91f3b6a2c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_calls_elder_id_started_at', 'calls', ['elder_id', sa.text('started_at DESC')], unique=False)
+    op.create_index('ix_calls_user_id_started_at', 'calls', ['user_id', 'started_at'], unique=False)
+    op.create_index('ix_call_messages_call_id_timestamp', 'call_messages', ['call_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_call_messages_call_id_timestamp', table_name='call_messages')
+    op.drop_index('ix_calls_user_id_started_at', table_name='calls')
+    op.drop_index('ix_calls_elder_id_started_at', table_name='calls')
@@ -0,0 +1,31 @@
+"""add_id_to_call_messages_timestamp_index
+
+Revision ID: f1c6a2d8b430
+Revises: d3b8f5a1c742
+Create Date: 2026-10-19 21:37:52.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6a2d8b430'
+down_revision: Union[str, Sequence[str], None] = 'd3b8f5a1c742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 대화 내용 cursor 조회 ((timestamp, id) > cursor ORDER BY timestamp, id)를 인덱스 순서로 처리
+    op.drop_index('ix_call_messages_call_id_timestamp', table_name='call_messages')
+    op.create_index('ix_call_messages_call_id_timestamp', 'call_messages', ['call_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_call_messages_call_id_timestamp', table_name='call_messages')
+    op.create_index('ix_call_messages_call_id_timestamp', 'call_messages', ['call_id', 'timestamp'], unique=False)
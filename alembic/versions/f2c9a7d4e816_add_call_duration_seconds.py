@@ -0,0 +1,37 @@
+"""add_call_duration_seconds
+
+Revision ID: f2c9a7d4e816
+Revises: b6d2e8a4f013
+Create Date: 2026-10-19 17:25:09.482113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c9a7d4e816'
+down_revision: Union[str, Sequence[str], None] = 'b6d2e8a4f013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch 모드는 SQLite에서 테이블을 다시 만들면서 인덱스의 DESC를 잃으므로 ADD COLUMN으로 추가
+    op.add_column('calls', sa.Column('duration_seconds', sa.Float(), nullable=True))
+
+    # 기존 통화는 ended_at - started_at으로 채움 (Vapi durationSeconds는 저장되어 있지 않음)
+    if op.get_bind().dialect.name == 'sqlite':
+        # julianday 차이는 부동소수점 오차가 있으므로 ms 단위로 반올림 (120초가 119.99999초가 되지 않도록)
+        duration = 'MAX(0, ROUND((julianday(ended_at) - julianday(started_at)) * 86400, 3))'
+    else:
+        duration = 'GREATEST(0, EXTRACT(EPOCH FROM ended_at - started_at))'
+    op.execute(f'UPDATE calls SET duration_seconds = {duration} WHERE ended_at IS NOT NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('calls', 'duration_seconds')
@@ -34,6 +34,18 @@ class Settings(BaseSettings):
     # Email (SendGrid)
     EMAIL_FROM: str  # Single Sender 인증된 이메일 (예: "aicarecall.sms@gmail.com")
     SENDGRID_API_KEY: str
+    SENDGRID_API_URL: str = "https://api.sendgrid.com"
+    SENDGRID_MAX_CONCURRENCY: int = 10  # 동시 전송 수 / 연결 풀 크기
+    SENDGRID_TIMEOUT_SECONDS: float = 10.0
+    SENDGRID_MAX_PERSONALIZATIONS: int = 1000  # 한 요청에 묶을 최대 수신자 수 (SendGrid 제한 1000)
+    
+    # 이메일 발송 대기열 (email_outbox)
+    EMAIL_OUTBOX_INTERVAL_SECONDS: int = 10  # 발송 작업 주기
+    EMAIL_OUTBOX_BATCH_SIZE: int = 500  # 한 번에 가져올 최대 행 수
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 8  # 이 횟수만큼 실패하면 failed 처리
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = 30  # 재시도 대기 시간 (실패할 때마다 2배)
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS: int = 3600  # 재시도 대기 시간 최대값
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 120  # 발송 중인 행을 다른 작업이 가져가지 않는 시간
 
     # Vapi
     VAPI_API_KEY: str
@@ -42,11 +54,38 @@ class Settings(BaseSettings):
     # Web Dashboard
     WEB_URL: str = "https://ai-care-call-web.vercel.app"
     
+    # Webhook 로그 보관 (data/webhook_logs)
+    WEBHOOK_ARCHIVE_MODE: str = "projected"  # projected: 저장에 필요한 필드만 / full: 원본 전체
+    WEBHOOK_ARCHIVE_EXTRA_FIELDS: str = ""  # projected 모드에서 추가로 남길 필드 (쉼표 구분, 예: "message.cost,message.recordingUrl")
+    WEBHOOK_ARCHIVE_FULL_ON_FAILURE: bool = True  # DB 저장에 실패한 end-of-call-report는 원본 전체 보관
+
+    # 실시간 통화 상태 (in-memory)
+    LIVE_CALL_TRANSCRIPT_LINES: int = 20  # 통화별로 유지할 최근 대화 줄 수
+    LIVE_CALL_ENDED_TTL_SECONDS: int = 300  # 종료된 통화를 유지할 시간
+    LIVE_CALL_STALE_SECONDS: int = 3600  # 종료 이벤트 없이 갱신이 끊긴 통화를 유지할 시간
+    LIVE_CALL_MAX_CALLS: int = 1000  # 동시에 유지할 최대 통화 수
+
+    # 대시보드 실시간 이벤트 (SSE)
+    DASHBOARD_EVENTS_KEEPALIVE_SECONDS: int = 15  # 이벤트가 없을 때 keepalive comment 주기
+    DASHBOARD_EVENTS_RETRY_MS: int = 3000  # 연결이 끊겼을 때 브라우저 재연결 대기 시간
+    DASHBOARD_EVENTS_QUEUE_SIZE: int = 100  # 연결별로 쌓아둘 최대 이벤트 수
+
+    # 대시보드 응답 캐시
+    DASHBOARD_CACHE_BACKEND: str = "memory"  # memory: 프로세스 내 LRU / redis: 여러 worker 공유
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60  # 최대 캐시 시간 (0이면 캐시 사용 안 함)
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 1000  # memory 백엔드 최대 어르신 수
+    DASHBOARD_CACHE_REDIS_URL: str = "redis://localhost:6379/0"  # redis 백엔드 주소
+    
     @property
     def voip_topic(self) -> str:
         """VoIP 토픽 = Bundle ID + .voip"""
         return f"{self.BUNDLE_ID}.voip"
     
+    @property
+    def webhook_archive_extra_fields(self) -> list[str]:
+        """projected 모드에서 추가로 남길 필드 리스트"""
+        return [field.strip() for field in self.WEBHOOK_ARCHIVE_EXTRA_FIELDS.split(",") if field.strip()]
+    
     @property
     def apns_host(self) -> str:
         """APNs 서버 호스트 (환경에 따라 분기)"""
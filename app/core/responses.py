@@ -0,0 +1,80 @@
+"""공통 응답 클래스 / 조건부 요청(ETag, Last-Modified) 헬퍼"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+# 조건부 요청을 지원하는 응답: 브라우저가 저장한 응답을 쓰기 전에 항상 재검증
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답 (앱 기본 응답 클래스)
+    
+    dict를 반환하는 엔드포인트(assistant config 등)는 이 클래스로 직접 감싸서 반환하면
+    jsonable_encoder를 거치지 않고 바로 bytes로 직렬화됩니다.
+    """
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def parse_etags(if_none_match: str | None) -> list[str]:
+    """
+    If-None-Match 헤더의 ETag 목록 (따옴표 / W/ 제거, "*"는 무시)
+    
+    Args:
+        if_none_match: If-None-Match 헤더 값 (예: 'W/"a", "b"')
+    
+    Returns:
+        ETag 값 리스트 (예: ["a", "b"])
+    """
+    if not if_none_match:
+        return []
+    tags = []
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if len(tag) >= 2 and tag[0] == tag[-1] == '"':
+            tags.append(tag[1:-1])
+    return tags
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match에 etag가 있는지 (weak 비교)"""
+    value = etag[2:] if etag.startswith("W/") else etag
+    return value.strip('"') in parse_etags(if_none_match)
+
+
+def http_date(value: datetime) -> str:
+    """datetime을 HTTP 날짜 형식으로 (Last-Modified 헤더, timezone이 없는 값은 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified_since(if_modified_since: str | None, last_modified: datetime) -> bool:
+    """
+    If-Modified-Since 이후로 바뀌지 않았는지 (헤더가 없거나 형식이 잘못되었으면 False)
+    
+    HTTP 날짜는 초 단위이므로 last_modified도 초 단위로 비교합니다.
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return int(last_modified.timestamp()) <= since.timestamp()
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    """304 Not Modified 응답 (본문 없음, ETag / Last-Modified / Cache-Control 헤더만)"""
+    return Response(status_code=304, headers=headers)
@@ -4,6 +4,9 @@ from app.db.models.elder import Elder
 from app.db.models.call_schedule import CallSchedule
 from app.db.models.call import Call
 from app.db.models.call_message import CallMessage
+from app.db.models.email_outbox import EmailOutbox
+from app.db.models.elder_daily_stats import ElderDailyStats
+from app.db.models import call_search  # noqa: F401  (검색 인덱스 DDL 등록)
 
-__all__ = ["User", "Elder", "CallSchedule", "Call", "CallMessage"]
+__all__ = ["User", "Elder", "CallSchedule", "Call", "CallMessage", "EmailOutbox", "ElderDailyStats"]
 
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Text, func, JSON
+from sqlalchemy import String, DateTime, Integer, Float, Boolean, ForeignKey, Text, func, JSON, Index, desc, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -12,6 +12,14 @@ if TYPE_CHECKING:
 class Call(Base):
     """통화 기록 테이블"""
     __tablename__ = "calls"
+    __table_args__ = (
+        # 대시보드: 어르신별 최근 통화 / 주간 통계 / 통화 목록 (id는 cursor 페이지네이션 정렬용)
+        Index("ix_calls_elder_id_started_at", "elder_id", desc("started_at"), desc("id")),
+        # 보호자별 통화 조회
+        Index("ix_calls_user_id_started_at", "user_id", "started_at"),
+        # 아직 digest에 포함되지 않은 통화 (보호자별, 시간순)
+        Index("ix_calls_digest_pending_user_id_started_at", "digest_pending", "user_id", "started_at"),
+    )
     
     # 기본 정보
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -23,6 +31,7 @@ class Call(Base):
     # 통화 시간 정보
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     ended_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)  # Vapi durationSeconds (없으면 ended_at - started_at)
     
     # 통화 상태 및 결과
     status: Mapped[str] = mapped_column(String(50), nullable=False)  # completed, failed, no_answer, busy
@@ -30,6 +39,9 @@ class Call(Base):
     emotion: Mapped[str | None] = mapped_column(String(50), nullable=True)
     tags: Mapped[list[str] | None] = mapped_column(JSON, nullable=True) 
     
+    # digest 모드 보호자의 통화: 저장할 때 True, digest 이메일 대기열에 추가할 때 False
+    digest_pending: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+    
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Text, func
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Text, func, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
 class CallMessage(Base):
     """통화 메시지 로그 테이블"""
     __tablename__ = "call_messages"
+    __table_args__ = (
+        # 통화 상세 / 대화 내용 페이지: 통화별 메시지를 (timestamp, id) 순으로 조회
+        Index("ix_call_messages_call_id_timestamp", "call_id", "timestamp", "id"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     call_id: Mapped[int] = mapped_column(Integer, ForeignKey("calls.id", ondelete="CASCADE"), nullable=False)
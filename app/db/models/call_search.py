@@ -0,0 +1,46 @@
+"""통화 검색 인덱스 (call_search)
+
+통화 요약 / 대화 내용 검색용 테이블로, DB 방언마다 구조가 달라서 ORM 모델 없이 DDL로 만듭니다.
+- SQLite: FTS5 가상 테이블 (unicode61 tokenizer, rowid = calls.id, 값은 CallSearchService.bigram_text로 펼친 bigram)
+- PostgreSQL: 일반 테이블 + pg_trgm GIN 인덱스
+
+Base.metadata.create_all(개발용 startup, bench)에서 함께 만들어지고, 운영 DB는 alembic migration으로 만듭니다.
+내용은 CallSearchService.index_calls가 통화 저장과 같은 트랜잭션에서 채웁니다.
+SQLite 가상 테이블에는 calls FK가 없으므로, ORM으로 통화를 삭제할 때(Elder.calls cascade 포함)
+같은 flush에서 검색 인덱스 행도 삭제합니다.
+"""
+from sqlalchemy import DDL, event, text
+
+from app.db.base import Base
+from app.db.models.call import Call
+
+CALL_SEARCH_TABLE = "call_search"
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS call_search USING fts5(summary, transcript, tokenize='unicode61')",
+]
+
+POSTGRESQL_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE TABLE IF NOT EXISTS call_search ("
+    " call_id INTEGER PRIMARY KEY REFERENCES calls (id) ON DELETE CASCADE,"
+    " elder_id INTEGER NOT NULL,"
+    " summary TEXT NOT NULL DEFAULT '',"
+    " transcript TEXT NOT NULL DEFAULT '')",
+    "CREATE INDEX IF NOT EXISTS ix_call_search_elder_id ON call_search (elder_id)",
+    "CREATE INDEX IF NOT EXISTS ix_call_search_summary_trgm ON call_search USING gin (summary gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_call_search_transcript_trgm ON call_search USING gin (transcript gin_trgm_ops)",
+]
+
+for statement in SQLITE_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in POSTGRESQL_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+event.listen(Base.metadata, "before_drop", DDL("DROP TABLE IF EXISTS call_search"))
+
+
+@event.listens_for(Call, "after_delete")
+def _delete_call_search_row(mapper, connection, target: Call) -> None:
+    """통화 삭제 시 검색 인덱스 행 삭제 (PostgreSQL은 FK ON DELETE CASCADE로도 삭제됨)"""
+    key = "rowid" if connection.dialect.name == "sqlite" else "call_id"
+    connection.execute(text(f"DELETE FROM call_search WHERE {key} = :call_id"), {"call_id": target.id})
@@ -1,7 +1,7 @@
 """Elder 모델"""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, DateTime, Boolean, Integer, ForeignKey, func
+from sqlalchemy import String, DateTime, Boolean, Integer, ForeignKey, JSON, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -32,6 +32,10 @@ class Elder(Base):
     additional_info: Mapped[str] = mapped_column(String(511), nullable=True)
     invite_code: Mapped[str] = mapped_column(String(6), nullable=False, index=True)
     voip_device_token: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    # 대시보드 내용(통화 / 일정 / 어르신 정보)이 바뀔 때마다 1씩 증가 (대시보드 ETag용)
+    data_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # 통화 스케줄을 주 시작(월요일 00:00)부터의 초로 바꿔 정렬한 값 (스케줄 변경 시 CallScheduleService가 갱신)
+    schedule_offsets: Mapped[list[int] | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
@@ -0,0 +1,26 @@
+from datetime import date, datetime
+from sqlalchemy import Date, DateTime, Float, Integer, ForeignKey, func, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class ElderDailyStats(Base):
+    """어르신별 일별 통화 집계 테이블 (통화 저장과 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "elder_daily_stats"
+
+    elder_id: Mapped[int] = mapped_column(Integer, ForeignKey("elders.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)  # started_at 기준 날짜
+
+    # 통화 수
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # status = completed
+
+    # 평균 통화 시간 계산용 (duration_seconds가 있는 완료 통화만)
+    total_duration_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    duration_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # {"좋음": 2, "나쁨": 1} / {"식사": 3, "산책": 1}
+    emotion_counts: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    tag_counts: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
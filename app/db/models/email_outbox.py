@@ -0,0 +1,31 @@
+from datetime import datetime
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Text, func, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class EmailOutbox(Base):
+    """이메일 발송 대기열 테이블 (Call과 같은 트랜잭션에서 기록, 백그라운드에서 발송)"""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # 발송 대상 조회: status='pending' AND next_attempt_at <= now
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+    
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)  # call_report
+    to_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    call_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("calls.id", ondelete="CASCADE"), nullable=True)
+    
+    # 템플릿 치환 값 (ELDER_NAME, SUMMARY 등)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    
+    # 발송 상태
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")  # pending, sent, failed
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.now)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    
+    # 타임스탬프
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -1,6 +1,6 @@
 """User 모델"""
 from datetime import datetime
-from sqlalchemy import String, DateTime, func
+from sqlalchemy import String, DateTime, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
@@ -11,6 +11,12 @@ class User(Base):
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    
+    # 통화 리포트 이메일 수신 방식
+    report_email_mode: Mapped[str] = mapped_column(String(20), nullable=False, default="instant", server_default="instant")  # instant, digest
+    digest_interval_hours: Mapped[int] = mapped_column(Integer, nullable=False, default=24, server_default="24")  # digest 발송 주기 (24 = 하루 1회)
+    last_digest_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
@@ -1,9 +1,12 @@
 from fastapi import FastAPI
-from app.routers import push, webhook, health, elders, auth, elder_app, dashboard
+from app.routers import push, webhook, health, elders, auth, elder_app, dashboard, users
 from app.core.config import get_settings
+from app.core.responses import ORJSONResponse
 from app.db.base import Base
 from app.db.session import engine
 from app.scheduler.scheduler import start_scheduler, shutdown_scheduler
+from app.services.email import close_sendgrid_client
+from app.services.dashboard_cache import dashboard_cache
 from fastapi.middleware.cors import CORSMiddleware
 
 settings = get_settings()
@@ -12,7 +15,8 @@ app = FastAPI(
     title="APNs Push Server",
     description="iOS APNs 푸시 + Vapi 웹훅 서버",
     version="1.0.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
 origins = [
@@ -38,6 +42,7 @@ app.include_router(webhook.router)
 app.include_router(elders.router)
 app.include_router(elder_app.router)
 app.include_router(dashboard.router)
+app.include_router(users.router)
 
 
 # 서버 시작 시 로그
@@ -68,4 +73,10 @@ async def shutdown_event():
     # 스케줄러 종료
     shutdown_scheduler()
     print("⏰ Scheduler stopped")
+    
+    # 공유 SendGrid 클라이언트 종료
+    await close_sendgrid_client()
+    
+    # 대시보드 캐시 연결 종료
+    await dashboard_cache.close()
 
@@ -1,23 +1,54 @@
 """대시보드 API 라우터"""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from datetime import date
 from math import ceil
+from typing import Literal
 
-from app.db.session import get_db
+from app.db.session import get_db, AsyncSessionLocal
+from app.db.models.call import Call
 from app.db.models.elder import Elder
-from app.db.models.call_schedule import CallSchedule
-from app.schemas.dashboard import DashboardResponse, CallListResponse, CallDetailResponse, CallMessageItem
+from app.schemas.dashboard import DashboardResponse, CallListResponse, CallDetailResponse, CallMessageItem, LiveCallResponse, TrendsResponse, CallSearchResponse, GuardianOverviewResponse, TranscriptPageResponse
 from app.services.dashboard import (
     build_elder_basic_info,
-    get_weekly_stats,
-    get_recent_calls,
+    get_dashboard_summary,
     get_today_highlight,
     find_next_scheduled_call,
     build_weekly_schedule,
     get_week_range,
     get_call_list_paginated,
+    get_call_list_by_cursor,
+    count_calls,
     get_call_detail_by_id,
+    get_trends,
+    get_guardian_overview,
+    get_dashboard_version,
+    get_call_validators,
+    call_detail_etag,
+    get_transcript_page,
+    decode_call_cursor,
+    iter_transcript_ndjson,
+    TRANSCRIPT_PAGE_SIZE,
+    TRANSCRIPT_MAX_PAGE_SIZE,
+    default_trend_range,
+    CALL_LIST_COUNT_LIMIT,
+    TREND_MAX_DAYS,
+)
+from app.services.elder import ElderService
+from app.services.search import CallSearchService
+from app.services.export import CallExportService
+from app.services.live_call import live_call_store
+from app.services.dashboard_events import stream_events, format_sse, LIVE_SNAPSHOT_EVENT, SSE_HEADERS
+from app.services.dashboard_cache import dashboard_cache, dashboard_expires_at, dashboard_etag, match_dashboard_etag
+from app.core.responses import (
+    ORJSONResponse,
+    REVALIDATE_CACHE_CONTROL,
+    etag_matches,
+    http_date,
+    not_modified_since,
+    not_modified_response,
 )
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
@@ -26,6 +57,7 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 @router.get("/{elder_id}", response_model=DashboardResponse)
 async def get_dashboard(
     elder_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -42,58 +74,68 @@ async def get_dashboard(
         - next_scheduled_call: 다음 예정 통화
         - this_week_schedule: 이번 주 월~일 일정
     
+    직렬화된 응답은 어르신별로 캐시되며, 통화 저장 / 일정 변경 / 어르신 정보 변경 시 삭제됩니다.
+    (X-Cache 헤더: HIT / MISS)
+    
+    응답의 ETag를 If-None-Match로 보내면 어르신 데이터 버전만 조회해서,
+    그 사이 바뀐 내용이 없으면 304 Not Modified를 반환합니다.
+    
     TODO: 추후 이메일 검증을 통한 사용자 인증 추가 예정
     """
-    # 1. 어르신 정보 조회
-    result = await db.execute(
-        select(Elder).where(Elder.id == elder_id)
-    )
-    elder = result.scalar_one_or_none()
-    
-    if not elder:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="해당 어르신을 찾을 수 없습니다"
-        )
+    # 0-1. 조건부 요청: 데이터 버전이 같고 내용이 바뀌는 시각 전이면 304
+    if_none_match = request.headers.get("if-none-match")
+    data_version = None
+    if if_none_match:
+        data_version = await get_dashboard_version(db, elder_id)
+        if data_version is not None:
+            etag = match_dashboard_etag(if_none_match, elder_id, data_version)
+            if etag:
+                return not_modified_response({"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL})
     
-    # 2. 어르신 기본 정보 구성
-    elder_info = await build_elder_basic_info(elder)
+    # 0-2. 캐시된 응답이 현재 데이터 버전이면 그대로 반환
+    # (캐시는 worker끼리 공유되므로 다른 worker가 invalidate 전에 저장한 응답인지 버전으로 확인)
+    if dashboard_cache.enabled and not if_none_match:
+        data_version = await get_dashboard_version(db, elder_id)
+    cached = await dashboard_cache.get(elder_id, data_version)
+    if cached is not None:
+        etag, body = cached
+        return Response(content=body, media_type="application/json", headers={
+            "X-Cache": "HIT", "ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL,
+        })
+    generation = dashboard_cache.generation(elder_id)
     
-    # 3. 이번 주 범위 계산 (월요일 00:00 ~ 다음 주 월요일 00:00)
+    # 1. 이번 주 범위 계산 (월요일 00:00 ~ 다음 주 월요일 00:00)
     week_start, week_end = get_week_range()
     
-    # 4. 주간 통화 통계
-    weekly_stats = await get_weekly_stats(
+    # 2. 어르신 정보 + 주간 통화 통계 + 최근 통화 기록(최근 10개)을 한 번에 조회
+    elder, weekly_stats, recent_calls = await get_dashboard_summary(
         db=db,
         elder_id=elder_id,
         week_start=week_start,
-        week_end=week_end
+        week_end=week_end,
+        recent_limit=10
     )
     
-    # 5. 최근 통화 기록 (최근 10개)
-    recent_calls = await get_recent_calls(
-        db=db,
-        elder_id=elder_id,
-        limit=10
-    )
+    if not elder:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 어르신을 찾을 수 없습니다"
+        )
     
-    # 6. 오늘의 하이라이트 추출
-    today_highlight = get_today_highlight(recent_calls)
+    # 3. 어르신 기본 정보 구성
+    elder_info = await build_elder_basic_info(elder)
     
-    # 7. CallSchedule 조회
-    schedule_result = await db.execute(
-        select(CallSchedule).where(CallSchedule.elder_id == elder_id)
-    )
-    call_schedules = schedule_result.scalars().all()
+    # 4. 오늘의 하이라이트 추출
+    today_highlight = get_today_highlight(recent_calls)
     
-    # 8. 다음 예정 통화 찾기
-    next_scheduled_call = find_next_scheduled_call(call_schedules)
+    # 5. 다음 예정 통화 찾기 (스케줄 변경 시 미리 계산해 둔 주간 offset 사용)
+    next_scheduled_call = find_next_scheduled_call(elder.schedule_offsets)
     
-    # 9. 이번 주 일정 구성 (월~일)
-    this_week_schedule = build_weekly_schedule(call_schedules, week_start)
+    # 6. 이번 주 일정 구성 (월~일)
+    this_week_schedule = build_weekly_schedule(elder.schedule_offsets, week_start)
     
-    # 10. 최종 응답 구성
-    return DashboardResponse(
+    # 7. 최종 응답 구성
+    dashboard = DashboardResponse(
         elder=elder_info,
         today_highlight=today_highlight,
         weekly_stats=weekly_stats,
@@ -101,12 +143,53 @@ async def get_dashboard(
         next_scheduled_call=next_scheduled_call,
         this_week_schedule=this_week_schedule
     )
+    
+    # 8. 직렬화 후 캐시 저장 (자정 / 다음 예정 통화 시각이 지나면 만료)
+    expires_at = dashboard_expires_at(next_scheduled_call.datetime if next_scheduled_call else None)
+    etag = dashboard_etag(elder_id, elder.data_version, expires_at)
+    response = ORJSONResponse(content=dashboard.model_dump(mode="json"), headers={
+        "X-Cache": "MISS", "ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL,
+    })
+    await dashboard_cache.set(elder_id, response.body, generation, expires_at=expires_at, etag=etag)
+    return response
+
+
+@router.get("/users/{user_id}/overview", response_model=GuardianOverviewResponse)
+async def get_user_overview(
+    user_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    보호자의 모든 어르신 요약 조회
+    
+    - **user_id**: 보호자 ID
+    
+    어르신마다 GET /dashboard/{elder_id}를 부르는 대신 한 번에 조회합니다.
+    어르신 수와 상관없이 쿼리 수가 일정합니다.
+    
+    Returns:
+        어르신별 요약 (어르신 ID순):
+        - elder: 어르신 기본 정보 및 서비스 경과일
+        - last_call: 마지막 통화
+        - today: 오늘 통화 상태 (completed / scheduled / missed / none) 및 시도 / 성공 횟수
+        - weekly_stats: 이번 주 통화 통계
+        - next_scheduled_call: 다음 예정 통화
+    """
+    overview = await get_guardian_overview(db, user_id)
+    if overview is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 사용자를 찾을 수 없습니다"
+        )
+    return overview
 
 
 @router.get("/{elder_id}/call-list", response_model=CallListResponse)
 async def get_call_list(
     elder_id: int,
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정하면 cursor 방식으로 조회)"),
+    include_total: bool = Query(False, description="cursor 방식에서 전체 개수(상한까지) 포함 여부"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -114,14 +197,21 @@ async def get_call_list(
     
     - **elder_id**: 어르신 ID
     - **page**: 페이지 번호 (기본값: 1, 최소값: 1)
+    - **cursor**: 다음 페이지 cursor (지정하면 page는 무시)
+    - **include_total**: cursor 방식에서 total 포함 여부 (기본값: False)
+    
+    page 방식은 OFFSET으로 건너뛰므로 뒤 페이지일수록 느려집니다.
+    cursor 방식은 응답의 next_cursor를 그대로 넘기면 페이지 깊이와 상관없이 같은 비용으로 조회합니다.
     
     Returns:
         통화 목록 페이지네이션 응답:
         - items: 통화 항목 리스트 (5개씩)
-        - total: 전체 통화 개수
-        - page: 현재 페이지 번호
+        - total: 전체 통화 개수 (cursor 방식은 include_total일 때만)
+        - page: 현재 페이지 번호 (cursor 방식은 None)
         - page_size: 페이지당 항목 수 (5개 고정)
-        - total_pages: 전체 페이지 수
+        - total_pages: 전체 페이지 수 (cursor 방식은 None)
+        - next_cursor: 다음 페이지 cursor (마지막 페이지면 None)
+        - total_is_approximate: total이 상한까지만 센 값인지 여부
     """
     # 1. 어르신 존재 여부 확인
     result = await db.execute(
@@ -135,9 +225,39 @@ async def get_call_list(
             detail="해당 어르신을 찾을 수 없습니다"
         )
     
-    # 2. 페이지네이션 데이터 조회
     page_size = 5
-    items, total = await get_call_list_paginated(
+    
+    # 2-A. cursor 방식
+    if cursor is not None or include_total:
+        try:
+            items, next_cursor = await get_call_list_by_cursor(
+                db=db,
+                elder_id=elder_id,
+                cursor=cursor,
+                page_size=page_size
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        total, total_is_approximate = None, False
+        if include_total:
+            total, total_is_approximate = await count_calls(db, elder_id, limit=CALL_LIST_COUNT_LIMIT)
+        
+        return CallListResponse(
+            items=items,
+            total=total,
+            page=None,
+            page_size=page_size,
+            total_pages=None,
+            next_cursor=next_cursor,
+            total_is_approximate=total_is_approximate
+        )
+    
+    # 2-B. page 방식
+    items, total, next_cursor = await get_call_list_paginated(
         db=db,
         elder_id=elder_id,
         page=page,
@@ -153,19 +273,272 @@ async def get_call_list(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/{elder_id}/trends", response_model=TrendsResponse)
+async def get_elder_trends(
+    elder_id: int,
+    granularity: Literal["week", "month"] = Query("week", description="집계 구간 (week: 주 단위, month: 월 단위)"),
+    start: date | None = Query(None, description="시작 날짜 (YYYY-MM-DD, 포함)"),
+    end: date | None = Query(None, description="종료 날짜 (YYYY-MM-DD, 포함, 기본값: 오늘)"),
+    top_tags: int = Query(10, ge=1, le=50, description="반환할 태그 수 (기간 전체 언급 수 상위)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    어르신 감정 / 대화 주제 추이 조회
+    
+    - **elder_id**: 어르신 ID
+    - **granularity**: week 또는 month (기본값: week)
+    - **start**, **end**: 조회 기간 (생략하면 오늘이 속한 구간까지 최근 12개 구간, 최대 5년)
+    - **top_tags**: 태그 수 (기본값: 10, 최대 50)
+    
+    일별 집계에서 계산하므로 통화 기록이 많아도 조회 기간의 날짜 수만큼만 읽습니다.
+    
+    Returns:
+        열 단위 배열 응답 (periods와 같은 길이):
+        - periods: 구간 시작 날짜
+        - attempts / completions / avg_duration_minutes: 구간별 통화 시도 / 성공 / 평균 통화 시간(분)
+        - emotions: 감정별 구간 통화 수
+        - tags: 상위 태그별 구간 언급 수
+    """
+    # 1. 조회 기간 결정 / 검증
+    default_start, default_end = default_trend_range(granularity, end)
+    start = start or default_start
+    end = end or default_end
+    
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start는 end보다 늦을 수 없습니다"
+        )
+    if (end - start).days + 1 > TREND_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회 기간은 최대 {TREND_MAX_DAYS}일입니다"
+        )
+    
+    # 2. 어르신 존재 여부 확인
+    result = await db.execute(
+        select(Elder.id).where(Elder.id == elder_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 어르신을 찾을 수 없습니다"
+        )
+    
+    # 3. 추이 계산
+    return await get_trends(db, elder_id, granularity, start, end, top_tags)
+
+
+@router.get("/{elder_id}/export")
+async def export_elder_calls(
+    elder_id: int,
+    format: Literal["csv", "ndjson"] = Query("csv", description="csv: 메시지당 한 행, ndjson: call / message 줄"),
+    start: date | None = Query(None, description="시작 날짜 (YYYY-MM-DD, 포함, 생략하면 처음부터)"),
+    end: date | None = Query(None, description="종료 날짜 (YYYY-MM-DD, 포함, 생략하면 끝까지)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    어르신 통화 기록 + 대화 내용 내보내기 (파일 다운로드)
+    
+    - **elder_id**: 어르신 ID
+    - **format**: csv (기본값) 또는 ndjson
+    - **start**, **end**: 통화 시작 날짜 기준 기간
+    
+    server-side cursor로 읽으면서 바로 보내므로 기록이 많아도 서버 메모리를 일정하게 사용합니다.
+    """
+    # 1. 기간 검증
+    if start and end and start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start는 end보다 늦을 수 없습니다"
+        )
+    
+    # 2. 어르신 존재 여부 확인
+    result = await db.execute(
+        select(Elder.id).where(Elder.id == elder_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 어르신을 찾을 수 없습니다"
+        )
+    
+    # 3. 스트리밍 (get_db 세션을 스트림이 끝날 때까지 잡고 있지 않도록 별도 세션 사용)
+    period = f"_{start or ''}_{end or ''}" if start or end else ""
+    filename = f"elder-{elder_id}-calls{period}.{format}"
+    return StreamingResponse(
+        _stream_export(elder_id, format, start, end),
+        media_type=CallExportService.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+async def _stream_export(elder_id: int, format: str, start: date | None, end: date | None):
+    """내보내기 스트림 (응답을 보내는 동안만 세션 사용)"""
+    async with AsyncSessionLocal() as db:
+        async for chunk in CallExportService.iter_export(db, elder_id, format, start, end):
+            yield chunk
+
+
+@router.get("/{elder_id}/search", response_model=CallSearchResponse)
+async def search_elder_calls(
+    elder_id: int,
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백으로 구분, 모두 포함하는 통화)"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    page_size: int = Query(10, ge=1, le=50, description="페이지당 항목 수"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    어르신 통화 요약 / 대화 내용 검색
+    
+    - **elder_id**: 어르신 ID
+    - **q**: 검색어 (예: "무릎", "병원 예약", 최대 5개)
+    - **page**: 페이지 번호 (기본값: 1)
+    - **page_size**: 페이지당 항목 수 (기본값: 10, 최대 50)
+    
+    통화 저장 시 함께 갱신되는 검색 인덱스를 사용하며, 관련도순으로 정렬합니다.
+    
+    Returns:
+        검색 결과:
+        - items: 통화 정보 + snippet (검색어 주변 대화 내용) + highlights (snippet 안의 검색어 위치)
+        - has_next: 다음 페이지 존재 여부
+    """
+    # 1. 어르신 존재 여부 확인
+    result = await db.execute(
+        select(Elder.id).where(Elder.id == elder_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 어르신을 찾을 수 없습니다"
+        )
+    
+    # 2. 검색
+    try:
+        return await CallSearchService.search_calls(db, elder_id, q, page, page_size)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/{elder_id}/live", response_model=LiveCallResponse)
+async def get_live_call(elder_id: int):
+    """
+    어르신의 실시간 통화 상태 조회
+    
+    - **elder_id**: 어르신 ID
+    
+    status-update / transcript 웹훅으로 메모리에 유지하는 상태만 읽으므로
+    DB를 조회하지 않습니다. 통화가 없으면 빈 calls를 반환합니다.
+    
+    Returns:
+        실시간 통화 상태:
+        - is_on_call: 진행 중인 통화 여부
+        - calls: 진행 중이거나 최근 종료된 통화 (진행 중인 통화 먼저)
+    """
+    states = live_call_store.get_elder_calls(elder_id)
+    
+    return LiveCallResponse(
+        elder_id=elder_id,
+        is_on_call=any(state.ended_at is None for state in states),
+        calls=[state.to_dict() for state in states]
+    )
+
+
+@router.get("/{elder_id}/events")
+async def stream_elder_events(elder_id: int):
+    """
+    어르신 대시보드 실시간 이벤트 (Server-Sent Events)
+    
+    - **elder_id**: 어르신 ID
+    
+    이벤트:
+        - live.snapshot: 연결 직후 현재 실시간 통화 상태 (GET /dashboard/{elder_id}/live와 같은 형태)
+        - call.live: 실시간 통화 상태 변경 / 새 대화 한 줄
+        - call.saved: 통화 기록 저장 완료 (이때 대시보드 데이터를 다시 조회)
+    
+    연결 중에는 DB를 조회하지 않으며, 이벤트가 없으면 keepalive comment만 전송합니다.
+    """
+    # 연결 시 한 번만 확인 (get_db 세션을 스트림이 끝날 때까지 잡고 있지 않도록 바로 닫음)
+    async with AsyncSessionLocal() as db:
+        elder = await ElderService.get_elder_by_id(db, elder_id)
+    
+    if not elder:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 어르신을 찾을 수 없습니다"
+        )
+    
+    return StreamingResponse(
+        stream_events([elder_id], [_live_snapshot_event([elder_id])]),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+@router.get("/guardian/{user_id}/events")
+async def stream_guardian_events(user_id: int):
+    """
+    보호자의 모든 어르신 대시보드 실시간 이벤트 (Server-Sent Events)
+    
+    - **user_id**: 보호자 ID
+    
+    연결 시점의 어르신 목록을 구독합니다 (어르신 추가 후에는 재연결 필요).
+    이벤트 형식은 /dashboard/{elder_id}/events와 같고, data.elder_id로 어르신을 구분합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        elders = await ElderService.get_elders_by_user(db=db, user_id=user_id)
+    
+    if not elders:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="등록된 어르신이 없습니다"
+        )
+    
+    elder_ids = [elder.id for elder in elders]
+    return StreamingResponse(
+        stream_events(elder_ids, [_live_snapshot_event(elder_ids)]),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
     )
 
 
+def _live_snapshot_event(elder_ids: list[int]) -> bytes:
+    """연결 직후 보낼 현재 실시간 통화 상태 이벤트"""
+    calls = [
+        state.to_dict()
+        for elder_id in elder_ids
+        for state in live_call_store.get_elder_calls(elder_id)
+    ]
+    return format_sse(LIVE_SNAPSHOT_EVENT, {"calls": calls})
+
+
 @router.get("/call-detail/{call_id}", response_model=CallDetailResponse)
 async def get_call_detail(
     call_id: int,
+    request: Request,
+    response: Response,
+    message_limit: int | None = Query(
+        None, ge=1, le=TRANSCRIPT_MAX_PAGE_SIZE,
+        description="포함할 메시지 수 (생략하면 전체, 나머지는 messages_next_cursor로 /transcript에서 조회)"
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
     통화 상세 정보 조회 (MVP)
     
     - **call_id**: 통화 ID
+    - **message_limit**: 앞부분 메시지만 포함 (긴 통화의 요약 화면용)
+    
+    응답의 ETag / Last-Modified를 If-None-Match / If-Modified-Since로 보내면
+    대화 내용을 읽기 전에 통화 수정 시각만 확인해서, 바뀌지 않았으면 304 Not Modified를 반환합니다.
     
     Returns:
         통화 상세 정보:
@@ -175,7 +548,28 @@ async def get_call_detail(
         - 키워드 태그 (tags)
         - 대화 전체 로그 (messages)
     """
-    # 1. Call과 관련 데이터 조회
+    # 1. 조건부 요청 확인 (대화 내용 조회 전, If-None-Match가 있으면 If-Modified-Since는 무시)
+    validators = await get_call_validators(db, call_id)
+    if validators is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 통화를 찾을 수 없습니다"
+        )
+    updated_at, validator_elder_name = validators
+    headers = {
+        "ETag": call_detail_etag(call_id, updated_at, validator_elder_name),
+        "Last-Modified": http_date(updated_at),
+        "Cache-Control": REVALIDATE_CACHE_CONTROL,
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if etag_matches(if_none_match, headers["ETag"]):
+            return not_modified_response(headers)
+    elif not_modified_since(request.headers.get("if-modified-since"), updated_at):
+        return not_modified_response(headers)
+    response.headers.update(headers)
+    
+    # 2. Call과 관련 데이터 조회
     call, elder_name = await get_call_detail_by_id(db, call_id)
     
     if not call:
@@ -184,35 +578,23 @@ async def get_call_detail(
             detail="해당 통화를 찾을 수 없습니다"
         )
     
-    # 2. 날짜/시간 포맷팅
+    # 3. 날짜/시간 포맷팅
     # 날짜: "2023년 10월 27일"
     date_str = call.started_at.strftime("%Y년 %m월 %d일")
     # 시간: "10:30 AM"
     time_str = call.started_at.strftime("%I:%M %p")
     
-    # 3. 통화 시간 계산 (분:초)
-    if call.ended_at:
-        duration_seconds = int((call.ended_at - call.started_at).total_seconds())
-        minutes = duration_seconds // 60
-        seconds = duration_seconds % 60
-        duration_str = f"{minutes}분 {seconds}초"
-    else:
-        duration_str = "0분 0초"
+    # 4. 통화 시간 계산 (분:초)
+    duration_seconds = int(call.duration_seconds or 0)
+    duration_str = f"{duration_seconds // 60}분 {duration_seconds % 60}초"
     
-    # 4. tags가 None이면 빈 리스트
+    # 5. tags가 None이면 빈 리스트
     tags = call.tags if call.tags else []
     
-    # 5. CallMessage를 CallMessageItem으로 변환
-    message_items = [
-        CallMessageItem(
-            role=msg.role,
-            message=msg.message,
-            timestamp=msg.timestamp
-        )
-        for msg in sorted(call.messages, key=lambda m: m.timestamp)
-    ]
+    # 6. 대화 내용 조회 (DB에서 시간순 정렬, message_limit개까지)
+    message_items, messages_next_cursor = await get_transcript_page(db, call_id, limit=message_limit)
     
-    # 6. 응답 반환
+    # 7. 응답 반환
     return CallDetailResponse(
         id=call.id,
         elder_name=elder_name,
@@ -223,6 +605,66 @@ async def get_call_detail(
         emotion=call.emotion,
         summary=call.summary,
         tags=tags,
-        messages=message_items
+        messages=message_items,
+        messages_next_cursor=messages_next_cursor
     )
 
+
+@router.get("/call-detail/{call_id}/transcript", response_model=TranscriptPageResponse)
+async def get_call_transcript(
+    call_id: int,
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor / messages_next_cursor"),
+    limit: int = Query(TRANSCRIPT_PAGE_SIZE, ge=1, le=TRANSCRIPT_MAX_PAGE_SIZE, description="페이지당 메시지 수"),
+    format: Literal["json", "ndjson"] = Query("json", description="json: 한 페이지, ndjson: cursor 이후 전체를 스트리밍"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    통화 대화 내용 조회 (시간순)
+    
+    - **call_id**: 통화 ID
+    - **cursor**: 이 cursor 다음 메시지부터 (생략하면 처음부터)
+    - **limit**: 페이지당 메시지 수 (기본값: 100, 최대 500, json만)
+    - **format**: json (기본값) 또는 ndjson
+    
+    ndjson은 메시지 한 개를 한 줄({"role", "message", "timestamp"})로 끝까지 스트리밍하므로
+    긴 통화도 서버 메모리를 일정하게 사용합니다.
+    
+    Returns:
+        json: items (메시지) + next_cursor (마지막 페이지면 None)
+    """
+    # 1. 통화 존재 여부 확인
+    result = await db.execute(
+        select(Call.id).where(Call.id == call_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 통화를 찾을 수 없습니다"
+        )
+    
+    # 2. NDJSON 스트리밍 (get_db 세션을 스트림이 끝날 때까지 잡고 있지 않도록 별도 세션 사용)
+    if format == "ndjson":
+        try:
+            if cursor:
+                decode_call_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return StreamingResponse(_stream_transcript(call_id, cursor), media_type="application/x-ndjson")
+    
+    # 3. 한 페이지 조회
+    try:
+        items, next_cursor = await get_transcript_page(db, call_id, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return TranscriptPageResponse(call_id=call_id, items=items, next_cursor=next_cursor)
+
+
+async def _stream_transcript(call_id: int, cursor: str | None):
+    """NDJSON 스트림 (응답을 보내는 동안만 세션 사용)"""
+    async with AsyncSessionLocal() as db:
+        async for line in iter_transcript_ndjson(db, call_id, cursor):
+            yield line
+
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
+from app.core.responses import ORJSONResponse
 from app.schemas.elder import VerifyInviteCodeRequest, VerifyInviteCodeResponse
 from app.services.elder import ElderService
 from app.services.call import CallService
@@ -100,7 +101,7 @@ async def get_assistant_config(
         # CallService를 통해 assistant config 생성
         assistant_config = await CallService.get_assistant_config(elder)
         
-        return assistant_config
+        return ORJSONResponse(assistant_config)
         
     except HTTPException:
         raise
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from app.core.config import get_settings
+from app.services.dashboard_cache import dashboard_cache
 
 router = APIRouter(tags=["health"])
 
@@ -26,3 +27,12 @@ def health_check():
         "bundle_id": settings.BUNDLE_ID,
     }
 
+
+@router.get("/health/dashboard-cache")
+def dashboard_cache_stats():
+    """
+    대시보드 응답 캐시 통계
+    
+    hit / miss 수와 hit rate, invalidate 수 등을 반환합니다. (이 프로세스 기준)
+    """
+    return dashboard_cache.stats()
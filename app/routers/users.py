@@ -0,0 +1,63 @@
+"""보호자 설정 API 라우터"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.db.models.user import User
+from app.schemas.user import ReportSettingsUpdate, ReportSettingsResponse
+from app.services.digest import DigestService
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+async def _get_user_or_404(db: AsyncSession, user_id: int) -> User:
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 사용자를 찾을 수 없습니다"
+        )
+    return user
+
+
+@router.get("/{user_id}/report-settings", response_model=ReportSettingsResponse)
+async def get_report_settings(
+    user_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    통화 리포트 이메일 수신 방식 조회
+    
+    - **user_id**: 사용자 ID
+    """
+    user = await _get_user_or_404(db, user_id)
+    return ReportSettingsResponse(
+        mode=user.report_email_mode,
+        digest_interval_hours=user.digest_interval_hours
+    )
+
+
+@router.put("/{user_id}/report-settings", response_model=ReportSettingsResponse)
+async def update_report_settings(
+    user_id: int,
+    req: ReportSettingsUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    통화 리포트 이메일 수신 방식 변경
+    
+    - **user_id**: 사용자 ID
+    - **mode**: instant (통화마다 이메일) 또는 digest (digest_interval_hours마다 모아서 한 통)
+    - **digest_interval_hours**: digest 발송 주기 (1~168시간, 생략하면 기존 값 유지)
+    """
+    user = await _get_user_or_404(db, user_id)
+    user = await DigestService.update_report_settings(
+        db,
+        user,
+        mode=req.mode,
+        digest_interval_hours=req.digest_interval_hours
+    )
+    return ReportSettingsResponse(
+        mode=user.report_email_mode,
+        digest_interval_hours=user.digest_interval_hours
+    )
@@ -1,12 +1,20 @@
-import json
 from datetime import datetime
 from pathlib import Path
 from fastapi import APIRouter, Request, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import get_settings
 from app.db.session import get_db
 from app.services.call import CallService
+from app.services.live_call import live_call_store
+from app.services.webhook_parser import (
+    load_webhook_body,
+    iter_report_messages,
+    project_body,
+    write_projected_archive,
+)
 
 router = APIRouter(prefix="/vapi", tags=["webhook"])
+settings = get_settings()
 
 # 로그 디렉토리 설정
 WEBHOOK_LOG_DIR = Path(__file__).parent.parent.parent / "data" / "webhook_logs"
@@ -24,23 +32,41 @@ async def vapi_webhook(request: Request, db: AsyncSession = Depends(get_db)):
     - end-of-call-report: 통화 종료 시 전체 트랜스크립트
     
     모든 웹훅은 server/data/webhook_logs/ 디렉토리에 JSON 파일로 저장됩니다.
+    (JSON 객체가 아닌 body는 {timestamp}_invalid.json으로 원본 그대로 보관하고 ok=False 반환)
+    body는 수신하는 즉시 파일로 기록하고, 큰 end-of-call-report는 필요한 필드만
+    스트리밍으로 파싱하여 메모리 사용량을 제한합니다.
+    
+    end-of-call-report는 WEBHOOK_ARCHIVE_MODE=projected(기본값)일 때 저장에 필요한 필드
+    + 화이트리스트만 compact JSON으로 보관합니다 (저장 실패 시에는 원본 전체 보관).
     """
-    body = await request.json()
+    # 타임스탬프 생성
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    
+    # body를 메모리에 모으지 않고 바로 임시 파일로 저장 (긴 통화는 수 MB, 보관은 처리 후)
+    part_path = WEBHOOK_LOG_DIR / f"{timestamp}.json.part"
+    with open(part_path, "wb") as f:
+        async for chunk in request.stream():
+            f.write(chunk)
+    
+    # 필요한 필드만 파싱 (큰 body는 스트리밍)
+    try:
+        body = load_webhook_body(part_path, settings.webhook_archive_extra_fields)
+    except ValueError as e:
+        # 잘못된 / 잘린 body는 원본 그대로 보관 (replay 대상인 *_<type>.json과 구분)
+        log_filename = f"{timestamp}_invalid.json"
+        part_path.rename(WEBHOOK_LOG_DIR / log_filename)
+        print(f"⚠️ Invalid webhook body: {e}")
+        print(f"🗄️ Archived (full): {log_filename}")
+        return {"ok": False, "logged": log_filename}
     
     # 이벤트 타입 추출
     message = body.get("message", {})
     message_type = message.get("type", "unknown")
     
-    # 타임스탬프 생성
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    
     # 로그 파일명 생성
     log_filename = f"{timestamp}_{message_type}.json"
     log_path = WEBHOOK_LOG_DIR / log_filename
-    
-    # 로그 파일 저장
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(body, f, indent=2, ensure_ascii=False)
+    ingest_failed = False
     
     # 콘솔 출력
     print(f"\n{'='*60}")
@@ -55,12 +81,22 @@ async def vapi_webhook(request: Request, db: AsyncSession = Depends(get_db)):
         call_id = message.get("call", {}).get("id") or body.get("call", {}).get("id")
         print(f"📞 Call ID: {call_id}")
         print(f"📊 Status: {status}")
+        
+        # 실시간 통화 상태 갱신
+        if call_id and status:
+            live_call_store.update_status(call_id, _extract_live_elder_id(message), status)
     
     elif message_type == "transcript":
         role = message.get("role")
-        transcript_text = message.get("transcript", {}).get("text") or message.get("text", "")
+        transcript = message.get("transcript")
+        transcript_text = (transcript.get("text") if isinstance(transcript, dict) else transcript) or message.get("text", "")
         print(f"🗣️ Role: {role}")
         print(f"💬 Text: {transcript_text[:100]}..." if len(transcript_text) > 100 else transcript_text)
+        
+        # 실시간 통화 상태에 최종 인식 결과만 추가 (partial은 같은 발화가 여러 번 옴)
+        call_id = message.get("call", {}).get("id") or body.get("call", {}).get("id")
+        if call_id and transcript_text and message.get("transcriptType", "final") == "final":
+            live_call_store.add_transcript(call_id, _extract_live_elder_id(message), role, transcript_text)
     
     elif message_type == "end-of-call-report":
         call_id = message.get("call", {}).get("id") or body.get("call", {}).get("id")
@@ -68,32 +104,36 @@ async def vapi_webhook(request: Request, db: AsyncSession = Depends(get_db)):
         print(f"📞 Call ID: {call_id}")
         print(f"⏱️ Duration: {duration}s")
         
-        # transcript 확인
+        # 실시간 통화 상태 종료 처리
+        if call_id:
+            live_call_store.mark_ended(call_id, _extract_live_elder_id(message))
+        
+        # transcript 확인 (큰 body는 저장에 쓰지 않는 transcript를 파싱하지 않음)
         transcript = message.get("transcript")
         if transcript:
             print(f"📝 Transcript length: {len(str(transcript))} chars")
-        else:
-            print("⚠️ No transcript found")
         
         # DB에 저장 시도
         print(f"\n💾 Saving to database...")
         try:
-            saved_call = await CallService.save_call_from_webhook(db, body)
+            # 큰 body는 messages를 파일에서 한 건씩 읽어서 저장
+            messages = message.get("messages")
+            if messages is None:
+                messages = iter_report_messages(part_path)
             
-            # messages 카운트는 body에서 직접 계산 (lazy load 방지)
-            messages = body.get("message", {}).get("messages", [])
-            user_bot_messages = [m for m in messages if m.get("role") in ["user", "bot"]]
+            saved_call = await CallService.save_call_from_webhook(db, body, messages)
             
             print(f"✅ Successfully saved to DB!")
             print(f"   - Call ID (DB): {saved_call.id}")
             print(f"   - Vapi Call ID: {saved_call.vapi_call_id}")
             print(f"   - Elder ID: {saved_call.elder_id}")
             print(f"   - Status: {saved_call.status}")
-            print(f"   - Messages count: {len(user_bot_messages)}")
         except ValueError as e:
+            ingest_failed = True
             print(f"⚠️ Validation error: {e}")
             print(f"   Call not saved to DB (missing elder_id or invalid data)")
         except Exception as e:
+            ingest_failed = True
             print(f"❌ Error saving to DB: {e}")
             print(f"   Call logged to file but not saved to DB")
             # DB 에러 시 rollback
@@ -103,8 +143,62 @@ async def vapi_webhook(request: Request, db: AsyncSession = Depends(get_db)):
         print(f"ℹ️ Unknown message type: {message_type}")
         print(f"📄 Full payload keys: {list(body.keys())}")
     
+    # 로그 파일 보관
+    archive_mode = _archive_webhook(part_path, log_path, message_type, body, ingest_failed)
+    print(f"🗄️ Archived ({archive_mode}): {log_filename}")
+    
     print(f"{'='*60}\n")
     
     # Vapi는 200 OK만 받으면 됨 (에러 발생해도 200 반환)
     return {"ok": True, "logged": log_filename}
 
+
+def _extract_live_elder_id(message: dict) -> int | None:
+    """실시간 통화 상태용 elder_id 추출 (metadata에 없으면 None)"""
+    try:
+        return CallService.extract_elder_id(message.get("call", {}))
+    except ValueError:
+        return None
+
+
+def _archive_webhook(
+    part_path: Path,
+    log_path: Path,
+    message_type: str,
+    body: dict,
+    ingest_failed: bool
+) -> str:
+    """
+    수신한 웹훅 body를 로그 파일로 보관
+    
+    - end-of-call-report가 아니거나 WEBHOOK_ARCHIVE_MODE=full이면 원본 그대로 보관
+    - 저장에 실패했고 WEBHOOK_ARCHIVE_FULL_ON_FAILURE=True이면 원본 그대로 보관
+    - 그 외에는 저장에 필요한 필드 + 화이트리스트만 compact JSON으로 보관
+    
+    Args:
+        part_path: 수신한 원본 body 파일
+        log_path: 보관할 로그 파일 경로
+        message_type: 웹훅 이벤트 타입
+        body: 파싱된 body (큰 body는 필요한 필드만 포함)
+        ingest_failed: DB 저장 실패 여부
+    
+    Returns:
+        보관 방식 ("full" 또는 "projected")
+    """
+    keep_full = (
+        message_type != "end-of-call-report"
+        or settings.WEBHOOK_ARCHIVE_MODE == "full"
+        or (ingest_failed and settings.WEBHOOK_ARCHIVE_FULL_ON_FAILURE)
+    )
+    if keep_full:
+        part_path.rename(log_path)
+        return "full"
+    
+    projected = project_body(body, settings.webhook_archive_extra_fields)
+    messages = body.get("message", {}).get("messages")
+    if messages is None:
+        messages = iter_report_messages(part_path)
+    
+    write_projected_archive(log_path, projected, messages)
+    part_path.unlink()
+    return "projected"
@@ -1,14 +1,19 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
 from app.services.call_schedule import CallScheduleService
 from app.services.call import CallService
+from app.services.email_outbox import EmailOutboxService
+from app.services.digest import DigestService
+from app.core.config import get_settings
 from app.db.session import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # 스케줄러 인스턴스
 scheduler = AsyncIOScheduler()
@@ -71,6 +76,44 @@ async def initiate_call(elder_id: int):
             raise
 
 
+async def deliver_email_outbox():
+    """
+    EMAIL_OUTBOX_INTERVAL_SECONDS마다 실행
+    
+    발송 시각이 된 이메일 대기열을 batch 단위로 모두 발송
+    """
+    try:
+        while True:
+            async with AsyncSessionLocal() as db:
+                counts = await EmailOutboxService.deliver_due(db)
+            
+            if counts["claimed"]:
+                logger.info(f"Email outbox delivered: {counts}")
+                print(f"📧 Email outbox: {counts}")
+            
+            # 마지막 batch였으면 종료
+            if counts["claimed"] < settings.EMAIL_OUTBOX_BATCH_SIZE:
+                break
+    except Exception as e:
+        logger.error(f"Error in deliver_email_outbox: {str(e)}", exc_info=True)
+
+
+async def build_call_digests():
+    """
+    매 시간 5분에 실행
+    
+    발송 주기가 된 digest 모드 보호자들의 통화 리포트 digest를 이메일 대기열에 추가
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            counts = await DigestService.build_due_digests(db)
+        
+        logger.info(f"Call digests built: {counts}")
+        print(f"📧 Call digests: {counts}")
+    except Exception as e:
+        logger.error(f"Error in build_call_digests: {str(e)}", exc_info=True)
+
+
 def start_scheduler():
     """
     스케줄러 시작
@@ -86,6 +129,25 @@ def start_scheduler():
             replace_existing=True
         )
         
+        scheduler.add_job(
+            build_call_digests,
+            trigger=CronTrigger(minute=5), # every hour
+            misfire_grace_time=599,
+            id="build_call_digests",
+            name="Build guardian call report digests",
+            replace_existing=True
+        )
+        
+        scheduler.add_job(
+            deliver_email_outbox,
+            trigger=IntervalTrigger(seconds=settings.EMAIL_OUTBOX_INTERVAL_SECONDS),
+            max_instances=1,
+            coalesce=True,
+            id="deliver_email_outbox",
+            name="Deliver pending emails in the outbox",
+            replace_existing=True
+        )
+        
         # 스케줄러 시작
         scheduler.start()
         logger.info("Scheduler started successfully")
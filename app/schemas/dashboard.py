@@ -1,5 +1,6 @@
 """대시보드 API 응답 스키마"""
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 from pydantic import BaseModel, Field
 
 
@@ -100,13 +101,51 @@ class DashboardResponse(BaseModel):
         from_attributes = True
 
 
+class TodayStatus(BaseModel):
+    """오늘 통화 상태 (보호자 전체 어르신 요약용)"""
+    status: str  # completed (통화 완료), scheduled (오늘 남은 예정 통화 있음), missed (시도했지만 연결 안 됨), none
+    call_attempts: int
+    call_success_count: int
+    
+    class Config:
+        from_attributes = True
+
+
+class ElderOverviewItem(BaseModel):
+    """보호자 전체 어르신 요약의 어르신 한 명"""
+    elder: ElderBasicInfo
+    last_call: RecentCallItem | None
+    today: TodayStatus
+    weekly_stats: WeeklyStats
+    next_scheduled_call: NextScheduledCall | None
+    
+    class Config:
+        from_attributes = True
+
+
+class GuardianOverviewResponse(BaseModel):
+    """보호자 전체 어르신 요약 응답"""
+    user_id: int
+    elders: list[ElderOverviewItem]  # 어르신 ID순
+    
+    class Config:
+        from_attributes = True
+
+
 class CallListResponse(BaseModel):
-    """통화 목록 페이지네이션 응답"""
+    """
+    통화 목록 페이지네이션 응답
+    
+    page 방식은 total / page / total_pages가 항상 채워지고,
+    cursor 방식은 page / total_pages가 None이며 total은 include_total을 요청했을 때만 채워집니다.
+    """
     items: list[RecentCallItem]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None  # 다음 페이지 조회용 cursor (마지막 페이지면 None)
+    total_is_approximate: bool = False  # True면 total은 상한까지만 센 값 (실제 개수는 그 이상)
     
     class Config:
         from_attributes = True
@@ -134,7 +173,83 @@ class CallDetailResponse(BaseModel):
     summary: str | None
     tags: list[str]
     messages: list[CallMessageItem]
+    messages_next_cursor: str | None = None  # message_limit으로 잘린 경우 나머지 대화 내용 조회용 cursor
+    
+    class Config:
+        from_attributes = True
+
+
+class TranscriptPageResponse(BaseModel):
+    """통화 대화 내용 페이지 (시간순)"""
+    call_id: int
+    items: list[CallMessageItem]
+    next_cursor: str | None  # 다음 페이지 조회용 cursor (마지막 페이지면 None)
     
     class Config:
         from_attributes = True
 
+
+class LiveTranscriptLine(BaseModel):
+    """실시간 대화 한 줄"""
+    role: str  # user, assistant
+    message: str
+    timestamp: datetime
+
+
+class LiveCallItem(BaseModel):
+    """실시간 통화 상태"""
+    vapi_call_id: str
+    status: str  # queued, ringing, in-progress, ended 등 (Vapi status)
+    is_active: bool
+    started_at: datetime
+    updated_at: datetime
+    ended_at: datetime | None
+    recent_transcript: list[LiveTranscriptLine]
+
+
+class LiveCallResponse(BaseModel):
+    """어르신 실시간 통화 상태 응답"""
+    elder_id: int
+    is_on_call: bool
+    calls: list[LiveCallItem]
+
+
+class TrendsResponse(BaseModel):
+    """
+    어르신 감정 / 대화 주제 추이 응답 (차트용 열 단위 배열)
+    
+    periods[i]는 i번째 구간(주: 월요일, 월: 1일)의 시작 날짜이고,
+    다른 배열과 emotions / tags의 각 배열의 i번째 값이 그 구간의 값입니다.
+    첫 / 마지막 구간은 start ~ end 안의 날짜만 집계합니다.
+    """
+    elder_id: int
+    granularity: Literal["week", "month"]
+    start: date
+    end: date  # 포함
+    periods: list[date]
+    attempts: list[int]
+    completions: list[int]
+    avg_duration_minutes: list[int]
+    emotions: dict[str, list[int]]  # 감정별 구간 통화 수 (전체 합계 내림차순)
+    tags: dict[str, list[int]]  # 전체 기간 상위 태그의 구간별 언급 수 (전체 합계 내림차순)
+
+
+class CallSearchItem(BaseModel):
+    """통화 검색 결과 항목"""
+    id: int
+    date: str  # "2025.01.19" 형식
+    time: str  # "10:30" 형식
+    summary: str
+    emotion: str | None
+    tags: list[str]
+    snippet: str  # 검색어 주변 대화 내용 (없으면 요약)
+    highlights: list[tuple[int, int]]  # snippet 안의 검색어 위치 [start, end)
+
+
+class CallSearchResponse(BaseModel):
+    """통화 검색 응답 (관련도순)"""
+    query: str
+    items: list[CallSearchItem]
+    page: int
+    page_size: int
+    has_next: bool
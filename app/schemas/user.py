@@ -0,0 +1,26 @@
+"""보호자 설정 관련 Pydantic 스키마"""
+from typing import Literal
+from pydantic import BaseModel, Field
+
+
+class ReportSettingsUpdate(BaseModel):
+    """통화 리포트 이메일 수신 방식 변경 요청"""
+    mode: Literal["instant", "digest"]  # instant: 통화마다 / digest: 모아서
+    digest_interval_hours: int | None = Field(None, ge=1, le=168)  # digest 발송 주기 (24 = 하루 1회, 없으면 기존 값 유지)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "mode": "digest",
+                "digest_interval_hours": 24
+            }
+        }
+
+
+class ReportSettingsResponse(BaseModel):
+    """통화 리포트 이메일 수신 방식"""
+    mode: str
+    digest_interval_hours: int
+    
+    class Config:
+        from_attributes = True
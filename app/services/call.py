@@ -1,14 +1,27 @@
+import asyncio
+import weakref
 from datetime import datetime
+from typing import Iterable, Iterator
+from sqlalchemy import select, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.elder import ElderService
+from app.services.daily_stats import DailyStatsService
+from app.services.search import CallSearchService
 from app.services.apns import APNsService
-from app.services.email import send_call_report_email
+from app.services.email_outbox import EmailOutboxService
+from app.services.dashboard_events import dashboard_event_broker, CALL_SAVED_EVENT
+from app.services.dashboard_cache import dashboard_cache, bump_dashboard_versions
 from app.db.models.elder import Elder
 from app.db.models.user import User
 from app.db.models.call import Call
 from app.db.models.call_message import CallMessage
 from app.core.config import get_settings
 
+# vapi_call_id별 lock (같은 통화의 동시 웹훅 재전송 직렬화, 사용이 끝나면 자동 정리)
+_call_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
 
 class CallService:
 
@@ -24,6 +37,7 @@ class CallService:
 
     MAX_CALL_DURATION_SECONDS = 1200  # 20 minutes
     ANALYSIS_TIMEOUT_SECONDS = 30
+    MESSAGE_INSERT_BATCH_SIZE = 500
 
     @staticmethod
     async def initiate_call(db: AsyncSession, elder_id: int):
@@ -236,25 +250,92 @@ class CallService:
         }
     
     @staticmethod
-    async def save_call_from_webhook(db: AsyncSession, webhook_data: dict) -> Call:
+    def _dialect_insert(db: AsyncSession, table):
+        """
+        DB 방언별 INSERT 구문 생성 (ON CONFLICT 지원용)
+
+        SQLite / PostgreSQL은 on_conflict_do_nothing을 지원하는 전용 insert를,
+        그 외 방언은 일반 insert를 반환합니다.
+        """
+        dialect_name = db.bind.dialect.name
+        if dialect_name == "sqlite":
+            return sqlite_insert(table)
+        if dialect_name == "postgresql":
+            return postgresql_insert(table)
+        return insert(table)
+
+    @staticmethod
+    async def _get_call_by_vapi_id(db: AsyncSession, vapi_call_id: str) -> Call | None:
+        """vapi_call_id로 이미 저장된 통화 조회"""
+        result = await db.execute(
+            select(Call).where(Call.vapi_call_id == vapi_call_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def save_call_from_webhook(
+        db: AsyncSession,
+        webhook_data: dict,
+        messages: Iterable[dict] | None = None
+    ) -> Call:
         """
         end-of-call-report 웹훅 데이터를 파싱하여 DB에 저장
         
+        Vapi는 웹훅을 재전송하므로 vapi_call_id 기준으로 멱등하게 동작합니다.
+        - 같은 vapi_call_id의 동시 요청은 프로세스 내 lock으로 직렬화
+        - 이미 저장된 통화는 파싱 없이 기존 Call을 그대로 반환 (이메일 재발송 없음)
+        - 다른 프로세스와의 경합은 INSERT ... ON CONFLICT DO NOTHING으로 처리
+        
         Args:
             db: 데이터베이스 세션
             webhook_data: Vapi 웹훅 전체 데이터
+            messages: message.messages 항목 (None이면 webhook_data에서 읽음)
+                대용량 body는 스트리밍 파서의 lazy iterator를 전달
             
         Returns:
-            생성된 Call 객체
+            생성된 (또는 이미 저장되어 있던) Call 객체
             
         Raises:
             ValueError: elder_id가 없거나, Elder가 존재하지 않을 경우
         """
         message = webhook_data.get("message", {})
-        
-        # 1. elder_id 추출 및 검증
         call_data = message.get("call", {})
+        vapi_call_id = call_data.get("id")
+        
+        if messages is None:
+            messages = message.get("messages", [])
+        
+        if not vapi_call_id:
+            return await CallService._save_call(db, message, messages)
+        
+        # 같은 통화에 대한 동시 재전송은 순서대로 처리
+        lock = _call_locks.get(vapi_call_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            _call_locks[vapi_call_id] = lock
         
+        async with lock:
+            existing_call = await CallService._get_call_by_vapi_id(db, vapi_call_id)
+            if existing_call:
+                print(f"♻️ 이미 저장된 통화입니다. 재전송 무시 (vapi_call_id: {vapi_call_id}, call_id: {existing_call.id})")
+                return existing_call
+            
+            return await CallService._save_call(db, message, messages)
+
+    @staticmethod
+    def extract_elder_id(call_data: dict) -> int:
+        """
+        웹훅 call 객체의 metadata에서 elder_id 추출
+        
+        Args:
+            call_data: 웹훅 message의 call 객체
+            
+        Returns:
+            elder_id
+            
+        Raises:
+            ValueError: elder_id가 없거나 유효하지 않을 경우
+        """
         # assistantOverrides.metadata에서 먼저 찾고, 없으면 metadata에서 찾기
         # iOS에서 assistantOverrides로 전달하면 call.assistantOverrides.metadata에 저장됨
         assistant_overrides = call_data.get("assistantOverrides", {})
@@ -263,12 +344,8 @@ class CallService:
         # assistantOverrides에 없으면 call.metadata에서 찾기 (fallback)
         if not metadata:
             metadata = call_data.get("metadata", {})
-            print("📍 metadata 위치: call.metadata")
-        else:
-            print("📍 metadata 위치: call.assistantOverrides.metadata")
         
         elder_id_str = metadata.get("elder_id")
-        print(f"🔍 추출된 elder_id: {elder_id_str}")
         
         if not elder_id_str:
             raise ValueError("metadata에 elder_id가 없습니다. (assistantOverrides.metadata 또는 metadata 확인)")
@@ -278,12 +355,29 @@ class CallService:
         except (ValueError, TypeError):
             raise ValueError(f"elder_id가 유효하지 않습니다: {elder_id_str}")
         
-        # 2. Elder 존재 여부 확인
-        elder = await ElderService.get_elder_by_id(db, elder_id)
-        if not elder:
-            raise ValueError(f"존재하지 않는 어르신입니다. (elder_id: {elder_id})")
+        return elder_id
+    
+    @staticmethod
+    def parse_call_report(message: dict) -> dict:
+        """
+        end-of-call-report message에서 Call 컬럼 값 추출 (DB 접근 없음)
         
-        # 3. 통화 기본 정보 추출
+        웹훅 저장과 웹훅 로그 backfill이 같은 파싱 로직을 사용합니다.
+        
+        Args:
+            message: 웹훅 body의 message 객체
+            
+        Returns:
+            Call 컬럼 값 딕셔너리 (user_id 제외)
+            
+        Raises:
+            ValueError: elder_id가 없거나 유효하지 않을 경우
+        """
+        # 1. elder_id 추출 및 검증
+        call_data = message.get("call", {})
+        elder_id = CallService.extract_elder_id(call_data)
+        
+        # 2. 통화 기본 정보 추출
         vapi_call_id = call_data.get("id")
         started_at_str = message.get("startedAt")
         ended_at_str = message.get("endedAt")
@@ -292,6 +386,11 @@ class CallService:
         # ISO 8601 문자열을 datetime으로 변환
         started_at = datetime.fromisoformat(started_at_str.replace("Z", "+00:00")) if started_at_str else datetime.now()
         ended_at = datetime.fromisoformat(ended_at_str.replace("Z", "+00:00")) if ended_at_str else None
+        duration_seconds = CallService.parse_duration_seconds(
+            message.get("durationSeconds"),
+            started_at if started_at_str else None,
+            ended_at
+        )
         
         # endedReason을 status로 매핑
         if ended_reason in ["customer-ended-call", "assistant-ended-call"]:
@@ -299,35 +398,59 @@ class CallService:
         else:
             status = "failed"
         
-        # 4. Vapi 분석 결과 추출
+        # 3. Vapi 분석 결과 추출
         # analysis 객체에서 summary와 structuredData 추출
         analysis = message.get("analysis", {})
         summary = analysis.get("summary", "")
         
         # structuredData에서 emotion과 tags 추출
         structured_data = analysis.get("structuredData") or {}
-        emotion = structured_data.get("emotion")
-        tags = structured_data.get("tags")
         
-        # 5. Call 레코드 생성
-        new_call = Call(
-            vapi_call_id=vapi_call_id,
-            elder_id=elder_id,
-            user_id=elder.user_id,  # ✨ 추가 - Elder에서 보호자 ID 가져오기
-            started_at=started_at,
-            ended_at=ended_at,
-            status=status,
-            summary=summary,
-            emotion=emotion,
-            tags=tags
-        )
+        return {
+            "vapi_call_id": vapi_call_id,
+            "elder_id": elder_id,
+            "started_at": started_at,
+            "ended_at": ended_at,
+            "duration_seconds": duration_seconds,
+            "status": status,
+            "summary": summary,
+            "emotion": structured_data.get("emotion"),
+            "tags": structured_data.get("tags"),
+        }
+    
+    @staticmethod
+    def parse_duration_seconds(duration, started_at: datetime | None, ended_at: datetime | None) -> float | None:
+        """
+        통화 시간(초) 결정
         
-        db.add(new_call)
-        await db.flush()  # call.id 생성을 위해 flush
+        Vapi가 보낸 durationSeconds를 그대로 쓰고, 없거나 숫자가 아니면 endedAt - startedAt으로 계산합니다.
         
-        # 6. CallMessage 레코드들 생성
-        messages = message.get("messages", [])
+        Args:
+            duration: message.durationSeconds 값
+            started_at: 통화 시작 시각 (startedAt이 없으면 None)
+            ended_at: 통화 종료 시각 (endedAt이 없으면 None)
+            
+        Returns:
+            초 단위 통화 시간 (둘 다 없으면 None)
+        """
+        if isinstance(duration, (int, float)) and not isinstance(duration, bool) and duration >= 0:
+            return float(duration)
+        if started_at is not None and ended_at is not None:
+            return max(0.0, (ended_at - started_at).total_seconds())
+        return None
+    
+    @staticmethod
+    def parse_call_messages(messages: Iterable[dict], started_at: datetime) -> Iterator[dict]:
+        """
+        Vapi 메시지 항목을 CallMessage 컬럼 값으로 변환 (call_id 제외)
         
+        Args:
+            messages: message.messages 항목
+            started_at: 통화 시작 시각 (메시지 time이 없을 때 사용)
+            
+        Yields:
+            {"role", "message", "timestamp"} 딕셔너리
+        """
         for msg in messages:
             msg_role = msg.get("role")
             
@@ -335,10 +458,6 @@ class CallService:
             if msg_role not in ["user", "bot"]:
                 continue
             
-            # role 매핑: bot → assistant
-            role = "user" if msg_role == "user" else "assistant"
-            message_text = msg.get("message", "")
-            
             # timestamp: 밀리초 단위 Unix timestamp를 datetime으로 변환
             time_ms = msg.get("time")
             if time_ms:
@@ -346,41 +465,218 @@ class CallService:
             else:
                 timestamp = started_at
             
-            call_message = CallMessage(
-                call_id=new_call.id,
-                role=role,
-                message=message_text,
-                timestamp=timestamp
-            )
+            yield {
+                # role 매핑: bot → assistant
+                "role": "user" if msg_role == "user" else "assistant",
+                "message": msg.get("message", ""),
+                "timestamp": timestamp,
+            }
+    
+    @staticmethod
+    async def _insert_call_messages(db: AsyncSession, rows: Iterable[dict]) -> int:
+        """CallMessage 행(call_id 포함)을 MESSAGE_INSERT_BATCH_SIZE개씩 bulk insert하고 저장 개수 반환"""
+        batch = []
+        count = 0
+        
+        for row in rows:
+            batch.append(row)
+            
+            if len(batch) >= CallService.MESSAGE_INSERT_BATCH_SIZE:
+                await db.execute(insert(CallMessage), batch)
+                count += len(batch)
+                batch = []
+        
+        if batch:
+            await db.execute(insert(CallMessage), batch)
+            count += len(batch)
+        
+        return count
+
+    @staticmethod
+    async def _save_call(db: AsyncSession, message: dict, messages: Iterable[dict]) -> Call:
+        """
+        end-of-call-report message를 파싱하여 Call / CallMessage / 이메일 발송 대기열 저장
+        
+        Args:
+            db: 데이터베이스 세션
+            message: 웹훅 body의 message 객체
+            messages: Vapi 메시지 항목 (MESSAGE_INSERT_BATCH_SIZE개씩 나눠서 insert)
             
-            db.add(call_message)
+        Returns:
+            저장된 Call 객체 (다른 요청이 먼저 저장한 경우 기존 Call)
+        """
+        # 1. 웹훅 파싱
+        call_values = CallService.parse_call_report(message)
+        vapi_call_id = call_values["vapi_call_id"]
+        elder_id = call_values["elder_id"]
+        summary = call_values["summary"]
+        emotion = call_values["emotion"]
+        print(f"🔍 추출된 elder_id: {elder_id}")
+        
+        # 2. Elder 존재 여부 확인
+        elder = await ElderService.get_elder_by_id(db, elder_id)
+        if not elder:
+            raise ValueError(f"존재하지 않는 어르신입니다. (elder_id: {elder_id})")
+        
+        # 3. Call 레코드 생성 (vapi_call_id 중복 시 아무것도 하지 않음)
+        # digest 모드 보호자의 통화는 digest_pending으로 표시해서 DigestService가 모아서 발송
+        user = await db.get(User, elder.user_id)
+        digest_pending = bool(user and user.email and user.report_email_mode == "digest")
+        stmt = CallService._dialect_insert(db, Call).values(
+            **call_values,
+            user_id=elder.user_id,  # ✨ 추가 - Elder에서 보호자 ID 가져오기
+            digest_pending=digest_pending,
+        )
+        if vapi_call_id and hasattr(stmt, "on_conflict_do_nothing"):
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Call.vapi_call_id])
+        
+        result = await db.execute(stmt.returning(Call.id))
+        call_id = result.scalar_one_or_none()
+        
+        if call_id is None:
+            # 다른 프로세스가 먼저 저장함 → 기존 Call 반환
+            print(f"♻️ 동시 요청으로 이미 저장된 통화입니다 (vapi_call_id: {vapi_call_id})")
+            return await CallService._get_call_by_vapi_id(db, vapi_call_id)
+        
+        # 4. CallMessage 레코드들 생성 (batch 단위 bulk insert)
+        message_rows = CallService.parse_call_messages(messages, call_values["started_at"])
+        message_count = await CallService._insert_call_messages(
+            db, ({**row, "call_id": call_id} for row in message_rows)
+        )
+        print(f"💬 CallMessage {message_count}개 저장")
+        
+        # 5. 어르신 일별 집계 갱신 (같은 트랜잭션)
+        await DailyStatsService.apply_calls(db, [call_values])
+        
+        # 6. 검색 인덱스 추가 (같은 트랜잭션)
+        await CallSearchService.index_calls(db, [call_id])
+        
+        # 7. 보호자 통화 리포트 이메일을 발송 대기열에 등록 (같은 트랜잭션, 발송은 백그라운드)
+        # (digest 모드 보호자는 DigestService가 모아서 발송)
+        if digest_pending:
+            print(f"📧 digest 모드 보호자 - 다음 digest에 포함 (보호자: {user.email})")
+        elif user and user.email:
+            EmailOutboxService.enqueue_call_report(
+                db,
+                email=user.email,
+                elder_name=elder.name,
+                call_id=call_id,
+                elder_id=elder_id,
+                summary=summary,
+                emotion=emotion
+            )
+            print(f"📧 통화 리포트 이메일 발송 대기열 등록 (보호자: {user.email})")
+        else:
+            print(f"⚠️ 보호자 정보 없음 또는 이메일 없음 (user_id: {elder.user_id})")
         
-        # 7. 커밋
+        # 8. 대시보드 데이터 버전 증가 후 커밋
+        await bump_dashboard_versions(db, [elder_id])
         await db.commit()
-        await db.refresh(new_call)
+        new_call = await db.get(Call, call_id)
         
-        # 8. 보호자에게 통화 리포트 이메일 발송
-        try:
-            user = await db.get(User, elder.user_id)
-            if user and user.email:
-                print(f"\n📧 보호자 이메일 발송 시작...")
-                print(f"   - 보호자 이메일: {user.email}")
-                print(f"   - 어르신 이름: {elder.name}")
-                print(f"   - Call ID: {new_call.id}")
-                
-                await send_call_report_email(
-                    email=user.email,
-                    elder_name=elder.name,
-                    call_id=new_call.id,
-                    elder_id=elder_id,
-                    summary=summary,
-                    emotion=emotion
-                )
-            else:
-                print(f"⚠️ 보호자 정보 없음 또는 이메일 없음 (user_id: {elder.user_id})")
-        except Exception as e:
-            # 이메일 발송 실패해도 통화 저장은 성공으로 처리
-            print(f"⚠️ 이메일 발송 중 오류 발생 (통화 저장은 완료됨)")
-            print(f"   Error: {e}")
+        # 9. 캐시된 대시보드 삭제 후 구독자에게 새 통화 알림
+        await dashboard_cache.invalidate(elder_id)
+        dashboard_event_broker.publish(elder_id, CALL_SAVED_EVENT, {
+            "call_id": new_call.id,
+            "vapi_call_id": vapi_call_id,
+            "status": new_call.status,
+            "started_at": new_call.started_at,
+        })
         
         return new_call
+    
+    @staticmethod
+    async def bulk_save_calls(
+        db: AsyncSession,
+        reports: list[tuple[dict, list[dict]]]
+    ) -> dict[str, int]:
+        """
+        파싱된 통화 리포트 여러 건을 한 번에 저장 (웹훅 로그 backfill용, 이메일 발송 없음)
+        
+        parse_call_report / parse_call_messages 결과를 받아 save_call_from_webhook과 같은 규칙으로
+        저장합니다. 이미 저장된 vapi_call_id와 존재하지 않는 어르신의 통화는 건너뜁니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            reports: (Call 컬럼 값, CallMessage 컬럼 값 리스트) 튜플 리스트
+            
+        Returns:
+            {"inserted", "existing", "no_elder", "no_call_id", "messages"} 개수
+        """
+        counts = {"inserted": 0, "existing": 0, "no_elder": 0, "no_call_id": 0, "messages": 0}
+        
+        # 1. vapi_call_id 기준 중복 제거 (재전송된 웹훅이 여러 파일로 남아있을 수 있음)
+        unique_reports: dict[str, tuple[dict, list[dict]]] = {}
+        for call_values, message_rows in reports:
+            vapi_call_id = call_values["vapi_call_id"]
+            if not vapi_call_id:
+                counts["no_call_id"] += 1
+            elif vapi_call_id in unique_reports:
+                counts["existing"] += 1
+            else:
+                unique_reports[vapi_call_id] = (call_values, message_rows)
+        
+        if not unique_reports:
+            return counts
+        
+        # 2. 이미 저장된 통화 / 어르신 보호자 ID 한 번에 조회
+        existing_result = await db.execute(
+            select(Call.vapi_call_id).where(Call.vapi_call_id.in_(list(unique_reports)))
+        )
+        existing_ids = set(existing_result.scalars().all())
+        
+        elder_ids = {call_values["elder_id"] for call_values, _ in unique_reports.values()}
+        elder_result = await db.execute(
+            select(Elder.id, Elder.user_id).where(Elder.id.in_(elder_ids))
+        )
+        elder_user_ids = dict(elder_result.all())
+        
+        # 3. Call 레코드 bulk insert
+        call_rows = []
+        for vapi_call_id, (call_values, _) in unique_reports.items():
+            if vapi_call_id in existing_ids:
+                counts["existing"] += 1
+            elif call_values["elder_id"] not in elder_user_ids:
+                counts["no_elder"] += 1
+            else:
+                call_rows.append({**call_values, "user_id": elder_user_ids[call_values["elder_id"]]})
+        
+        if not call_rows:
+            return counts
+        
+        stmt = CallService._dialect_insert(db, Call)
+        if hasattr(stmt, "on_conflict_do_nothing"):
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Call.vapi_call_id])
+        
+        result = await db.execute(stmt.returning(Call.id, Call.vapi_call_id), call_rows)
+        inserted = result.all()
+        counts["inserted"] = len(inserted)
+        counts["existing"] += len(call_rows) - len(inserted)
+        
+        # 4. CallMessage 레코드 bulk insert
+        counts["messages"] = await CallService._insert_call_messages(
+            db,
+            (
+                {**row, "call_id": call_id}
+                for call_id, vapi_call_id in inserted
+                for row in unique_reports[vapi_call_id][1]
+            )
+        )
+        
+        # 5. 어르신 일별 집계 갱신 (같은 트랜잭션)
+        await DailyStatsService.apply_calls(
+            db, (unique_reports[vapi_call_id][0] for _, vapi_call_id in inserted)
+        )
+        
+        # 6. 검색 인덱스 추가 (같은 트랜잭션)
+        await CallSearchService.index_calls(db, [call_id for call_id, _ in inserted])
+        
+        # 7. 통화가 추가된 어르신의 대시보드 데이터 버전 증가 후 커밋
+        elder_ids = {unique_reports[vapi_call_id][0]["elder_id"] for _, vapi_call_id in inserted}
+        await bump_dashboard_versions(db, elder_ids)
+        await db.commit()
+        
+        # 8. 통화가 추가된 어르신의 캐시된 대시보드 삭제
+        for elder_id in elder_ids:
+            await dashboard_cache.invalidate(elder_id)
+        return counts
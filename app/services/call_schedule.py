@@ -1,8 +1,10 @@
 """CallSchedule 서비스 레이어"""
 from datetime import datetime, time, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
 from app.db.models.call_schedule import CallSchedule
+from app.db.models.elder import Elder
+from app.services.dashboard_cache import dashboard_cache, bump_dashboard_versions
 
 
 class CallScheduleService:
@@ -30,6 +32,58 @@ class CallScheduleService:
         "Sunday": 6
     }
     
+    SECONDS_PER_DAY = 24 * 60 * 60
+    
+    @staticmethod
+    def build_schedule_offsets(schedules) -> list[int]:
+        """
+        스케줄을 주 시작(월요일 00:00)부터의 초로 변환
+        
+        Args:
+            schedules: day_of_week / time 속성이 있는 스케줄 목록 (CallSchedule 또는 조회 행)
+            
+        Returns:
+            오름차순 정렬된 offset 리스트 (알 수 없는 요일은 제외)
+        """
+        offsets = []
+        for schedule in schedules:
+            weekday = CallScheduleService.WEEKDAY_TO_NUM.get(schedule.day_of_week.capitalize())
+            if weekday is None:
+                continue
+            call_time = schedule.time
+            offsets.append(
+                weekday * CallScheduleService.SECONDS_PER_DAY
+                + call_time.hour * 3600 + call_time.minute * 60 + call_time.second
+            )
+        return sorted(offsets)
+    
+    @staticmethod
+    async def refresh_schedule_offsets(
+        db: AsyncSession,
+        elder_id: int
+    ) -> list[int]:
+        """
+        어르신의 현재 스케줄로 Elder.schedule_offsets 갱신 (커밋은 호출하는 쪽에서)
+        
+        대시보드는 이 값만으로 다음 예정 통화 / 이번 주 일정을 계산하므로 스케줄을 바꾸면 항상 호출해야 합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            elder_id: 어르신 ID
+            
+        Returns:
+            갱신된 offset 리스트
+        """
+        result = await db.execute(
+            select(CallSchedule.day_of_week, CallSchedule.time)
+            .where(CallSchedule.elder_id == elder_id)
+        )
+        offsets = CallScheduleService.build_schedule_offsets(result.all())
+        await db.execute(
+            update(Elder).where(Elder.id == elder_id).values(schedule_offsets=offsets)
+        )
+        return offsets
+    
     @staticmethod
     async def create_schedules(
         db: AsyncSession,
@@ -62,6 +116,9 @@ class CallScheduleService:
                 schedules.append(schedule)
         
         await db.flush()  # ID 생성을 위해 flush
+        
+        # 대시보드용 주간 offset 갱신
+        await CallScheduleService.refresh_schedule_offsets(db, elder_id)
         return schedules
     
     @staticmethod
@@ -172,7 +229,10 @@ class CallScheduleService:
         times: list[time]
     ) -> list[CallSchedule]:
         """
-        스케줄 업데이트 (기존 삭제 후 재생성)
+        스케줄 업데이트 (기존 삭제 후 재생성, commit까지 수행)
+        
+        캐시된 대시보드는 commit 후에 삭제합니다. commit 전에 삭제하면 그 사이 들어온
+        대시보드 요청이 이전 스케줄로 응답을 만들어 다시 캐시할 수 있습니다.
         
         Args:
             db: 데이터베이스 세션
@@ -191,4 +251,11 @@ class CallScheduleService:
             db, elder_id, weekdays, times
         )
         
+        # 3. 대시보드 데이터 버전 증가 후 commit (다음 예정 통화 / 이번 주 일정 변경)
+        await bump_dashboard_versions(db, [elder_id])
+        await db.commit()
+        
+        # 4. 캐시된 대시보드 삭제 (commit 후)
+        await dashboard_cache.invalidate(elder_id)
+        
         return new_schedules
\ No newline at end of file
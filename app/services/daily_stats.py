@@ -0,0 +1,217 @@
+"""어르신별 일별 통화 집계 (elder_daily_stats)
+
+대시보드 주간 통계 / 기간별 조회가 calls 전체를 다시 읽지 않도록 어르신 / 날짜별로 미리 집계합니다.
+- 통화 저장(CallService._save_call / bulk_save_calls)과 같은 트랜잭션에서 apply_calls로 증분 갱신
+- 집계가 어긋났거나 기준이 바뀌었을 때는 rebuild로 calls에서 다시 계산 (python -m scripts.rebuild_daily_stats)
+"""
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import select, delete, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.call import Call
+from app.db.models.elder_daily_stats import ElderDailyStats
+
+
+class DailyStatsService:
+
+    # rebuild 시 calls를 읽는 단위 / 집계 행을 insert하는 단위
+    REBUILD_FETCH_SIZE = 5000
+    REBUILD_INSERT_BATCH_SIZE = 1000
+
+    @staticmethod
+    def _empty_delta() -> dict:
+        return {
+            "attempts": 0,
+            "completions": 0,
+            "total_duration_seconds": 0.0,
+            "duration_count": 0,
+            "emotion_counts": Counter(),
+            "tag_counts": Counter(),
+        }
+
+    @staticmethod
+    def stats_day(started_at: datetime) -> date:
+        """
+        통화가 집계되는 날짜
+
+        timezone이 있는 값(Vapi startedAt, PostgreSQL timestamptz)은 UTC로 맞춰서
+        웹훅 저장 시의 증분과 rebuild 결과가 같은 날짜가 되도록 합니다.
+        """
+        if started_at.tzinfo is not None:
+            started_at = started_at.astimezone(timezone.utc)
+        return started_at.date()
+
+    @staticmethod
+    def _accumulate(deltas: dict[tuple[int, date], dict], call: dict) -> None:
+        """통화 하나를 (elder_id, day)별 증분에 더함"""
+        key = (call["elder_id"], DailyStatsService.stats_day(call["started_at"]))
+        delta = deltas.get(key)
+        if delta is None:
+            delta = deltas[key] = DailyStatsService._empty_delta()
+
+        delta["attempts"] += 1
+        if call["status"] == "completed":
+            delta["completions"] += 1
+            if call.get("duration_seconds") is not None:
+                delta["total_duration_seconds"] += call["duration_seconds"]
+                delta["duration_count"] += 1
+
+        if call.get("emotion"):
+            delta["emotion_counts"][call["emotion"]] += 1
+        tags = call.get("tags")
+        if isinstance(tags, list):
+            delta["tag_counts"].update(tag for tag in tags if isinstance(tag, str) and tag)
+
+    @staticmethod
+    def build_deltas(calls: Iterable[dict]) -> dict[tuple[int, date], dict]:
+        """
+        통화 값을 (elder_id, day)별 증분으로 집계 (DB 접근 없음)
+
+        Args:
+            calls: elder_id, started_at, status, duration_seconds, emotion, tags를 가진 딕셔너리
+                   (CallService.parse_call_report 결과 형태)
+
+        Returns:
+            {(elder_id, day): 증분} 딕셔너리
+        """
+        deltas: dict[tuple[int, date], dict] = {}
+        for call in calls:
+            DailyStatsService._accumulate(deltas, call)
+        return deltas
+
+    @staticmethod
+    def _dialect_insert(db: AsyncSession):
+        """ON CONFLICT를 지원하는 방언이면 전용 insert 반환"""
+        dialect_name = db.bind.dialect.name
+        if dialect_name == "sqlite":
+            return sqlite_insert(ElderDailyStats)
+        if dialect_name == "postgresql":
+            return postgresql_insert(ElderDailyStats)
+        return insert(ElderDailyStats)
+
+    @staticmethod
+    async def apply_calls(db: AsyncSession, calls: Iterable[dict]) -> int:
+        """
+        새로 저장한 통화를 일별 집계에 반영 (커밋은 호출하는 쪽에서, 통화 저장과 같은 트랜잭션)
+
+        (elder_id, day) 행이 없으면 먼저 만들고(ON CONFLICT DO NOTHING), 행을 잠근 뒤 더하므로
+        같은 날 통화가 동시에 저장되어도 집계가 빠지지 않습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            calls: 새로 저장한 통화 값 (build_deltas 참고)
+
+        Returns:
+            갱신한 집계 행 수
+        """
+        deltas = DailyStatsService.build_deltas(calls)
+
+        for (elder_id, day), delta in deltas.items():
+            stmt = DailyStatsService._dialect_insert(db)
+            if hasattr(stmt, "on_conflict_do_nothing"):
+                await db.execute(
+                    stmt.values(elder_id=elder_id, day=day, emotion_counts={}, tag_counts={})
+                    .on_conflict_do_nothing(index_elements=[ElderDailyStats.elder_id, ElderDailyStats.day])
+                )
+
+            result = await db.execute(
+                select(ElderDailyStats)
+                .where(ElderDailyStats.elder_id == elder_id)
+                .where(ElderDailyStats.day == day)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )
+            row = result.scalar_one_or_none()
+            if row is None:
+                row = ElderDailyStats(
+                    elder_id=elder_id, day=day, attempts=0, completions=0,
+                    total_duration_seconds=0.0, duration_count=0, emotion_counts={}, tag_counts={}
+                )
+                db.add(row)
+
+            row.attempts += delta["attempts"]
+            row.completions += delta["completions"]
+            row.total_duration_seconds += delta["total_duration_seconds"]
+            row.duration_count += delta["duration_count"]
+            # JSON 컬럼은 새 dict를 대입해야 변경으로 감지됨
+            row.emotion_counts = dict(Counter(row.emotion_counts) + delta["emotion_counts"])
+            row.tag_counts = dict(Counter(row.tag_counts) + delta["tag_counts"])
+
+        await db.flush()
+        return len(deltas)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, elder_id: int | None = None) -> dict[str, int]:
+        """
+        calls에서 일별 집계를 다시 계산 (커밋은 호출하는 쪽에서)
+
+        Args:
+            db: 데이터베이스 세션
+            elder_id: 지정하면 해당 어르신만, None이면 전체
+
+        Returns:
+            {"calls": 읽은 통화 수, "rows": 생성한 집계 행 수}
+        """
+        delete_stmt = delete(ElderDailyStats)
+        query = select(
+            Call.elder_id, Call.started_at, Call.status, Call.duration_seconds, Call.emotion, Call.tags
+        )
+        if elder_id is not None:
+            delete_stmt = delete_stmt.where(ElderDailyStats.elder_id == elder_id)
+            query = query.where(Call.elder_id == elder_id)
+        await db.execute(delete_stmt)
+
+        deltas: dict[tuple[int, date], dict] = {}
+        call_count = 0
+        result = await db.stream(query.execution_options(yield_per=DailyStatsService.REBUILD_FETCH_SIZE))
+        async for row in result.mappings():
+            DailyStatsService._accumulate(deltas, row)
+            call_count += 1
+
+        rows = [
+            {
+                "elder_id": row_elder_id,
+                "day": day,
+                **delta,
+                "emotion_counts": dict(delta["emotion_counts"]),
+                "tag_counts": dict(delta["tag_counts"]),
+            }
+            for (row_elder_id, day), delta in deltas.items()
+        ]
+        for i in range(0, len(rows), DailyStatsService.REBUILD_INSERT_BATCH_SIZE):
+            await db.execute(insert(ElderDailyStats), rows[i:i + DailyStatsService.REBUILD_INSERT_BATCH_SIZE])
+
+        return {"calls": call_count, "rows": len(rows)}
+
+    @staticmethod
+    async def get_range(
+        db: AsyncSession,
+        elder_id: int,
+        start_day: date,
+        end_day: date
+    ) -> list[ElderDailyStats]:
+        """
+        기간 내 일별 집계 조회 (통화가 없는 날은 행이 없음)
+
+        Args:
+            db: 데이터베이스 세션
+            elder_id: 어르신 ID
+            start_day: 시작 날짜 (포함)
+            end_day: 종료 날짜 (미포함)
+
+        Returns:
+            날짜순 ElderDailyStats 리스트
+        """
+        result = await db.execute(
+            select(ElderDailyStats)
+            .where(ElderDailyStats.elder_id == elder_id)
+            .where(ElderDailyStats.day >= start_day)
+            .where(ElderDailyStats.day < end_day)
+            .order_by(ElderDailyStats.day)
+        )
+        return list(result.scalars().all())
@@ -1,11 +1,20 @@
 """대시보드 비즈니스 로직"""
-from datetime import datetime, time, timedelta
-from sqlalchemy import select, func
+import base64
+import zlib
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+
+import orjson
+from sqlalchemy import select, func, case, true, bindparam, tuple_, Date, Integer
+from sqlalchemy.sql.expression import BindParameter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, aliased
 from app.db.models.call import Call
-from app.db.models.call_schedule import CallSchedule
+from app.db.models.call_message import CallMessage
 from app.db.models.elder import Elder
+from app.db.models.elder_daily_stats import ElderDailyStats
+from app.db.models.user import User
 from app.schemas.dashboard import (
     ElderBasicInfo,
     TodayHighlight,
@@ -18,7 +27,24 @@ from app.schemas.dashboard import (
     WeeklyScheduleItem,
     CallMessageItem,
     CallDetailResponse,
+    TrendsResponse,
+    TodayStatus,
+    ElderOverviewItem,
+    GuardianOverviewResponse,
 )
+from app.services.daily_stats import DailyStatsService
+
+# cursor 방식 통화 목록에서 total을 셀 때의 상한 (넘으면 근사값으로 표시)
+CALL_LIST_COUNT_LIMIT = 1000
+
+# 대화 내용 조회: 기본 / 최대 페이지 크기, NDJSON 스트리밍 시 한 번에 읽는 행 수
+TRANSCRIPT_PAGE_SIZE = 100
+TRANSCRIPT_MAX_PAGE_SIZE = 500
+TRANSCRIPT_STREAM_FETCH_SIZE = 500
+
+# 추이 조회: 기간을 지정하지 않았을 때의 구간 수 / 최대 조회 기간 (일별 집계 행 수 상한)
+TREND_DEFAULT_PERIODS = 12
+TREND_MAX_DAYS = 366 * 5
 
 
 def calculate_service_days(begin_date: datetime) -> int:
@@ -54,6 +80,50 @@ def get_week_range(target_date: datetime | None = None) -> tuple[datetime, datet
     return week_start, week_end
 
 
+def weekly_stats_query(
+    elder_id: int | BindParameter,
+    start_day: date | BindParameter,
+    end_day: date | BindParameter
+):
+    """
+    주간 통화 통계 집계 쿼리 (항상 한 행: attempts, success, avg_seconds)
+    
+    calls 대신 어르신 일별 집계(elder_daily_stats)에서 최대 7행만 읽어서 합산합니다.
+    
+    Args:
+        elder_id: 어르신 ID (또는 bindparam)
+        start_day: 주 시작 날짜 (월요일, 포함)
+        end_day: 주 종료 날짜 (다음 주 월요일, 미포함)
+    
+    Returns:
+        SELECT 구문
+    """
+    return (
+        select(
+            func.coalesce(func.sum(ElderDailyStats.attempts), 0).label("attempts"),
+            func.coalesce(func.sum(ElderDailyStats.completions), 0).label("success"),
+            (
+                func.sum(ElderDailyStats.total_duration_seconds)
+                / func.nullif(func.sum(ElderDailyStats.duration_count), 0)
+            ).label("avg_seconds"),
+        )
+        .where(ElderDailyStats.elder_id == elder_id)
+        .where(ElderDailyStats.day >= start_day)
+        .where(ElderDailyStats.day < end_day)
+    )
+
+
+def build_weekly_stats(attempts: int, success: int, avg_seconds) -> WeeklyStats:
+    """주간 통계 집계 결과를 WeeklyStats로 변환 (평균 통화 시간은 분 단위, 소수점 버림)"""
+    avg_duration_minutes = int(float(avg_seconds) / 60) if avg_seconds is not None else 0
+    
+    return WeeklyStats(
+        call_attempts=CallAttemptsStats(count=attempts),
+        call_success_count=CallSuccessStats(count=int(success)),
+        avg_duration=AvgDurationStats(minutes=avg_duration_minutes)
+    )
+
+
 async def get_weekly_stats(
     db: AsyncSession,
     elder_id: int,
@@ -63,6 +133,8 @@ async def get_weekly_stats(
     """
     주간 통화 통계 계산
     
+    통화 시도 / 성공 횟수, 평균 통화 시간을 일별 집계에서 한 번에 합산합니다.
+    
     Args:
         db: DB 세션
         elder_id: 어르신 ID
@@ -72,36 +144,107 @@ async def get_weekly_stats(
     Returns:
         WeeklyStats 객체
     """
-    # 이번 주 모든 통화 조회
-    result = await db.execute(
-        select(Call)
-        .where(Call.elder_id == elder_id)
-        .where(Call.started_at >= week_start)
-        .where(Call.started_at < week_end)
+    result = await db.execute(weekly_stats_query(elder_id, week_start.date(), week_end.date()))
+    stats = result.one()
+    return build_weekly_stats(stats.attempts, stats.success, stats.avg_seconds)
+
+
+def build_recent_call_item(call: Call) -> RecentCallItem:
+    """
+    Call을 통화 기록 목록 항목으로 변환
+    
+    Args:
+        call: Call 모델 객체
+    
+    Returns:
+        RecentCallItem 객체
+    """
+    return RecentCallItem(
+        id=call.id,
+        date=call.started_at.strftime("%Y.%m.%d"),
+        time=call.started_at.strftime("%H:%M"),
+        duration_minutes=int((call.duration_seconds or 0) / 60),
+        summary=call.summary or "",
+        tags=call.tags if call.tags else [],  # tags가 None이면 빈 리스트
+        emotion=call.emotion,
+        status=call.status
     )
-    week_calls = result.scalars().all()
+
+
+@lru_cache()
+def _dashboard_summary_statement():
+    """
+    get_dashboard_summary용 SELECT 구문 (한 번만 생성)
     
-    # 통화 시도 횟수
-    call_attempts_count = len(week_calls)
+    subquery를 매번 새로 만들면 컬럼 컬렉션 구성 비용이 쿼리 실행보다 커지므로
+    값은 bindparam(elder_id, start_day, end_day, recent_limit)으로 넘깁니다.
     
-    # 통화 성공 횟수
-    success_calls = [c for c in week_calls if c.status == "completed"]
-    call_success_count = len(success_calls)
+    Returns:
+        SELECT 구문 (행: Elder, attempts, success, avg_seconds, 최근 통화 Call 또는 None)
+    """
+    elder_id = bindparam("elder_id", type_=Integer)
+    stats = weekly_stats_query(
+        elder_id,
+        bindparam("start_day", type_=Date),
+        bindparam("end_day", type_=Date)
+    ).subquery("weekly_stats")
+    recent = (
+        select(Call)
+        .where(Call.elder_id == elder_id)
+        .order_by(Call.started_at.desc())
+        .limit(bindparam("recent_limit", type_=Integer))
+        .subquery("recent_calls")
+    )
+    recent_call = aliased(Call, recent)
+    
+    return (
+        select(Elder, stats.c.attempts, stats.c.success, stats.c.avg_seconds, recent_call)
+        .select_from(Elder)
+        .join(stats, true())
+        .outerjoin(recent_call, true())
+        .where(Elder.id == elder_id)
+        .order_by(recent.c.started_at.desc())
+    )
+
+
+async def get_dashboard_summary(
+    db: AsyncSession,
+    elder_id: int,
+    week_start: datetime,
+    week_end: datetime,
+    recent_limit: int = 10
+) -> tuple[Elder | None, WeeklyStats, list[RecentCallItem]]:
+    """
+    대시보드용 어르신 정보 + 주간 통계 + 최근 통화를 한 번의 쿼리로 조회
     
-    # 평균 통화 시간 계산 (분 단위)
-    durations = []
-    for call in success_calls:
-        if call.ended_at:
-            duration_seconds = (call.ended_at - call.started_at).total_seconds()
-            durations.append(duration_seconds / 60)  # 분으로 변환
+    주간 통계(항상 한 행)는 CROSS JOIN, 최근 통화(최대 recent_limit행)는 LEFT JOIN으로 붙이므로
+    결과는 어르신 한 명당 1 ~ recent_limit행이고, 통화가 없으면 통화 컬럼이 NULL인 한 행입니다.
     
-    avg_duration_minutes = int(sum(durations) / len(durations)) if durations else 0
+    Args:
+        db: DB 세션
+        elder_id: 어르신 ID
+        week_start: 주 시작 (월요일 00:00)
+        week_end: 주 종료 (다음 주 월요일 00:00)
+        recent_limit: 최근 통화 최대 개수
     
-    return WeeklyStats(
-        call_attempts=CallAttemptsStats(count=call_attempts_count),
-        call_success_count=CallSuccessStats(count=call_success_count),
-        avg_duration=AvgDurationStats(minutes=avg_duration_minutes)
-    )
+    Returns:
+        (Elder 객체 또는 None, WeeklyStats, RecentCallItem 리스트) 튜플
+    """
+    result = await db.execute(_dashboard_summary_statement(), {
+        "elder_id": elder_id,
+        "start_day": week_start.date(),
+        "end_day": week_end.date(),
+        "recent_limit": recent_limit,
+    })
+    rows = result.all()
+    
+    if not rows:
+        return None, build_weekly_stats(0, 0, None), []
+    
+    first = rows[0]
+    weekly_stats = build_weekly_stats(first.attempts, first.success, first.avg_seconds)
+    recent_calls = [build_recent_call_item(row[4]) for row in rows if row[4] is not None]
+    return first.Elder, weekly_stats, recent_calls
 
 
 async def get_recent_calls(
@@ -128,35 +271,75 @@ async def get_recent_calls(
     )
     calls = result.scalars().all()
     
-    recent_call_items = []
-    for call in calls:
-        # 날짜/시간 포맷
-        date_str = call.started_at.strftime("%Y.%m.%d")
-        time_str = call.started_at.strftime("%H:%M")
-        
-        # 통화 시간 계산
-        duration_minutes = 0
-        if call.ended_at:
-            duration_seconds = (call.ended_at - call.started_at).total_seconds()
-            duration_minutes = int(duration_seconds / 60)
-        
-        # tags가 None이면 빈 리스트
-        tags = call.tags if call.tags else []
-        
-        recent_call_items.append(
-            RecentCallItem(
-                id=call.id,
-                date=date_str,
-                time=time_str,
-                duration_minutes=duration_minutes,
-                summary=call.summary or "",
-                tags=tags,
-                emotion=call.emotion,
-                status=call.status
-            )
-        )
+    return [build_recent_call_item(call) for call in calls]
+
+
+def encode_call_cursor(started_at: datetime, call_id: int) -> str:
+    """
+    통화 목록 cursor 생성 ((started_at, id)를 URL-safe base64로 감싼 opaque 문자열)
+    
+    Args:
+        started_at: 페이지 마지막 통화의 시작 시각
+        call_id: 페이지 마지막 통화의 ID
     
-    return recent_call_items
+    Returns:
+        cursor 문자열
+    """
+    raw = orjson.dumps([started_at.isoformat(), call_id])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_call_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    통화 목록 cursor 해석
+    
+    Args:
+        cursor: encode_call_cursor로 만든 문자열
+    
+    Returns:
+        (started_at, call_id) 튜플
+    
+    Raises:
+        ValueError: 형식이 잘못된 cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        started_at, call_id = orjson.loads(raw)
+        return datetime.fromisoformat(started_at), int(call_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("잘못된 cursor입니다") from e
+
+
+async def count_calls(
+    db: AsyncSession,
+    elder_id: int,
+    limit: int | None = None
+) -> tuple[int, bool]:
+    """
+    어르신의 전체 통화 수 조회
+    
+    Args:
+        db: DB 세션
+        elder_id: 어르신 ID
+        limit: 지정하면 limit개까지만 세고 그 이상은 근사값으로 표시
+    
+    Returns:
+        (통화 수, 근사값 여부) 튜플
+    """
+    if limit is None:
+        result = await db.execute(
+            select(func.count(Call.id))
+            .where(Call.elder_id == elder_id)
+        )
+        return result.scalar() or 0, False
+    
+    # 인덱스에서 limit + 1개까지만 읽고 중단
+    capped = select(Call.id).where(Call.elder_id == elder_id).limit(limit + 1).subquery()
+    result = await db.execute(select(func.count()).select_from(capped))
+    count = result.scalar() or 0
+    if count > limit:
+        return limit, True
+    return count, False
 
 
 async def get_call_list_paginated(
@@ -164,9 +347,9 @@ async def get_call_list_paginated(
     elder_id: int,
     page: int = 1,
     page_size: int = 5
-) -> tuple[list[RecentCallItem], int]:
+) -> tuple[list[RecentCallItem], int, str | None]:
     """
-    통화 기록 페이지네이션 조회
+    통화 기록 페이지네이션 조회 (page 방식)
     
     Args:
         db: DB 세션
@@ -175,58 +358,73 @@ async def get_call_list_paginated(
         page_size: 페이지당 항목 수
     
     Returns:
-        (RecentCallItem 리스트, 전체 개수) 튜플
+        (RecentCallItem 리스트, 전체 개수, 다음 페이지 cursor) 튜플
     """
-    from sqlalchemy import func
-    
     # 전체 개수 조회
-    count_result = await db.execute(
-        select(func.count(Call.id))
-        .where(Call.elder_id == elder_id)
-    )
-    total_count = count_result.scalar() or 0
+    total_count, _ = await count_calls(db, elder_id)
     
     # 페이지네이션 데이터 조회
     offset = (page - 1) * page_size
     result = await db.execute(
         select(Call)
         .where(Call.elder_id == elder_id)
-        .order_by(Call.started_at.desc())
+        .order_by(Call.started_at.desc(), Call.id.desc())
         .offset(offset)
         .limit(page_size)
     )
     calls = result.scalars().all()
     
-    # RecentCallItem으로 변환
-    recent_call_items = []
-    for call in calls:
-        # 날짜/시간 포맷
-        date_str = call.started_at.strftime("%Y.%m.%d")
-        time_str = call.started_at.strftime("%H:%M")
-        
-        # 통화 시간 계산
-        duration_minutes = 0
-        if call.ended_at:
-            duration_seconds = (call.ended_at - call.started_at).total_seconds()
-            duration_minutes = int(duration_seconds / 60)
-        
-        # tags가 None이면 빈 리스트
-        tags = call.tags if call.tags else []
-        
-        recent_call_items.append(
-            RecentCallItem(
-                id=call.id,
-                date=date_str,
-                time=time_str,
-                duration_minutes=duration_minutes,
-                summary=call.summary or "",
-                tags=tags,
-                emotion=call.emotion,
-                status=call.status
-            )
-        )
+    # 이후 페이지는 cursor 방식으로도 이어서 조회할 수 있도록 cursor 반환
+    next_cursor = None
+    if calls and offset + len(calls) < total_count:
+        next_cursor = encode_call_cursor(calls[-1].started_at, calls[-1].id)
+    
+    return [build_recent_call_item(call) for call in calls], total_count, next_cursor
+
+
+async def get_call_list_by_cursor(
+    db: AsyncSession,
+    elder_id: int,
+    cursor: str | None = None,
+    page_size: int = 5
+) -> tuple[list[RecentCallItem], str | None]:
+    """
+    통화 기록 페이지네이션 조회 (cursor 방식)
+    
+    (started_at, id) 내림차순 keyset으로 cursor 다음 항목부터 조회하므로
+    OFFSET / COUNT 없이 페이지 깊이와 상관없이 인덱스 범위만 읽습니다.
+    
+    Args:
+        db: DB 세션
+        elder_id: 어르신 ID
+        cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+        page_size: 페이지당 항목 수
+    
+    Returns:
+        (RecentCallItem 리스트, 다음 페이지 cursor 또는 None) 튜플
+    
+    Raises:
+        ValueError: 형식이 잘못된 cursor
+    """
+    stmt = select(Call).where(Call.elder_id == elder_id)
+    if cursor:
+        started_at, call_id = decode_call_cursor(cursor)
+        stmt = stmt.where(tuple_(Call.started_at, Call.id) < tuple_(started_at, call_id))
+    
+    # 다음 페이지 존재 여부 확인용으로 한 개 더 조회
+    result = await db.execute(
+        stmt
+        .order_by(Call.started_at.desc(), Call.id.desc())
+        .limit(page_size + 1)
+    )
+    calls = result.scalars().all()
+    
+    next_cursor = None
+    if len(calls) > page_size:
+        calls = calls[:page_size]
+        next_cursor = encode_call_cursor(calls[-1].started_at, calls[-1].id)
     
-    return recent_call_items, total_count
+    return [build_recent_call_item(call) for call in calls], next_cursor
 
 
 def get_today_highlight(recent_calls: list[RecentCallItem]) -> TodayHighlight | None:
@@ -265,6 +463,13 @@ WEEKDAY_KR = {
     "sunday": "일요일",
 }
 
+# Python weekday 순서 (Monday=0)
+WEEKDAY_KR_BY_NUM = list(WEEKDAY_KR.values())
+
+# Elder.schedule_offsets 단위 (주 시작부터의 초)
+SECONDS_PER_DAY = 24 * 60 * 60
+SECONDS_PER_WEEK = 7 * SECONDS_PER_DAY
+
 WEEKDAY_EN = {
     "월요일": "monday",
     "화요일": "tuesday",
@@ -277,49 +482,36 @@ WEEKDAY_EN = {
 
 
 def find_next_scheduled_call(
-    call_schedules: list[CallSchedule],
+    schedule_offsets: list[int] | None,
     now: datetime | None = None
 ) -> NextScheduledCall | None:
     """
     다음 예정 통화 찾기
     
     Args:
-        call_schedules: CallSchedule 리스트
+        schedule_offsets: 정렬된 주간 스케줄 offset (Elder.schedule_offsets)
         now: 현재 시각 (None이면 지금)
     
     Returns:
         NextScheduledCall 또는 None
     """
-    if not call_schedules:
+    if not schedule_offsets:
         return None
     
     if now is None:
         now = datetime.now()
     
-    # 모든 예정 통화를 datetime으로 변환하여 정렬
-    upcoming_calls = []
-    
-    for schedule in call_schedules:
-        # 오늘부터 최대 7일 이내의 예정 통화 찾기
-        for day_offset in range(8):
-            target_date = now.date() + timedelta(days=day_offset)
-            target_weekday = target_date.strftime("%A").lower()  # 'monday', 'tuesday', ...
-            
-            # CallSchedule의 day_of_week와 매칭 확인
-            if schedule.day_of_week.lower() == target_weekday:
-                # datetime 생성
-                scheduled_datetime = datetime.combine(target_date, schedule.time)
-                
-                # 현재 시각 이후인 것만
-                if scheduled_datetime > now:
-                    upcoming_calls.append((scheduled_datetime, schedule))
-    
-    if not upcoming_calls:
-        return None
+    # 이번 주 월요일 00:00부터 지금까지의 초
+    week_start = datetime.combine(now.date() - timedelta(days=now.weekday()), time.min)
+    now_offset = (now - week_start).total_seconds()
     
-    # 가장 가까운 미래 통화
-    upcoming_calls.sort(key=lambda x: x[0])
-    next_datetime, _ = upcoming_calls[0]
+    # 지금 이후 첫 스케줄 (이번 주에 남은 스케줄이 없으면 다음 주 첫 스케줄)
+    index = bisect_right(schedule_offsets, now_offset)
+    if index < len(schedule_offsets):
+        next_offset = schedule_offsets[index]
+    else:
+        next_offset = schedule_offsets[0] + SECONDS_PER_WEEK
+    next_datetime = week_start + timedelta(seconds=next_offset)
     
     # 날짜/시간 포맷
     date_display = next_datetime.strftime("%Y년 %m월 %d일").lstrip("0").replace("월 0", "월 ")
@@ -335,46 +527,43 @@ def find_next_scheduled_call(
 
 
 def build_weekly_schedule(
-    call_schedules: list[CallSchedule],
+    schedule_offsets: list[int] | None,
     week_start: datetime
 ) -> list[WeeklyScheduleItem]:
     """
     이번 주 월~일 일정 구성
     
     Args:
-        call_schedules: CallSchedule 리스트
+        schedule_offsets: 정렬된 주간 스케줄 offset (Elder.schedule_offsets)
         week_start: 이번 주 월요일 00:00
     
     Returns:
         WeeklyScheduleItem 리스트 (7개, 월~일)
     """
+    offsets = schedule_offsets or []
     weekly_items = []
     
     # 월요일부터 일요일까지 7일
     for day_offset in range(7):
         target_date = week_start.date() + timedelta(days=day_offset)
-        target_weekday_en = target_date.strftime("%A").lower()  # 'monday', 'tuesday', ...
-        
-        # 한글 요일
-        weekday_kr = WEEKDAY_KR.get(target_weekday_en, target_weekday_en)
+        weekday = target_date.weekday()
         
-        # 날짜 포맷
-        date_str = target_date.strftime("%Y-%m-%d")
-        date_display = target_date.strftime("%m월 %d일").lstrip("0").replace("월 0", "월 ")
+        # 날짜 포맷 (YYYY-MM-DD, M월 D일)
+        date_str = target_date.isoformat()
+        date_display = f"{target_date.month}월 {target_date.day}일"
         
-        # 해당 요일의 예정 시간들 찾기
-        scheduled_times = []
-        for schedule in call_schedules:
-            if schedule.day_of_week.lower() == target_weekday_en:
-                time_str = schedule.time.strftime("%H:%M")
-                scheduled_times.append(time_str)
-        
-        # 시간순 정렬
-        scheduled_times.sort()
+        # 해당 요일의 예정 시간들 (offset이 정렬되어 있으므로 이미 시간순)
+        day_start = weekday * SECONDS_PER_DAY
+        lo = bisect_left(offsets, day_start)
+        hi = bisect_left(offsets, day_start + SECONDS_PER_DAY, lo)
+        scheduled_times = [
+            f"{(offset - day_start) // 3600:02d}:{(offset - day_start) % 3600 // 60:02d}"
+            for offset in offsets[lo:hi]
+        ]
         
         weekly_items.append(
             WeeklyScheduleItem(
-                day_of_week=weekday_kr,
+                day_of_week=WEEKDAY_KR_BY_NUM[weekday],
                 date=date_str,
                 date_display=date_display,
                 scheduled_times=scheduled_times
@@ -404,12 +593,136 @@ async def build_elder_basic_info(elder: Elder) -> ElderBasicInfo:
     )
 
 
+def transcript_query(call_id: int, after: tuple[datetime, int] | None = None):
+    """
+    통화 대화 내용 조회 쿼리 ((timestamp, id) 순, ORM 객체 없이 필요한 컬럼만)
+    
+    ix_call_messages_call_id_timestamp (call_id, timestamp, id) 순서로 읽으므로 정렬 비용이 없습니다.
+    
+    Args:
+        call_id: 통화 ID
+        after: 이 (timestamp, id) 다음 메시지부터 (None이면 처음부터)
+    
+    Returns:
+        SELECT 구문 (행: id, role, message, timestamp)
+    """
+    query = (
+        select(CallMessage.id, CallMessage.role, CallMessage.message, CallMessage.timestamp)
+        .where(CallMessage.call_id == call_id)
+    )
+    if after is not None:
+        query = query.where(tuple_(CallMessage.timestamp, CallMessage.id) > tuple_(*after))
+    return query.order_by(CallMessage.timestamp, CallMessage.id)
+
+
+async def get_transcript_page(
+    db: AsyncSession,
+    call_id: int,
+    cursor: str | None = None,
+    limit: int | None = TRANSCRIPT_PAGE_SIZE
+) -> tuple[list[CallMessageItem], str | None]:
+    """
+    통화 대화 내용을 cursor 방식으로 조회
+    
+    Args:
+        db: DB 세션
+        call_id: 통화 ID
+        cursor: 이전 페이지의 next_cursor (None이면 처음부터)
+        limit: 최대 메시지 수 (None이면 끝까지)
+    
+    Returns:
+        (CallMessageItem 리스트, 다음 페이지 cursor 또는 None) 튜플
+    
+    Raises:
+        ValueError: cursor 형식이 잘못됨
+    """
+    # cursor 형식은 통화 목록과 같음 ((timestamp, id)를 감싼 문자열)
+    after = decode_call_cursor(cursor) if cursor else None
+    query = transcript_query(call_id, after)
+    if limit is not None:
+        # 다음 페이지 존재 여부 확인용으로 한 개 더 조회
+        query = query.limit(limit + 1)
+    
+    result = await db.execute(query)
+    rows = result.all()
+    
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_call_cursor(rows[-1].timestamp, rows[-1].id)
+    
+    items = [
+        CallMessageItem(role=row.role, message=row.message, timestamp=row.timestamp)
+        for row in rows
+    ]
+    return items, next_cursor
+
+
+async def iter_transcript_ndjson(db: AsyncSession, call_id: int, cursor: str | None = None):
+    """
+    통화 대화 내용을 NDJSON 줄(bytes)로 하나씩 생성 (TRANSCRIPT_STREAM_FETCH_SIZE개씩 읽어서 메모리 일정)
+    
+    Args:
+        db: DB 세션 (스트림이 끝날 때까지 사용)
+        call_id: 통화 ID
+        cursor: 이 cursor 다음 메시지부터 (None이면 처음부터)
+    
+    Raises:
+        ValueError: cursor 형식이 잘못됨 (첫 줄을 만들기 전에 발생)
+    """
+    after = decode_call_cursor(cursor) if cursor else None
+    result = await db.stream(
+        transcript_query(call_id, after).execution_options(yield_per=TRANSCRIPT_STREAM_FETCH_SIZE)
+    )
+    async for row in result:
+        yield orjson.dumps({"role": row.role, "message": row.message, "timestamp": row.timestamp}) + b"\n"
+
+
+async def get_dashboard_version(db: AsyncSession, elder_id: int) -> int | None:
+    """
+    대시보드 조건부 요청용 어르신 데이터 버전 조회 (primary key 조회 한 번)
+    
+    Returns:
+        Elder.data_version 또는 None (어르신이 없음)
+    """
+    result = await db.execute(
+        select(Elder.data_version).where(Elder.id == elder_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_call_validators(db: AsyncSession, call_id: int) -> tuple[datetime, str] | None:
+    """
+    통화 상세 조건부 요청용 값 조회 (대화 내용 없이 calls / elders primary key 조회 한 번)
+    
+    Returns:
+        (Call.updated_at, 어르신 이름) 튜플 또는 None (통화가 없음)
+    """
+    result = await db.execute(
+        select(Call.updated_at, Elder.name)
+        .outerjoin(Elder, Elder.id == Call.elder_id)
+        .where(Call.id == call_id)
+    )
+    row = result.one_or_none()
+    return (row.updated_at, row.name or "알 수 없음") if row else None
+
+
+def call_detail_etag(call_id: int, updated_at: datetime, elder_name: str) -> str:
+    """
+    통화 상세 응답의 ETag (weak)
+    
+    끝난 통화의 메시지는 바뀌지 않으므로 Call.updated_at과 응답에 들어가는 어르신 이름으로 만듭니다.
+    """
+    name_hash = zlib.crc32(elder_name.encode())
+    return f'W/"call-{call_id}-{int(updated_at.timestamp() * 1_000_000)}-{name_hash:08x}"'
+
+
 async def get_call_detail_by_id(
     db: AsyncSession,
     call_id: int
 ) -> tuple[Call | None, str]:
     """
-    통화 상세 조회 (Call + CallMessage 함께 조회)
+    통화 상세 조회 (Call + 어르신 이름, 대화 내용 제외)
     
     Args:
         db: DB 세션
@@ -418,13 +731,10 @@ async def get_call_detail_by_id(
     Returns:
         (Call 객체 또는 None, 어르신 이름) 튜플
     """
-    # Call과 관련된 CallMessage, Elder를 함께 조회 (eager loading)
+    # Call과 Elder를 함께 조회 (메시지는 get_transcript_page로 따로 조회)
     result = await db.execute(
         select(Call)
-        .options(
-            selectinload(Call.messages),
-            selectinload(Call.elder)
-        )
+        .options(selectinload(Call.elder))
         .where(Call.id == call_id)
     )
     call = result.scalar_one_or_none()
@@ -436,3 +746,259 @@ async def get_call_detail_by_id(
     
     return call, elder_name
 
+
+def weekly_stats_by_elder_query(elder_ids: list[int], start_day: date, end_day: date, today: date):
+    """
+    어르신별 주간 통화 통계 + 오늘 통화 수 집계 쿼리 (어르신 한 명당 한 행, 통화가 없는 어르신은 행 없음)
+    
+    weekly_stats_query와 같은 규칙으로 일별 집계를 elder_id별로 합산합니다.
+    
+    Args:
+        elder_ids: 어르신 ID 리스트
+        start_day: 주 시작 날짜 (월요일, 포함)
+        end_day: 주 종료 날짜 (다음 주 월요일, 미포함)
+        today: 오늘 날짜 (이번 주 안)
+    
+    Returns:
+        SELECT 구문 (행: elder_id, attempts, success, avg_seconds, today_attempts, today_success)
+    """
+    is_today = ElderDailyStats.day == today
+    return (
+        select(
+            ElderDailyStats.elder_id,
+            func.sum(ElderDailyStats.attempts).label("attempts"),
+            func.sum(ElderDailyStats.completions).label("success"),
+            (
+                func.sum(ElderDailyStats.total_duration_seconds)
+                / func.nullif(func.sum(ElderDailyStats.duration_count), 0)
+            ).label("avg_seconds"),
+            func.sum(case((is_today, ElderDailyStats.attempts), else_=0)).label("today_attempts"),
+            func.sum(case((is_today, ElderDailyStats.completions), else_=0)).label("today_success"),
+        )
+        .where(ElderDailyStats.elder_id.in_(elder_ids))
+        .where(ElderDailyStats.day >= start_day)
+        .where(ElderDailyStats.day < end_day)
+        .group_by(ElderDailyStats.elder_id)
+    )
+
+
+def latest_calls_query(elder_ids: list[int]):
+    """
+    어르신별 마지막 통화 조회 쿼리
+    
+    어르신마다 (elder_id, started_at DESC, id DESC) 인덱스에서 첫 항목만 찾으므로
+    통화 기록이 많아도 어르신 수만큼만 읽습니다.
+    
+    Returns:
+        SELECT 구문 (행: Call)
+    """
+    latest = aliased(Call)
+    latest_call_id = (
+        select(latest.id)
+        .where(latest.elder_id == Elder.id)
+        .order_by(latest.started_at.desc(), latest.id.desc())
+        .limit(1)
+        .correlate(Elder)
+        .scalar_subquery()
+    )
+    return (
+        select(Call)
+        .select_from(Elder)
+        .join(Call, Call.id == latest_call_id)
+        .where(Elder.id.in_(elder_ids))
+    )
+
+
+def build_today_status(
+    attempts: int,
+    success: int,
+    next_scheduled_call: NextScheduledCall | None
+) -> TodayStatus:
+    """오늘 통화 수 + 다음 예정 통화로 오늘 상태 결정 (완료 > 남은 예정 통화 > 연결 실패 > 없음)"""
+    if success > 0:
+        today_status = "completed"
+    elif next_scheduled_call and next_scheduled_call.is_today:
+        today_status = "scheduled"
+    elif attempts > 0:
+        today_status = "missed"
+    else:
+        today_status = "none"
+    
+    return TodayStatus(status=today_status, call_attempts=attempts, call_success_count=success)
+
+
+async def get_guardian_overview(
+    db: AsyncSession,
+    user_id: int,
+    now: datetime | None = None
+) -> GuardianOverviewResponse | None:
+    """
+    보호자의 모든 어르신 요약 (마지막 통화, 오늘 상태, 주간 통계, 다음 예정 통화)
+    
+    어르신 수와 상관없이 쿼리 3개로 조회합니다.
+    (어르신 1개 (통화 스케줄은 Elder.schedule_offsets), 어르신별 마지막 통화 1개, 어르신별 일별 집계 합산 1개)
+    
+    Args:
+        db: DB 세션
+        user_id: 보호자 ID
+        now: 현재 시각 (None이면 지금)
+    
+    Returns:
+        GuardianOverviewResponse 또는 None (보호자가 없음)
+    """
+    if now is None:
+        now = datetime.now()
+    week_start, week_end = get_week_range(now)
+    
+    # 1. 어르신 (통화 스케줄 포함)
+    result = await db.execute(
+        select(Elder)
+        .where(Elder.user_id == user_id)
+        .order_by(Elder.id)
+    )
+    elders = result.scalars().all()
+    
+    if not elders:
+        # 어르신이 없을 때만 보호자 존재 여부 확인
+        if await db.get(User, user_id) is None:
+            return None
+        return GuardianOverviewResponse(user_id=user_id, elders=[])
+    
+    elder_ids = [elder.id for elder in elders]
+    
+    # 2. 어르신별 마지막 통화
+    result = await db.execute(latest_calls_query(elder_ids))
+    last_calls = {call.elder_id: call for call in result.scalars()}
+    
+    # 3. 어르신별 주간 통계 + 오늘 통화 수
+    result = await db.execute(
+        weekly_stats_by_elder_query(elder_ids, week_start.date(), week_end.date(), now.date())
+    )
+    stats = {row.elder_id: row for row in result}
+    
+    # 4. 어르신별 응답 구성
+    items = []
+    for elder in elders:
+        # 이번 주 통화가 없는 어르신은 집계 행이 없음
+        row = stats.get(elder.id)
+        if row:
+            weekly_stats = build_weekly_stats(row.attempts, row.success, row.avg_seconds)
+            today_attempts, today_success = int(row.today_attempts), int(row.today_success)
+        else:
+            weekly_stats = build_weekly_stats(0, 0, None)
+            today_attempts, today_success = 0, 0
+        
+        next_scheduled_call = find_next_scheduled_call(elder.schedule_offsets, now)
+        last_call = last_calls.get(elder.id)
+        items.append(ElderOverviewItem(
+            elder=await build_elder_basic_info(elder),
+            last_call=build_recent_call_item(last_call) if last_call else None,
+            today=build_today_status(today_attempts, today_success, next_scheduled_call),
+            weekly_stats=weekly_stats,
+            next_scheduled_call=next_scheduled_call,
+        ))
+    
+    return GuardianOverviewResponse(user_id=user_id, elders=items)
+
+
+def trend_period_start(day: date, granularity: str) -> date:
+    """추이 구간 시작 날짜 (week: 그 주 월요일, month: 그 달 1일)"""
+    if granularity == "month":
+        return day.replace(day=1)
+    return day - timedelta(days=day.weekday())
+
+
+def next_trend_period(period: date, granularity: str) -> date:
+    """다음 추이 구간 시작 날짜"""
+    if granularity == "month":
+        return (period.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return period + timedelta(days=7)
+
+
+def default_trend_range(granularity: str, today: date | None = None) -> tuple[date, date]:
+    """
+    기본 추이 조회 기간 (오늘이 속한 구간까지 최근 TREND_DEFAULT_PERIODS개 구간)
+    
+    Returns:
+        (시작 날짜, 종료 날짜(포함)) 튜플
+    """
+    today = today or datetime.now().date()
+    start = trend_period_start(today, granularity)
+    for _ in range(TREND_DEFAULT_PERIODS - 1):
+        start = trend_period_start(start - timedelta(days=1), granularity)
+    return start, today
+
+
+def _sorted_series(series: dict[str, list[int]], limit: int | None = None) -> dict[str, list[int]]:
+    """구간별 배열을 전체 합계 내림차순(같으면 이름순)으로 정렬하고 상위 limit개만 남김"""
+    keys = sorted(series, key=lambda key: (-sum(series[key]), key))
+    return {key: series[key] for key in keys[:limit]}
+
+
+async def get_trends(
+    db: AsyncSession,
+    elder_id: int,
+    granularity: str,
+    start_day: date,
+    end_day: date,
+    top_tags: int = 10
+) -> TrendsResponse:
+    """
+    감정 분포 / 대화 주제(태그) 추이 계산
+    
+    calls 대신 어르신 일별 집계(elder_daily_stats)를 읽어서 주 / 월 단위로 합산하므로
+    조회 기간의 날짜 수만큼만 읽습니다. 통화가 없는 구간도 0으로 채워서 반환합니다.
+    
+    Args:
+        db: DB 세션
+        elder_id: 어르신 ID
+        granularity: "week" 또는 "month"
+        start_day: 시작 날짜 (포함)
+        end_day: 종료 날짜 (포함)
+        top_tags: 반환할 태그 수 (전체 기간 언급 수 상위)
+    
+    Returns:
+        TrendsResponse 객체
+    """
+    periods = []
+    period = trend_period_start(start_day, granularity)
+    while period <= end_day:
+        periods.append(period)
+        period = next_trend_period(period, granularity)
+    index = {period: i for i, period in enumerate(periods)}
+    
+    size = len(periods)
+    attempts = [0] * size
+    completions = [0] * size
+    duration_totals = [0.0] * size
+    duration_counts = [0] * size
+    emotions: dict[str, list[int]] = {}
+    tags: dict[str, list[int]] = {}
+    
+    rows = await DailyStatsService.get_range(db, elder_id, start_day, end_day + timedelta(days=1))
+    for row in rows:
+        i = index[trend_period_start(row.day, granularity)]
+        attempts[i] += row.attempts
+        completions[i] += row.completions
+        duration_totals[i] += row.total_duration_seconds
+        duration_counts[i] += row.duration_count
+        for emotion, count in row.emotion_counts.items():
+            emotions.setdefault(emotion, [0] * size)[i] += count
+        for tag, count in row.tag_counts.items():
+            tags.setdefault(tag, [0] * size)[i] += count
+    
+    return TrendsResponse(
+        elder_id=elder_id,
+        granularity=granularity,
+        start=start_day,
+        end=end_day,
+        periods=periods,
+        attempts=attempts,
+        completions=completions,
+        avg_duration_minutes=[
+            int(total / count / 60) if count else 0
+            for total, count in zip(duration_totals, duration_counts)
+        ],
+        emotions=_sorted_series(emotions),
+        tags=_sorted_series(tags, top_tags),
+    )
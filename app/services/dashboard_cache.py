@@ -0,0 +1,340 @@
+"""대시보드 응답 캐시
+
+GET /dashboard/{elder_id} 응답(직렬화된 DashboardResponse JSON bytes)을 어르신별로 캐시합니다.
+대시보드 내용은 통화 저장, 통화 일정 변경, 어르신 정보 변경, 날짜 변경 때만 바뀌므로
+- 통화 저장 / 일정 변경 / 어르신 정보 변경 시 invalidate로 바로 삭제
+- 만료 시각은 TTL, 자정(오늘의 하이라이트 / 주간 통계 기준 변경), 다음 예정 통화 시각 중 가장 이른 시각
+
+캐시 항목에는 응답과 함께 ETag(어르신 데이터 버전 + 만료 시각)를 저장해서, 캐시 hit 응답도 같은 ETag로
+조건부 요청(If-None-Match)을 받을 수 있게 합니다. 데이터 버전(Elder.data_version)은 DB에 있으므로
+worker가 여러 개여도 304 판단은 같습니다.
+캐시 hit도 ETag의 데이터 버전을 현재 Elder.data_version과 비교해서, 다른 worker가 invalidate하기 전에
+조회를 시작해서 뒤늦게 저장한 이전 응답은 miss로 처리합니다.
+
+백엔드
+- memory: 프로세스 안의 LRU (worker가 여러 개면 다른 worker의 캐시는 TTL까지 남을 수 있음)
+- redis: 여러 worker / 서버가 공유 (redis 패키지 필요, 로컬에서는 bench.redis_stub 사용 가능)
+"""
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.responses import parse_etags
+from app.db.models.elder import Elder
+
+settings = get_settings()
+
+
+class MemoryCacheBackend:
+    """프로세스 메모리 LRU 캐시 (항목별 만료 시각)"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "max_entries": self.max_entries, "evictions": self.evictions}
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Redis 캐시 (만료는 Redis PX로 처리)"""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("DASHBOARD_CACHE_BACKEND=redis를 사용하려면 redis 패키지를 설치하세요 (pip install redis)") from e
+        self.url = url
+        # 캐시가 느려지면 DB 조회보다 오래 걸리지 않도록 짧은 timeout
+        self._client = redis_asyncio.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self._client.set(key, value, px=max(1, int(ttl_seconds * 1000)))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    def stats(self) -> dict:
+        return {"url": self.url}
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class DashboardCache:
+    """
+    어르신별 대시보드 응답 캐시 + hit rate 집계
+
+    캐시 백엔드 오류(Redis 연결 실패 등)는 miss로 처리하고 대시보드는 DB에서 그대로 조회합니다.
+    """
+
+    def __init__(self, backend, ttl_seconds: int, key_prefix: str = "dashboard"):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        # 조회 도중 invalidate된 응답을 다시 저장하지 않도록 어르신별 invalidate 횟수 기록
+        self._generations: dict[int, int] = {}
+        self.reset_stats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.invalidations = 0
+        self.stale = 0
+        self.errors = 0
+
+    def _key(self, elder_id: int) -> str:
+        return f"{self.key_prefix}:{elder_id}"
+
+    def generation(self, elder_id: int) -> int:
+        """현재 invalidate 횟수 (set 호출 시 함께 넘김)"""
+        return self._generations.get(elder_id, 0)
+
+    async def get(self, elder_id: int, data_version: int | None) -> tuple[str, bytes] | None:
+        """
+        캐시된 대시보드 응답 조회
+
+        Args:
+            elder_id: 어르신 ID
+            data_version: 현재 Elder.data_version (캐시된 응답의 버전과 다르면 miss)
+
+        Returns:
+            (ETag, 직렬화된 DashboardResponse) 튜플 또는 None
+        """
+        if not self.enabled:
+            return None
+        try:
+            value = await self.backend.get(self._key(elder_id))
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ 대시보드 캐시 조회 실패 (elder_id: {elder_id}): {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+        # 저장 형식: ETag + 줄바꿈 + 응답 (ETag에는 줄바꿈이 없음)
+        etag, _, body = value.partition(b"\n")
+        etag = etag.decode()
+        if data_version is None or dashboard_etag_version(etag, elder_id) != data_version:
+            # 다른 worker에서 invalidate된 뒤 저장된 이전 버전 응답
+            self.stale += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        return etag, body
+
+    async def set(
+        self,
+        elder_id: int,
+        value: bytes,
+        generation: int,
+        expires_at: datetime | None = None,
+        etag: str = ""
+    ) -> None:
+        """
+        대시보드 응답 저장
+
+        Args:
+            elder_id: 어르신 ID
+            value: 직렬화된 DashboardResponse
+            generation: 조회를 시작할 때의 generation(elder_id) 값 (그 사이 invalidate되었으면 저장하지 않음)
+            expires_at: 내용이 바뀌는 시각 (TTL보다 이르면 이 시각에 만료)
+            etag: 응답의 ETag (dashboard_etag)
+        """
+        if not self.enabled or generation != self.generation(elder_id):
+            return
+
+        ttl_seconds = float(self.ttl_seconds)
+        if expires_at is not None:
+            ttl_seconds = min(ttl_seconds, (expires_at - datetime.now()).total_seconds())
+        if ttl_seconds <= 0:
+            return
+
+        try:
+            await self.backend.set(self._key(elder_id), etag.encode() + b"\n" + value, ttl_seconds)
+            self.sets += 1
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ 대시보드 캐시 저장 실패 (elder_id: {elder_id}): {e}")
+
+    async def invalidate(self, elder_id: int) -> None:
+        """
+        어르신의 캐시된 대시보드 응답 삭제 (통화 저장 / 일정 변경 / 어르신 정보 변경 시 호출)
+
+        Args:
+            elder_id: 어르신 ID
+        """
+        self._generations[elder_id] = self.generation(elder_id) + 1
+        self.invalidations += 1
+        if not self.enabled:
+            return
+        try:
+            await self.backend.delete(self._key(elder_id))
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ 대시보드 캐시 삭제 실패 (elder_id: {elder_id}): {e}")
+
+    def stats(self) -> dict:
+        """hit rate 등 캐시 통계 (프로세스 기준)"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "sets": self.sets,
+            "invalidations": self.invalidations,
+            "stale": self.stale,
+            "errors": self.errors,
+            **self.backend.stats(),
+        }
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+def dashboard_expires_at(next_scheduled_call: datetime | None, now: datetime | None = None) -> datetime:
+    """
+    대시보드 내용이 시간 경과만으로 바뀌는 시각
+
+    자정에는 오늘의 하이라이트 / 서비스 경과일 / (월요일이면) 주간 통계와 일정이,
+    다음 예정 통화 시각에는 next_scheduled_call이 바뀝니다.
+
+    Args:
+        next_scheduled_call: 다음 예정 통화 시각
+        now: 현재 시각 (None이면 지금)
+
+    Returns:
+        둘 중 이른 시각
+    """
+    now = now or datetime.now()
+    next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    if next_scheduled_call is not None and next_scheduled_call < next_midnight:
+        return next_scheduled_call
+    return next_midnight
+
+
+async def bump_dashboard_versions(db: AsyncSession, elder_ids: Iterable[int]) -> None:
+    """
+    어르신 데이터 버전(Elder.data_version) 증가 (커밋은 호출하는 쪽에서, 내용을 바꾸는 트랜잭션 안에서)
+
+    대시보드 내용이 바뀌는 곳(통화 저장 / 일정 변경 / 어르신 정보 변경)에서 invalidate와 함께 호출합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        elder_ids: 어르신 ID
+    """
+    elder_ids = list(set(elder_ids))
+    if not elder_ids:
+        return
+    await db.execute(
+        update(Elder)
+        .where(Elder.id.in_(elder_ids))
+        .values(data_version=Elder.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def dashboard_etag(elder_id: int, data_version: int, expires_at: datetime) -> str:
+    """
+    대시보드 응답의 ETag (weak)
+
+    데이터 버전이 같아도 expires_at(dashboard_expires_at)이 지나면 내용이 바뀌므로 만료 시각을 함께 넣습니다.
+    """
+    return f'W/"dashboard-{elder_id}-{data_version}-{int(expires_at.timestamp())}"'
+
+
+def dashboard_etag_version(etag: str, elder_id: int) -> int | None:
+    """dashboard_etag로 만든 ETag의 데이터 버전 (형식이 다르면 None)"""
+    prefix = f'W/"dashboard-{elder_id}-'
+    if not etag.startswith(prefix):
+        return None
+    version, _, _ = etag[len(prefix):].partition("-")
+    return int(version) if version.isdigit() else None
+
+
+def match_dashboard_etag(
+    if_none_match: str | None,
+    elder_id: int,
+    data_version: int,
+    now: datetime | None = None
+) -> str | None:
+    """
+    If-None-Match의 ETag 중 아직 유효한 대시보드 ETag 찾기
+
+    Args:
+        if_none_match: If-None-Match 헤더 값
+        elder_id: 어르신 ID
+        data_version: 현재 Elder.data_version
+        now: 현재 시각 (None이면 지금)
+
+    Returns:
+        버전이 같고 만료 시각이 지나지 않은 ETag (304 응답에 그대로 사용) 또는 None
+    """
+    now = now or datetime.now()
+    prefix = f"dashboard-{elder_id}-{data_version}-"
+    for tag in parse_etags(if_none_match):
+        expires = tag[len(prefix):]
+        if tag.startswith(prefix) and expires.isdigit() and int(expires) > now.timestamp():
+            return f'W/"{tag}"'
+    return None
+
+
+def create_dashboard_cache() -> DashboardCache:
+    """설정(DASHBOARD_CACHE_*)에 맞는 백엔드로 캐시 생성"""
+    if settings.DASHBOARD_CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(settings.DASHBOARD_CACHE_REDIS_URL)
+    elif settings.DASHBOARD_CACHE_BACKEND == "memory":
+        backend = MemoryCacheBackend(settings.DASHBOARD_CACHE_MAX_ENTRIES)
+    else:
+        raise ValueError(f"지원하지 않는 DASHBOARD_CACHE_BACKEND입니다: {settings.DASHBOARD_CACHE_BACKEND}")
+    return DashboardCache(backend, ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS)
+
+
+# 앱 전체에서 공유하는 캐시
+dashboard_cache = create_dashboard_cache()
@@ -0,0 +1,140 @@
+"""대시보드 실시간 이벤트 (SSE) in-process fan-out
+
+통화 저장 / 실시간 통화 상태 변경을 어르신별로 구독 중인 대시보드 연결에 전달합니다.
+대시보드는 이벤트를 받았을 때만 GET /dashboard/{elder_id}를 다시 호출하면 되므로
+열려 있는 연결은 DB를 조회하지 않는 idle 연결로만 남습니다.
+
+- 구독자별 bounded queue (가득 차면 가장 오래된 이벤트부터 버림)
+- 프로세스 메모리 안에서만 전달되므로 worker가 여러 개면 같은 worker의 구독자만 받음
+"""
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Iterable
+
+import orjson
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# 이벤트 타입
+CALL_SAVED_EVENT = "call.saved"
+CALL_LIVE_EVENT = "call.live"
+LIVE_SNAPSHOT_EVENT = "live.snapshot"
+
+# SSE 응답 헤더 (프록시 버퍼링 방지)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+class DashboardEventBroker:
+    """
+    어르신 ID별 구독자 queue 관리
+
+    publish는 이벤트 루프 안에서 동기로 호출하며 구독자 수만큼 put_nowait만 수행합니다.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+
+    def subscribe(self, elder_ids: Iterable[int]) -> asyncio.Queue:
+        """
+        어르신들의 이벤트 구독
+
+        Args:
+            elder_ids: 구독할 어르신 ID들
+
+        Returns:
+            이벤트를 받을 queue (사용 후 unsubscribe 필요)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        for elder_id in elder_ids:
+            self._subscribers.setdefault(elder_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue, elder_ids: Iterable[int]) -> None:
+        """구독 해제"""
+        for elder_id in elder_ids:
+            queues = self._subscribers.get(elder_id)
+            if queues is None:
+                continue
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[elder_id]
+
+    def publish(self, elder_id: int, event: str, data: dict) -> int:
+        """
+        어르신 구독자들에게 이벤트 전달
+
+        Args:
+            elder_id: 어르신 ID
+            event: 이벤트 타입 (call.saved, call.live)
+            data: 이벤트 데이터
+
+        Returns:
+            전달한 구독자 수
+        """
+        queues = self._subscribers.get(elder_id)
+        if not queues:
+            return 0
+
+        # 구독자 수와 무관하게 직렬화는 한 번만
+        message = format_sse(event, {"elder_id": elder_id, **data})
+        for queue in queues:
+            if queue.full():
+                # 느린 구독자는 오래된 이벤트를 버림 (대시보드는 최신 이벤트만 보고 다시 조회)
+                queue.get_nowait()
+            queue.put_nowait(message)
+        return len(queues)
+
+    def subscriber_count(self) -> int:
+        """현재 구독 중인 연결 수 (중복 제외)"""
+        return len({id(queue) for queues in self._subscribers.values() for queue in queues})
+
+
+def format_sse(event: str, data: dict) -> bytes:
+    """SSE 메시지 포맷 (event + 한 줄 JSON data)"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def stream_events(
+    elder_ids: list[int],
+    initial_events: list[bytes] = (),
+) -> AsyncIterator[bytes]:
+    """
+    SSE 응답 body generator
+
+    연결이 끊기면 (generator 취소/종료) 구독을 해제합니다.
+    이벤트가 없는 동안에는 DASHBOARD_EVENTS_KEEPALIVE_SECONDS마다 comment를 보내
+    프록시의 idle timeout을 막습니다.
+
+    Args:
+        elder_ids: 구독할 어르신 ID들
+        initial_events: 연결 직후 보낼 이벤트 (현재 실시간 통화 상태 등)
+
+    Yields:
+        SSE 메시지 bytes
+    """
+    queue = dashboard_event_broker.subscribe(elder_ids)
+    try:
+        yield f"retry: {settings.DASHBOARD_EVENTS_RETRY_MS}\n\n".encode()
+        for message in initial_events:
+            yield message
+
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=settings.DASHBOARD_EVENTS_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield f": keepalive {datetime.now().isoformat()}\n\n".encode()
+                continue
+            yield message
+    finally:
+        dashboard_event_broker.unsubscribe(queue, elder_ids)
+
+
+dashboard_event_broker = DashboardEventBroker(queue_size=settings.DASHBOARD_EVENTS_QUEUE_SIZE)
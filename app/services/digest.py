@@ -0,0 +1,163 @@
+"""보호자 통화 리포트 digest
+
+report_email_mode='digest'인 보호자는 통화마다 이메일을 받지 않고,
+digest_interval_hours마다 그 사이에 저장된 통화를 한 통의 이메일로 받습니다.
+digest에 포함할 통화는 Call 저장과 같은 트랜잭션에서 digest_pending으로 표시되므로
+늦게 커밋된 통화도 ID 순서와 상관없이 다음 digest에 포함됩니다.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.call import Call
+from app.db.models.elder import Elder
+from app.db.models.user import User
+from app.services.email_outbox import EmailOutboxService
+
+REPORT_EMAIL_MODES = ("instant", "digest")
+
+# 스케줄러 실행 시각이 조금씩 밀려도 한 주기를 건너뛰지 않도록 허용하는 오차
+DIGEST_DUE_TOLERANCE = timedelta(minutes=5)
+
+
+class DigestService:
+
+    @staticmethod
+    def _is_due(user_row, now: datetime) -> bool:
+        """마지막 digest 이후 digest_interval_hours가 지났는지 확인"""
+        if user_row.last_digest_at is None:
+            return True
+        # naive(SQLite) / aware(PostgreSQL) 모두 로컬 시간 기준으로 비교
+        elapsed = now.astimezone() - user_row.last_digest_at.astimezone()
+        return elapsed >= timedelta(hours=user_row.digest_interval_hours) - DIGEST_DUE_TOLERANCE
+
+    @staticmethod
+    async def build_due_digests(
+        db: AsyncSession,
+        now: datetime | None = None,
+        user_id: int | None = None
+    ) -> dict[str, int]:
+        """
+        발송 주기가 된 digest 모드 보호자들의 digest 이메일을 발송 대기열에 추가
+
+        아직 digest에 포함되지 않은(digest_pending) 통화를 한 번의 쿼리로 모두 가져와서
+        보호자별로 묶고, 이메일 대기열 추가와 포함된 통화의 digest_pending 해제를 한 트랜잭션으로 커밋합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            now: 기준 시각 (기본값: 현재 시각)
+            user_id: 지정하면 해당 보호자만 주기와 상관없이 바로 생성
+
+        Returns:
+            {"digests", "calls"} 개수
+        """
+        now = now or datetime.now()
+
+        # 모드 변경 중에 저장된 통화도 빠지지 않도록 보호자의 현재 모드가 아니라 통화의 표시로 조회
+        filters = [Call.digest_pending.is_(True)]
+        if user_id is not None:
+            filters.append(User.id == user_id)
+
+        # 1. 대기 중인 통화 (보호자별, 시간순)
+        result = await db.execute(
+            select(
+                User.id.label("user_id"),
+                User.email,
+                User.digest_interval_hours,
+                User.last_digest_at,
+                Call.id.label("call_id"),
+                Call.elder_id,
+                Call.started_at,
+                Call.summary,
+                Call.emotion,
+                Elder.name.label("elder_name"),
+            )
+            .select_from(Call)
+            .join(User, User.id == Call.user_id)
+            .join(Elder, Elder.id == Call.elder_id)
+            .where(*filters)
+            .order_by(User.id, Call.started_at)
+        )
+
+        pending: dict[int, list] = {}
+        for row in result.all():
+            pending.setdefault(row.user_id, []).append(row)
+
+        # 2. 주기가 된 보호자만 digest 생성
+        digested_users = []
+        digested_call_ids = []
+        for pending_user_id, rows in pending.items():
+            first = rows[0]
+            if user_id is None and not DigestService._is_due(first, now):
+                continue
+
+            EmailOutboxService.enqueue_call_digest(
+                db,
+                email=first.email,
+                calls=[
+                    {
+                        "elder_name": row.elder_name,
+                        "call_id": row.call_id,
+                        "elder_id": row.elder_id,
+                        "started_at": row.started_at,
+                        "summary": row.summary,
+                        "emotion": row.emotion,
+                    }
+                    for row in rows
+                ],
+                interval_hours=first.digest_interval_hours
+            )
+            digested_users.append({"id": pending_user_id, "last_digest_at": now})
+            digested_call_ids.extend(row.call_id for row in rows)
+
+        # 3. 포함된 통화 표시 해제 + 보호자별 마지막 digest 시각 갱신 (primary key 기준 bulk update)
+        if digested_users:
+            await db.execute(
+                update(Call)
+                .where(Call.id.in_(digested_call_ids))
+                .values(digest_pending=False)
+            )
+            await db.execute(update(User), digested_users)
+
+        await db.commit()
+        return {"digests": len(digested_users), "calls": len(digested_call_ids)}
+
+    @staticmethod
+    async def update_report_settings(
+        db: AsyncSession,
+        user: User,
+        mode: str,
+        digest_interval_hours: int | None = None
+    ) -> User:
+        """
+        보호자의 통화 리포트 이메일 수신 방식 변경
+
+        digest 모드로 바꾼 뒤 저장되는 통화부터 digest에 포함되고 (이미 개별 이메일로 받은 통화는
+        digest_pending이 아니므로 제외), instant로 바꿀 때는 아직 보내지 않은 digest를 바로 보냅니다.
+
+        Args:
+            db: 데이터베이스 세션
+            user: 보호자
+            mode: instant 또는 digest
+            digest_interval_hours: digest 발송 주기 (None이면 기존 값 유지)
+
+        Returns:
+            변경된 User 객체
+        """
+        if mode not in REPORT_EMAIL_MODES:
+            raise ValueError(f"지원하지 않는 수신 방식입니다: {mode}")
+
+        if mode == "instant" and user.report_email_mode == "digest":
+            await DigestService.build_due_digests(db, user_id=user.id)
+        
+        if mode == "digest" and user.report_email_mode != "digest":
+            user.last_digest_at = datetime.now()
+
+        user.report_email_mode = mode
+        if digest_interval_hours is not None:
+            user.digest_interval_hours = digest_interval_hours
+
+        await db.commit()
+        await db.refresh(user)
+        return user
@@ -6,6 +6,7 @@ from sqlalchemy import select
 from app.db.models.elder import Elder
 from app.db.models.user import User
 from app.schemas.elder import ElderCreate
+from app.services.dashboard_cache import dashboard_cache, bump_dashboard_versions
 
 
 class ElderService:
@@ -187,8 +188,10 @@ class ElderService:
         # 새로운 초대 코드 생성 및 할당
         elder.invite_code = ElderService._generate_invite_code()
         
+        await bump_dashboard_versions(db, [elder.id])
         await db.commit()
         await db.refresh(elder)
+        await dashboard_cache.invalidate(elder.id)
         
         return elder
     
@@ -229,9 +232,13 @@ class ElderService:
         # 4. voip_device_token 업데이트
         elder.voip_device_token = voip_device_token
         
-        # 5. commit 및 refresh
+        # 5. 대시보드 데이터 버전 증가 후 commit 및 refresh
+        await bump_dashboard_versions(db, [elder.id])
         await db.commit()
         await db.refresh(elder)
         
+        # 6. 캐시된 대시보드 삭제
+        await dashboard_cache.invalidate(elder.id)
+        
         return elder
 
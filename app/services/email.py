@@ -1,12 +1,127 @@
-"""이메일 전송 서비스 (SendGrid)"""
+"""이메일 전송 서비스 (SendGrid)
+
+- HTML 템플릿은 처음 사용할 때 한 번만 읽고 {{PLACEHOLDER}} 위치를 미리 분리해 둠
+- SendGrid v3 API는 공유 httpx.AsyncClient로 직접 호출 (연결 재사용, 동시 전송 수 제한)
+"""
 import asyncio
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Email, To, Content
+import html
+import re
+from functools import lru_cache
 from pathlib import Path
+
+import httpx
+
 from app.core.config import get_settings
 
 settings = get_settings()
 
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+SENDGRID_MAIL_SEND_PATH = "/v3/mail/send"
+
+
+class EmailTemplate:
+    """
+    미리 컴파일된 HTML 템플릿
+
+    템플릿을 고정 문자열 / placeholder 이름 조각으로 나눠 두고
+    render 시 한 번의 join으로 치환합니다.
+    """
+
+    def __init__(self, html: str):
+        # re.split 결과: [문자열, 이름, 문자열, 이름, ..., 문자열]
+        self.parts = PLACEHOLDER_PATTERN.split(html)
+        self.placeholders = set(self.parts[1::2])
+
+    def render(self, values: dict[str, str]) -> str:
+        """
+        placeholder 치환
+
+        Args:
+            values: {"ELDER_NAME": "김영희", ...} (없는 placeholder는 그대로 남김)
+
+        Returns:
+            렌더링된 HTML
+        """
+        parts = self.parts[:]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = values[name] if name in values else f"{{{{{name}}}}}"
+        return "".join(parts)
+
+
+@lru_cache()
+def get_template(name: str) -> EmailTemplate:
+    """app/templates의 HTML 템플릿 로드 (프로세스당 한 번만 읽음)"""
+    return EmailTemplate((TEMPLATE_DIR / name).read_text(encoding="utf-8"))
+
+
+_sendgrid_client: httpx.AsyncClient | None = None
+_sendgrid_semaphore: asyncio.Semaphore | None = None
+
+
+def get_sendgrid_client() -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """
+    공유 SendGrid HTTP 클라이언트와 동시 전송 제한 semaphore 반환 (처음 호출 시 생성)
+
+    연결 풀 크기와 semaphore 모두 SENDGRID_MAX_CONCURRENCY로 제한합니다.
+    """
+    global _sendgrid_client, _sendgrid_semaphore
+    
+    if _sendgrid_client is None or _sendgrid_client.is_closed:
+        _sendgrid_client = httpx.AsyncClient(
+            base_url=settings.SENDGRID_API_URL,
+            headers={"Authorization": f"Bearer {settings.SENDGRID_API_KEY}"},
+            timeout=settings.SENDGRID_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.SENDGRID_MAX_CONCURRENCY,
+                max_keepalive_connections=settings.SENDGRID_MAX_CONCURRENCY,
+            ),
+        )
+        _sendgrid_semaphore = asyncio.Semaphore(settings.SENDGRID_MAX_CONCURRENCY)
+    
+    return _sendgrid_client, _sendgrid_semaphore
+
+
+async def close_sendgrid_client() -> None:
+    """공유 SendGrid HTTP 클라이언트 종료 (서버 종료 시)"""
+    global _sendgrid_client
+    
+    if _sendgrid_client is not None:
+        await _sendgrid_client.aclose()
+        _sendgrid_client = None
+
+
+async def send_mail(payload: dict) -> httpx.Response:
+    """
+    SendGrid v3 /mail/send 호출
+    
+    Args:
+        payload: SendGrid v3 mail send 요청 body
+        
+    Returns:
+        httpx.Response (성공 시 202)
+        
+    Raises:
+        httpx.HTTPError: 네트워크 에러 또는 2xx가 아닌 응답
+    """
+    client, semaphore = get_sendgrid_client()
+    async with semaphore:
+        response = await client.post(SENDGRID_MAIL_SEND_PATH, json=payload)
+    response.raise_for_status()
+    return response
+
+
+def build_mail_payload(to_email: str, subject: str, html_content: str) -> dict:
+    """수신자 한 명에게 보내는 SendGrid v3 요청 body 생성"""
+    return {
+        "personalizations": [{"to": [{"email": to_email}]}],
+        "from": {"email": settings.EMAIL_FROM},
+        "subject": subject,
+        "content": [{"type": "text/html", "value": html_content}],
+    }
+
 
 async def send_auth_code_email(email: str, code: str) -> bool:
     """
@@ -34,26 +149,15 @@ async def send_auth_code_email(email: str, code: str) -> bool:
             return True
         
         # 프로덕션: 실제 SendGrid로 전송
-        # HTML 템플릿 로드
-        template_path = Path(__file__).parent.parent / "templates" / "auth_code_email.html"
-        with open(template_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-        
-        # 코드 치환
-        html_content = html_content.replace("{{CODE}}", code)
-        
-        # SendGrid 메시지 생성
-        message = Mail(
-            from_email=Email(settings.EMAIL_FROM),
-            to_emails=To(email),
-            subject=f"[소리AI] 인증 코드: {code}",
-            html_content=Content("text/html", html_content)
-        )
+        # HTML 템플릿 렌더링 (캐시된 템플릿)
+        html_content = get_template("auth_code_email.html").render({"CODE": code})
         
-        # SendGrid API 클라이언트 생성 및 전송
-        # SendGrid는 동기 API이므로 asyncio.to_thread로 비동기 처리
-        sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        response = await asyncio.to_thread(sg.send, message)
+        # SendGrid 전송 (공유 클라이언트)
+        response = await send_mail(build_mail_payload(
+            to_email=email,
+            subject=f"[소리AI] 인증 코드: {code}",
+            html_content=html_content
+        ))
         
         print(f"📧 Email sent successfully to {email}")
         print(f"   Code: {code}")
@@ -70,6 +174,156 @@ async def send_auth_code_email(email: str, code: str) -> bool:
         return False
 
 
+CALL_REPORT_TEMPLATE = "call_report_email.html"
+
+# 감정 상태 매핑
+EMOTION_MAP = {
+    "calm": ("평온", "calm"),
+    "happy": ("행복", "happy"),
+    "sad": ("슬픔", "sad"),
+    "anxious": ("불안", "anxious"),
+    "worried": ("걱정", "anxious"),
+}
+
+
+def build_call_report_values(
+    elder_name: str,
+    call_id: int,
+    elder_id: int,
+    summary: str | None,
+    emotion: str | None
+) -> dict[str, str]:
+    """
+    통화 리포트 이메일 템플릿 치환 값 생성
+    
+    Args:
+        elder_name: 어르신 이름
+        call_id: 통화 ID
+        elder_id: 어르신 ID
+        summary: 통화 요약
+        emotion: 감정 상태
+        
+    Returns:
+        {"ELDER_NAME", "EMOTION_TEXT", "EMOTION_CLASS", "SUMMARY", "CALL_DETAIL_URL", "DASHBOARD_URL"}
+    """
+    emotion_text, emotion_class = EMOTION_MAP.get(
+        emotion.lower() if emotion else "",
+        ("알 수 없음", "neutral")
+    )
+    
+    # 요약이 없으면 기본 메시지
+    summary_text = summary if summary else "통화 요약을 생성하지 못했습니다. 자세한 내용은 통화 상세 페이지에서 확인하세요."
+    
+    return {
+        "ELDER_NAME": elder_name,
+        "EMOTION_TEXT": emotion_text,
+        "EMOTION_CLASS": emotion_class,
+        "SUMMARY": summary_text,
+        "CALL_DETAIL_URL": f"{settings.WEB_URL}/call-list/{elder_id}/{call_id}",
+        "DASHBOARD_URL": f"{settings.WEB_URL}/dashboard/{elder_id}",
+    }
+
+
+def call_report_subject(elder_name: str) -> str:
+    """통화 리포트 이메일 제목"""
+    return f"[소리AI] {elder_name}님과의 통화가 완료되었습니다"
+
+
+def substitution_tag(name: str) -> str:
+    """SendGrid substitution 태그 (템플릿의 {{NAME}} 자리에 들어감)"""
+    return f"-{name}-"
+
+
+def substitutions_size(values: dict[str, str]) -> int:
+    """personalization 하나의 substitutions 크기 (bytes, SendGrid 제한 확인용)"""
+    return sum(len(substitution_tag(name).encode()) + len(value.encode()) for name, value in values.items())
+
+
+def build_multi_mail_payload(template_name: str, recipients: list[tuple[str, str, dict[str, str]]]) -> dict:
+    """
+    같은 템플릿의 이메일 여러 건을 한 번에 보내는 SendGrid v3 요청 body 생성
+    
+    본문은 placeholder 자리에 substitution 태그를 넣어 한 번만 렌더링하고,
+    수신자별 값은 personalizations[].substitutions로 전달합니다.
+    
+    Args:
+        template_name: app/templates의 HTML 템플릿 파일명
+        recipients: (수신자 이메일, 제목, 템플릿 치환 값) 리스트 (최대 SENDGRID_MAX_PERSONALIZATIONS개)
+        
+    Returns:
+        SendGrid v3 mail send 요청 body
+    """
+    template = get_template(template_name)
+    html_content = template.render({name: substitution_tag(name) for name in template.placeholders})
+    
+    return {
+        "personalizations": [
+            {
+                "to": [{"email": to_email}],
+                "subject": subject,
+                "substitutions": {substitution_tag(name): value for name, value in values.items()},
+            }
+            for to_email, subject, values in recipients
+        ],
+        "from": {"email": settings.EMAIL_FROM},
+        "subject": recipients[0][1],
+        "content": [{"type": "text/html", "value": html_content}],
+    }
+
+
+CALL_DIGEST_TEMPLATE = "call_digest_email.html"
+
+# digest 이메일의 통화 한 건 (CALL_ITEMS에 이어 붙임)
+DIGEST_ITEM_TEMPLATE = EmailTemplate(
+    '<div class="digest-item">'
+    '<div class="digest-meta">{{CALL_TIME}} · {{ELDER_NAME}} · '
+    '<span class="emotion {{EMOTION_CLASS}}">{{EMOTION_TEXT}}</span></div>'
+    '<div>{{SUMMARY}}</div>'
+    '<a href="{{CALL_DETAIL_URL}}" class="digest-link">통화 상세 보기 →</a>'
+    '</div>'
+)
+
+
+def build_call_digest_values(calls: list[dict], interval_hours: int) -> dict[str, str]:
+    """
+    digest 이메일 템플릿 치환 값 생성
+    
+    Args:
+        calls: {"elder_name", "call_id", "elder_id", "started_at", "summary", "emotion"} 리스트 (시간순)
+        interval_hours: digest 발송 주기
+        
+    Returns:
+        {"PERIOD_TEXT", "CALL_COUNT", "CALL_ITEMS", "DASHBOARD_URL"}
+    """
+    items = []
+    for call in calls:
+        values = build_call_report_values(
+            call["elder_name"], call["call_id"], call["elder_id"], call["summary"], call["emotion"]
+        )
+        values["CALL_TIME"] = call["started_at"].strftime("%m월 %d일 %H:%M")
+        # 여러 건을 HTML로 이어 붙이므로 사용자 입력 값은 escape
+        items.append(DIGEST_ITEM_TEMPLATE.render({name: html.escape(value) for name, value in values.items()}))
+    
+    return {
+        "PERIOD_TEXT": call_digest_period_text(interval_hours),
+        "CALL_COUNT": str(len(calls)),
+        "CALL_ITEMS": "".join(items),
+        "DASHBOARD_URL": settings.WEB_URL,
+    }
+
+
+def call_digest_period_text(interval_hours: int) -> str:
+    """digest 기간 표시 ("지난 하루 동안", "지난 12시간 동안")"""
+    if interval_hours == 24:
+        return "지난 하루 동안"
+    return f"지난 {interval_hours}시간 동안"
+
+
+def call_digest_subject(call_count: int) -> str:
+    """digest 이메일 제목"""
+    return f"[소리AI] 통화 리포트 {call_count}건이 도착했습니다"
+
+
 async def send_call_report_email(
     email: str,
     elder_name: str,
@@ -95,26 +349,7 @@ async def send_call_report_email(
         bool: 전송 성공 여부
     """
     try:
-        # 감정 상태 매핑
-        emotion_map = {
-            "calm": ("평온", "calm"),
-            "happy": ("행복", "happy"),
-            "sad": ("슬픔", "sad"),
-            "anxious": ("불안", "anxious"),
-            "worried": ("걱정", "anxious"),
-        }
-        
-        emotion_text, emotion_class = emotion_map.get(
-            emotion.lower() if emotion else "",
-            ("알 수 없음", "neutral")
-        )
-        
-        # URL 생성
-        call_detail_url = f"{settings.WEB_URL}/call-list/{elder_id}/{call_id}"
-        dashboard_url = f"{settings.WEB_URL}/dashboard/{elder_id}"
-        
-        # 요약이 없으면 기본 메시지
-        summary_text = summary if summary else "통화 요약을 생성하지 못했습니다. 자세한 내용은 통화 상세 페이지에서 확인하세요."
+        values = build_call_report_values(elder_name, call_id, elder_id, summary, emotion)
         
         # DEBUG 모드일 때는 콘솔에만 출력
         if settings.DEBUG:
@@ -122,41 +357,25 @@ async def send_call_report_email(
             print("🔍 [DEBUG MODE] 통화 리포트 이메일 전송 스킵 (콘솔 출력만)")
             print("=" * 60)
             print(f"📧 To: {email}")
-            print(f"📝 Subject: [소리AI] {elder_name}님과의 통화가 완료되었습니다")
+            print(f"📝 Subject: {call_report_subject(elder_name)}")
             print(f"👤 어르신: {elder_name}")
-            print(f"💭 감정: {emotion_text}")
-            print(f"📄 요약: {summary_text[:100]}...")
-            print(f"🔗 통화 상세: {call_detail_url}")
-            print(f"🔗 대시보드: {dashboard_url}")
+            print(f"💭 감정: {values['EMOTION_TEXT']}")
+            print(f"📄 요약: {values['SUMMARY'][:100]}...")
+            print(f"🔗 통화 상세: {values['CALL_DETAIL_URL']}")
+            print(f"🔗 대시보드: {values['DASHBOARD_URL']}")
             print("=" * 60)
             return True
         
         # 프로덕션: 실제 SendGrid로 전송
-        # HTML 템플릿 로드
-        template_path = Path(__file__).parent.parent / "templates" / "call_report_email.html"
-        with open(template_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-        
-        # 템플릿 변수 치환
-        html_content = html_content.replace("{{ELDER_NAME}}", elder_name)
-        html_content = html_content.replace("{{EMOTION_TEXT}}", emotion_text)
-        html_content = html_content.replace("{{EMOTION_CLASS}}", emotion_class)
-        html_content = html_content.replace("{{SUMMARY}}", summary_text)
-        html_content = html_content.replace("{{CALL_DETAIL_URL}}", call_detail_url)
-        html_content = html_content.replace("{{DASHBOARD_URL}}", dashboard_url)
-        
-        # SendGrid 메시지 생성
-        message = Mail(
-            from_email=Email(settings.EMAIL_FROM),
-            to_emails=To(email),
-            subject=f"[소리AI] {elder_name}님과의 통화가 완료되었습니다",
-            html_content=Content("text/html", html_content)
-        )
+        # HTML 템플릿 렌더링 (캐시된 템플릿)
+        html_content = get_template(CALL_REPORT_TEMPLATE).render(values)
         
-        # SendGrid API 클라이언트 생성 및 전송
-        # SendGrid는 동기 API이므로 asyncio.to_thread로 비동기 처리
-        sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        response = await asyncio.to_thread(sg.send, message)
+        # SendGrid 전송 (공유 클라이언트)
+        response = await send_mail(build_mail_payload(
+            to_email=email,
+            subject=call_report_subject(elder_name),
+            html_content=html_content
+        ))
         
         print(f"📧 Call report email sent successfully to {email}")
         print(f"   Elder: {elder_name}")
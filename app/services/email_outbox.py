@@ -0,0 +1,261 @@
+"""이메일 발송 대기열 (outbox)
+
+통화 리포트 / digest 이메일은 Call(또는 digest에 포함된 통화 표시)과 같은 트랜잭션에서 email_outbox에 기록하고,
+스케줄러가 주기적으로 batch 단위로 발송합니다.
+- 같은 템플릿의 이메일은 SendGrid personalizations로 한 요청에 묶어서 발송
+- 실패 시 지수 backoff로 재시도, EMAIL_OUTBOX_MAX_ATTEMPTS회 실패하면 failed로 표시
+- 발송 중인 행은 next_attempt_at을 lease로 미뤄두므로 프로세스가 죽어도 lease 후 다시 발송
+"""
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.models.email_outbox import EmailOutbox
+from app.services.email import (
+    CALL_REPORT_TEMPLATE,
+    CALL_DIGEST_TEMPLATE,
+    build_call_report_values,
+    build_call_digest_values,
+    call_report_subject,
+    call_digest_subject,
+    get_template,
+    build_mail_payload,
+    build_multi_mail_payload,
+    substitutions_size,
+    send_mail,
+)
+
+
+class EmailOutboxService:
+
+    SETTINGS = get_settings()
+
+    KIND_CALL_REPORT = "call_report"
+    KIND_CALL_DIGEST = "call_digest"
+
+    # kind별 HTML 템플릿
+    TEMPLATES = {
+        KIND_CALL_REPORT: CALL_REPORT_TEMPLATE,
+        KIND_CALL_DIGEST: CALL_DIGEST_TEMPLATE,
+    }
+
+    # SendGrid personalization 하나의 substitutions 최대 크기
+    MAX_SUBSTITUTIONS_BYTES = 10000
+
+    @staticmethod
+    def enqueue_call_report(
+        db: AsyncSession,
+        email: str,
+        elder_name: str,
+        call_id: int,
+        elder_id: int,
+        summary: str | None,
+        emotion: str | None
+    ) -> EmailOutbox:
+        """
+        통화 리포트 이메일을 발송 대기열에 추가 (커밋은 호출하는 쪽에서)
+
+        Args:
+            db: 데이터베이스 세션
+            email: 수신자 이메일 (보호자)
+            elder_name: 어르신 이름
+            call_id: 통화 ID
+            elder_id: 어르신 ID
+            summary: 통화 요약
+            emotion: 감정 상태
+
+        Returns:
+            추가된 EmailOutbox 객체
+        """
+        row = EmailOutbox(
+            kind=EmailOutboxService.KIND_CALL_REPORT,
+            to_email=email,
+            call_id=call_id,
+            payload={
+                "subject": call_report_subject(elder_name),
+                "values": build_call_report_values(elder_name, call_id, elder_id, summary, emotion),
+            },
+        )
+        db.add(row)
+        return row
+
+    @staticmethod
+    def enqueue_call_digest(
+        db: AsyncSession,
+        email: str,
+        calls: list[dict],
+        interval_hours: int
+    ) -> EmailOutbox:
+        """
+        통화 리포트 digest 이메일을 발송 대기열에 추가 (커밋은 호출하는 쪽에서)
+
+        Args:
+            db: 데이터베이스 세션
+            email: 수신자 이메일 (보호자)
+            calls: digest에 포함할 통화 리스트 (build_call_digest_values 참고)
+            interval_hours: digest 발송 주기
+
+        Returns:
+            추가된 EmailOutbox 객체
+        """
+        row = EmailOutbox(
+            kind=EmailOutboxService.KIND_CALL_DIGEST,
+            to_email=email,
+            payload={
+                "subject": call_digest_subject(len(calls)),
+                "values": build_call_digest_values(calls, interval_hours),
+            },
+        )
+        db.add(row)
+        return row
+
+    @staticmethod
+    def retry_delay(attempts: int) -> timedelta:
+        """attempts번째 실패 후 다음 시도까지 대기 시간 (지수 backoff, 최대값 제한)"""
+        settings = EmailOutboxService.SETTINGS
+        seconds = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+        return timedelta(seconds=min(seconds, settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS))
+
+    @staticmethod
+    async def _claim_due(db: AsyncSession, batch_size: int) -> list[EmailOutbox]:
+        """
+        발송할 행을 가져와서 lease 설정 후 커밋
+
+        PostgreSQL에서는 SKIP LOCKED로 여러 프로세스가 같은 행을 가져가지 않습니다.
+        """
+        now = datetime.now()
+        result = await db.execute(
+            select(EmailOutbox)
+            .where(
+                EmailOutbox.status == "pending",
+                EmailOutbox.next_attempt_at <= now
+            )
+            .order_by(EmailOutbox.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rows = list(result.scalars().all())
+
+        lease_until = now + timedelta(seconds=EmailOutboxService.SETTINGS.EMAIL_OUTBOX_LEASE_SECONDS)
+        for row in rows:
+            row.attempts += 1
+            row.next_attempt_at = lease_until
+
+        await db.commit()
+        return rows
+
+    @staticmethod
+    async def _send_single(row: EmailOutbox) -> str | None:
+        """한 건 발송 (실패 시 에러 메시지 반환)"""
+        template = get_template(EmailOutboxService.TEMPLATES[row.kind])
+        try:
+            await send_mail(build_mail_payload(
+                to_email=row.to_email,
+                subject=row.payload["subject"],
+                html_content=template.render(row.payload["values"])
+            ))
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        return None
+
+    @staticmethod
+    async def _send_rows(rows: list[EmailOutbox]) -> dict[int, str | None]:
+        """
+        같은 kind의 행들을 personalizations로 묶어서 발송
+
+        Returns:
+            {outbox id: 에러 메시지 (성공 시 None)}
+        """
+        settings = EmailOutboxService.SETTINGS
+        results: dict[int, str | None] = {}
+
+        # DEBUG 모드일 때는 콘솔에만 출력
+        if settings.DEBUG:
+            for row in rows:
+                print(f"🔍 [DEBUG MODE] 이메일 전송 스킵: {row.to_email} - {row.payload['subject']}")
+                results[row.id] = None
+            return results
+
+        by_kind: dict[str, list[EmailOutbox]] = {}
+        for row in rows:
+            # substitutions 크기 제한을 넘는 행은 따로 렌더링해서 한 건씩 발송
+            if substitutions_size(row.payload["values"]) > EmailOutboxService.MAX_SUBSTITUTIONS_BYTES:
+                results[row.id] = await EmailOutboxService._send_single(row)
+            else:
+                by_kind.setdefault(row.kind, []).append(row)
+
+        for kind, kind_rows in by_kind.items():
+            for i in range(0, len(kind_rows), settings.SENDGRID_MAX_PERSONALIZATIONS):
+                chunk = kind_rows[i:i + settings.SENDGRID_MAX_PERSONALIZATIONS]
+                payload = build_multi_mail_payload(
+                    EmailOutboxService.TEMPLATES[kind],
+                    [(row.to_email, row.payload["subject"], row.payload["values"]) for row in chunk]
+                )
+                try:
+                    await send_mail(payload)
+                except httpx.HTTPStatusError as e:
+                    status_code = e.response.status_code
+                    if 400 <= status_code < 500 and status_code != 429 and len(chunk) > 1:
+                        # 요청 내용 문제 (잘못된 주소 등) → 한 건씩 보내서 문제 있는 행만 실패 처리
+                        for row in chunk:
+                            results[row.id] = await EmailOutboxService._send_single(row)
+                        continue
+                    for row in chunk:
+                        results[row.id] = f"HTTP {status_code}: {e.response.text[:500]}"
+                    continue
+                except Exception as e:
+                    for row in chunk:
+                        results[row.id] = f"{type(e).__name__}: {e}"
+                    continue
+
+                for row in chunk:
+                    results[row.id] = None
+
+        return results
+
+    @staticmethod
+    async def deliver_due(db: AsyncSession, batch_size: int | None = None) -> dict[str, int]:
+        """
+        발송 시각이 된 이메일을 batch_size개까지 발송하고 결과 저장
+
+        Args:
+            db: 데이터베이스 세션
+            batch_size: 한 번에 가져올 최대 행 수 (기본값: EMAIL_OUTBOX_BATCH_SIZE)
+
+        Returns:
+            {"claimed", "sent", "retry", "failed"} 개수
+        """
+        settings = EmailOutboxService.SETTINGS
+        batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+        counts = {"claimed": 0, "sent": 0, "retry": 0, "failed": 0}
+
+        rows = await EmailOutboxService._claim_due(db, batch_size)
+        if not rows:
+            return counts
+        counts["claimed"] = len(rows)
+
+        results = await EmailOutboxService._send_rows(rows)
+
+        now = datetime.now()
+        for row in rows:
+            error = results.get(row.id)
+            if error is None:
+                row.status = "sent"
+                row.sent_at = now
+                row.last_error = None
+                counts["sent"] += 1
+            elif row.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                row.status = "failed"
+                row.last_error = error
+                counts["failed"] += 1
+                print(f"❌ 이메일 발송 최종 실패 (outbox id: {row.id}, to: {row.to_email}): {error}")
+            else:
+                row.next_attempt_at = now + EmailOutboxService.retry_delay(row.attempts)
+                row.last_error = error
+                counts["retry"] += 1
+
+        await db.commit()
+        return counts
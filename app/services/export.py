@@ -0,0 +1,152 @@
+"""어르신 통화 기록 내보내기 (CSV / NDJSON)
+
+보호자가 어르신의 전체 통화 기록 + 대화 내용을 한 번에 받을 수 있도록 스트리밍으로 내보냅니다.
+- calls LEFT JOIN call_messages를 (started_at, id, timestamp, id) 순서로 한 번만 조회
+  (calls / call_messages 인덱스 순서 그대로라 DB에서 정렬하지 않음)
+- server-side cursor(yield_per)로 EXPORT_FETCH_SIZE행씩 읽어서 바로 인코딩하므로
+  기록이 아무리 많아도 서버 메모리는 일정
+"""
+import csv
+import io
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.call import Call
+from app.db.models.call_message import CallMessage
+
+CSV_COLUMNS = [
+    "call_id", "started_at", "ended_at", "duration_seconds", "status", "emotion", "tags", "summary",
+    "message_role", "message", "message_timestamp",
+]
+
+
+class CallExportService:
+
+    # server-side cursor에서 한 번에 가져오는 행 수 (= 응답 chunk 하나의 행 수)
+    EXPORT_FETCH_SIZE = 1000
+
+    MEDIA_TYPES = {
+        "csv": "text/csv; charset=utf-8",
+        "ndjson": "application/x-ndjson",
+    }
+
+    @staticmethod
+    def export_query(elder_id: int, start: date | None = None, end: date | None = None):
+        """
+        통화 + 대화 내용 조회 쿼리 (통화 시작 시각순, 통화 안에서는 메시지 시간순)
+
+        Args:
+            elder_id: 어르신 ID
+            start: 시작 날짜 (포함, None이면 처음부터)
+            end: 종료 날짜 (포함, None이면 끝까지)
+        """
+        query = (
+            select(
+                Call.id, Call.started_at, Call.ended_at, Call.duration_seconds, Call.status,
+                Call.emotion, Call.tags, Call.summary,
+                CallMessage.role, CallMessage.message, CallMessage.timestamp,
+            )
+            .outerjoin(CallMessage, CallMessage.call_id == Call.id)
+            .where(Call.elder_id == elder_id)
+        )
+        if start is not None:
+            query = query.where(Call.started_at >= datetime.combine(start, time.min))
+        if end is not None:
+            query = query.where(Call.started_at < datetime.combine(end + timedelta(days=1), time.min))
+        return query.order_by(Call.started_at, Call.id, CallMessage.timestamp, CallMessage.id)
+
+    @staticmethod
+    def _csv_chunk(rows) -> bytes:
+        """통화 + 메시지 행을 CSV로 (메시지가 없는 통화는 메시지 열을 비운 한 행)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([
+                row.id,
+                row.started_at.isoformat(),
+                row.ended_at.isoformat() if row.ended_at else "",
+                row.duration_seconds if row.duration_seconds is not None else "",
+                row.status,
+                row.emotion or "",
+                ", ".join(row.tags) if row.tags else "",
+                row.summary or "",
+                row.role or "",
+                row.message or "",
+                row.timestamp.isoformat() if row.timestamp else "",
+            ])
+        return buffer.getvalue().encode()
+
+    @staticmethod
+    def _ndjson_chunk(rows, last_call_id: int | None) -> tuple[bytes, int | None]:
+        """
+        통화 + 메시지 행을 NDJSON으로 (통화가 바뀔 때 call 줄, 메시지마다 message 줄)
+
+        Returns:
+            (인코딩된 chunk, 마지막 통화 ID) 튜플 (다음 chunk에서 같은 통화의 call 줄을 반복하지 않도록)
+        """
+        lines = []
+        for row in rows:
+            if row.id != last_call_id:
+                last_call_id = row.id
+                lines.append(orjson.dumps({
+                    "type": "call",
+                    "call_id": row.id,
+                    "started_at": row.started_at,
+                    "ended_at": row.ended_at,
+                    "duration_seconds": row.duration_seconds,
+                    "status": row.status,
+                    "emotion": row.emotion,
+                    "tags": row.tags or [],
+                    "summary": row.summary,
+                }))
+            if row.role is not None:
+                lines.append(orjson.dumps({
+                    "type": "message",
+                    "call_id": row.id,
+                    "role": row.role,
+                    "message": row.message,
+                    "timestamp": row.timestamp,
+                }))
+        return b"".join(line + b"\n" for line in lines), last_call_id
+
+    @staticmethod
+    async def iter_export(
+        db: AsyncSession,
+        elder_id: int,
+        format: str = "csv",
+        start: date | None = None,
+        end: date | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        어르신 통화 기록을 CSV / NDJSON chunk(bytes)로 하나씩 생성
+
+        CSV: 메시지 한 개당 한 행 (통화 열 반복), Excel에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작
+        NDJSON: {"type": "call", ...} 줄 다음에 그 통화의 {"type": "message", ...} 줄
+
+        Args:
+            db: DB 세션 (스트림이 끝날 때까지 사용)
+            elder_id: 어르신 ID
+            format: "csv" 또는 "ndjson"
+            start: 시작 날짜 (포함, None이면 처음부터)
+            end: 종료 날짜 (포함, None이면 끝까지)
+        """
+        if format == "csv":
+            header = io.StringIO()
+            csv.writer(header).writerow(CSV_COLUMNS)
+            yield "\ufeff".encode() + header.getvalue().encode()
+
+        result = await db.stream(
+            CallExportService.export_query(elder_id, start, end)
+            .execution_options(yield_per=CallExportService.EXPORT_FETCH_SIZE)
+        )
+        last_call_id = None
+        async for rows in result.partitions():
+            if format == "csv":
+                yield CallExportService._csv_chunk(rows)
+            else:
+                chunk, last_call_id = CallExportService._ndjson_chunk(rows, last_call_id)
+                yield chunk
@@ -0,0 +1,220 @@
+"""진행 중인 통화의 실시간 상태 (in-memory)
+
+status-update / transcript 웹훅으로 통화별 상태와 최근 대화 몇 줄을 메모리에 유지합니다.
+대시보드의 "지금 통화 중" 표시는 DB나 로그 파일을 거치지 않고 여기서 읽습니다.
+
+- 통화별 최근 대화는 ring buffer (LIVE_CALL_TRANSCRIPT_LINES줄)
+- 종료된 통화는 LIVE_CALL_ENDED_TTL_SECONDS 후 제거
+- 종료 이벤트를 받지 못한 통화는 LIVE_CALL_STALE_SECONDS 동안 갱신이 없으면 제거
+- 전체 통화 수는 LIVE_CALL_MAX_CALLS로 제한 (가장 오래 갱신되지 않은 통화부터 제거)
+
+프로세스 메모리에만 있으므로 서버 재시작 시 초기화되며, worker별로 따로 유지됩니다.
+"""
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+
+from app.core.config import get_settings
+from app.services.dashboard_events import dashboard_event_broker, CALL_LIVE_EVENT
+
+settings = get_settings()
+
+# Vapi status-update의 종료 상태
+ENDED_STATUS = "ended"
+
+
+class LiveCallState:
+    """통화 하나의 실시간 상태"""
+
+    __slots__ = (
+        "vapi_call_id",
+        "elder_id",
+        "status",
+        "started_at",
+        "updated_at",
+        "ended_at",
+        "transcript",
+        "touched_at",
+    )
+
+    def __init__(self, vapi_call_id: str, elder_id: int | None, transcript_lines: int):
+        now = datetime.now()
+        self.vapi_call_id = vapi_call_id
+        self.elder_id = elder_id
+        self.status = "queued"
+        self.started_at = now
+        self.updated_at = now
+        self.ended_at: datetime | None = None
+        self.transcript: deque[dict] = deque(maxlen=transcript_lines)
+        self.touched_at = time.monotonic()
+
+    def to_dict(self) -> dict:
+        return {
+            "vapi_call_id": self.vapi_call_id,
+            "elder_id": self.elder_id,
+            "status": self.status,
+            "is_active": self.ended_at is None,
+            "started_at": self.started_at,
+            "updated_at": self.updated_at,
+            "ended_at": self.ended_at,
+            "recent_transcript": list(self.transcript),
+        }
+
+    def to_event(self, transcript_line: dict | None = None) -> dict:
+        """대시보드 이벤트 데이터 (대화는 새로 추가된 한 줄만)"""
+        return {
+            "vapi_call_id": self.vapi_call_id,
+            "status": self.status,
+            "is_active": self.ended_at is None,
+            "updated_at": self.updated_at,
+            "transcript": transcript_line,
+        }
+
+
+class LiveCallStore:
+    """
+    vapi_call_id별 LiveCallState 저장소
+
+    이벤트 루프 안에서만 호출되므로 lock 없이 사용합니다.
+    """
+
+    def __init__(
+        self,
+        transcript_lines: int,
+        ended_ttl_seconds: float,
+        stale_seconds: float,
+        max_calls: int,
+    ):
+        self.transcript_lines = transcript_lines
+        self.ended_ttl_seconds = ended_ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_calls = max_calls
+        # 마지막 갱신 순서 (오래된 것이 앞)
+        self._calls: OrderedDict[str, LiveCallState] = OrderedDict()
+        self._by_elder: dict[int, set[str]] = {}
+
+    def _is_expired(self, state: LiveCallState, now: float) -> bool:
+        ttl = self.ended_ttl_seconds if state.ended_at else self.stale_seconds
+        return now - state.touched_at > ttl
+
+    def _remove(self, vapi_call_id: str) -> None:
+        state = self._calls.pop(vapi_call_id)
+        if state.elder_id is not None:
+            call_ids = self._by_elder.get(state.elder_id)
+            if call_ids is not None:
+                call_ids.discard(vapi_call_id)
+                if not call_ids:
+                    del self._by_elder[state.elder_id]
+
+    def _evict(self) -> None:
+        """만료된 통화 / 최대 개수 초과분 제거 (앞에서부터 확인하므로 대부분 O(1))"""
+        now = time.monotonic()
+        while self._calls:
+            vapi_call_id, state = next(iter(self._calls.items()))
+            if len(self._calls) > self.max_calls or self._is_expired(state, now):
+                self._remove(vapi_call_id)
+            else:
+                break
+
+    def _touch(self, vapi_call_id: str, elder_id: int | None) -> LiveCallState:
+        """통화 상태를 가져오거나 생성하고 최신 갱신으로 표시"""
+        state = self._calls.get(vapi_call_id)
+        if state is None:
+            state = LiveCallState(vapi_call_id, elder_id, self.transcript_lines)
+            self._calls[vapi_call_id] = state
+        else:
+            self._calls.move_to_end(vapi_call_id)
+            state.updated_at = datetime.now()
+            state.touched_at = time.monotonic()
+
+        if state.elder_id is None and elder_id is not None:
+            state.elder_id = elder_id
+        if state.elder_id is not None:
+            self._by_elder.setdefault(state.elder_id, set()).add(vapi_call_id)
+
+        self._evict()
+        return state
+
+    def _publish(self, state: LiveCallState, transcript_line: dict | None = None) -> None:
+        """대시보드 구독자에게 상태 변경 전달"""
+        if state.elder_id is not None:
+            dashboard_event_broker.publish(state.elder_id, CALL_LIVE_EVENT, state.to_event(transcript_line))
+
+    def update_status(self, vapi_call_id: str, elder_id: int | None, status: str) -> LiveCallState:
+        """
+        status-update 이벤트 반영
+
+        Args:
+            vapi_call_id: Vapi 통화 ID
+            elder_id: 어르신 ID (metadata에 없으면 None)
+            status: Vapi 통화 상태 (queued, ringing, in-progress, ended 등)
+
+        Returns:
+            갱신된 통화 상태
+        """
+        state = self._touch(vapi_call_id, elder_id)
+        changed = state.status != status
+        state.status = status
+        if status == ENDED_STATUS and state.ended_at is None:
+            state.ended_at = state.updated_at
+            changed = True
+        
+        if changed:
+            self._publish(state)
+        return state
+
+    def add_transcript(self, vapi_call_id: str, elder_id: int | None, role: str, text: str) -> LiveCallState:
+        """
+        transcript 이벤트 반영 (최근 LIVE_CALL_TRANSCRIPT_LINES줄만 유지)
+
+        Args:
+            vapi_call_id: Vapi 통화 ID
+            elder_id: 어르신 ID (metadata에 없으면 None)
+            role: user 또는 assistant
+            text: 대화 내용
+
+        Returns:
+            갱신된 통화 상태
+        """
+        state = self._touch(vapi_call_id, elder_id)
+        if state.ended_at is None and state.status == "queued":
+            state.status = "in-progress"
+        line = {"role": role, "message": text, "timestamp": state.updated_at}
+        state.transcript.append(line)
+        self._publish(state, line)
+        return state
+
+    def mark_ended(self, vapi_call_id: str, elder_id: int | None) -> LiveCallState:
+        """end-of-call-report 수신 시 통화 종료 처리 (TTL 후 제거)"""
+        return self.update_status(vapi_call_id, elder_id, ENDED_STATUS)
+
+    def get_elder_calls(self, elder_id: int) -> list[LiveCallState]:
+        """
+        어르신의 실시간 통화 상태 조회 (진행 중인 통화 먼저, 최근 갱신 순)
+
+        Args:
+            elder_id: 어르신 ID
+
+        Returns:
+            LiveCallState 리스트
+        """
+        self._evict()
+        now = time.monotonic()
+        states = [
+            self._calls[vapi_call_id]
+            for vapi_call_id in self._by_elder.get(elder_id, ())
+            if not self._is_expired(self._calls[vapi_call_id], now)
+        ]
+        states.sort(key=lambda state: (state.ended_at is None, state.touched_at), reverse=True)
+        return states
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+live_call_store = LiveCallStore(
+    transcript_lines=settings.LIVE_CALL_TRANSCRIPT_LINES,
+    ended_ttl_seconds=settings.LIVE_CALL_ENDED_TTL_SECONDS,
+    stale_seconds=settings.LIVE_CALL_STALE_SECONDS,
+    max_calls=settings.LIVE_CALL_MAX_CALLS,
+)
@@ -0,0 +1,311 @@
+"""통화 요약 / 대화 내용 검색
+
+"엄마가 무릎 얘기한 게 언제였지?" 같은 질문에 답할 수 있도록 어르신의 통화를 검색합니다.
+- 검색 인덱스(call_search)는 통화 저장과 같은 트랜잭션에서 index_calls로 갱신
+- SQLite: 요약 / 대화 내용을 2글자 단위(bigram)로 펼쳐서 FTS5(unicode61)에 저장하고,
+  검색어도 같은 방식으로 펼친 phrase MATCH + bm25 순위
+  (한국어 명사 대부분인 2글자 검색어도 인덱스로 찾음, 1글자 검색어만 어르신 통화 안에서 instr)
+- PostgreSQL: pg_trgm GIN 인덱스를 쓰는 ILIKE + word_similarity 순위
+- 결과 snippet / 강조 위치는 방언과 상관없이 Python에서 계산 (대화 내용은 결과 페이지 통화만 조회)
+"""
+import re
+
+from sqlalchemy import select, text, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.call import Call
+from app.db.models.call_message import CallMessage
+from app.schemas.dashboard import CallSearchItem, CallSearchResponse
+
+# 통화별 요약 + 대화 내용 (메시지를 시간순으로 줄바꿈으로 이어 붙임)
+SQLITE_CALL_TEXT_SQL = """
+SELECT c.id, coalesce(c.summary, ''), coalesce((
+    SELECT group_concat(message, char(10)) FROM (
+        SELECT m.message FROM call_messages m WHERE m.call_id = c.id ORDER BY m.timestamp, m.id
+    )
+), '')
+FROM calls c
+WHERE c.id IN :call_ids
+"""
+
+POSTGRESQL_INDEX_SQL = """
+INSERT INTO call_search (call_id, elder_id, summary, transcript)
+SELECT c.id, c.elder_id, coalesce(c.summary, ''), coalesce((
+    SELECT string_agg(m.message, E'\\n' ORDER BY m.timestamp, m.id)
+    FROM call_messages m WHERE m.call_id = c.id
+), '')
+FROM calls c
+"""
+
+# bigram으로 펼칠 단어 (unicode61 tokenizer가 토큰으로 보는 문자: 문자 / 숫자, 밑줄 제외)
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+# 앞 단어 마지막 bigram과 다음 단어 첫 bigram이 이어지는 phrase로 잘못 일치하지 않도록 넣는 토큰
+# (검색어는 항상 2글자 bigram이므로 1글자 토큰은 검색어와 일치하지 않음)
+BIGRAM_BREAK_TOKEN = "x"
+
+
+class CallSearchService:
+
+    MAX_TERMS = 5
+
+    # index_calls에서 한 번에 인덱싱하는 통화 수 (IN 파라미터 개수 제한)
+    INDEX_BATCH_SIZE = 500
+
+    # snippet: 첫 검색어 앞뒤로 보여줄 글자 수
+    SNIPPET_RADIUS = 40
+
+    @staticmethod
+    def bigram_text(content: str) -> str:
+        """
+        검색 인덱스에 넣을 bigram 문자열 ("무릎이 아파" -> "무릎 릎이 아파")
+
+        단어마다 겹치는 2글자 조각을 공백으로 이어 붙입니다. 1글자 단어는 인덱싱하지 않고,
+        단어 경계를 넘는 phrase 일치가 생길 수 있는 곳에만 BIGRAM_BREAK_TOKEN을 넣습니다.
+        """
+        grams = []
+        for word in WORD_PATTERN.findall(content.lower()):
+            if len(word) < 2:
+                continue
+            if grams and grams[-1][-1] == word[0]:
+                grams.append(BIGRAM_BREAK_TOKEN)
+            grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+        return " ".join(grams)
+
+    @staticmethod
+    async def index_calls(db: AsyncSession, call_ids: list[int] | None = None) -> None:
+        """
+        통화를 검색 인덱스에 추가 (이미 있으면 다시 만듦, 커밋은 호출하는 쪽에서)
+
+        요약과 CallMessage 전체를 이어 붙인 대화 내용을 한 행으로 저장합니다.
+        (SQLite는 bigram_text로 펼친 값을 저장)
+
+        Args:
+            db: 데이터베이스 세션
+            call_ids: 인덱싱할 통화 ID (None이면 전체 재구성)
+        """
+        sqlite = db.bind.dialect.name == "sqlite"
+
+        if call_ids is None:
+            await db.execute(text("DELETE FROM call_search"))
+            if not sqlite:
+                await db.execute(text(POSTGRESQL_INDEX_SQL))
+                return
+            result = await db.execute(select(Call.id).order_by(Call.id))
+            call_ids = list(result.scalars().all())
+        if not call_ids:
+            return
+
+        key = "rowid" if sqlite else "call_id"
+        call_ids = list(call_ids)
+        for i in range(0, len(call_ids), CallSearchService.INDEX_BATCH_SIZE):
+            ids = bindparam("call_ids", value=call_ids[i:i + CallSearchService.INDEX_BATCH_SIZE], expanding=True)
+            await db.execute(text(f"DELETE FROM call_search WHERE {key} IN :call_ids").bindparams(ids))
+            if not sqlite:
+                await db.execute(text(f"{POSTGRESQL_INDEX_SQL} WHERE c.id IN :call_ids").bindparams(ids))
+                continue
+
+            result = await db.execute(text(SQLITE_CALL_TEXT_SQL).bindparams(ids))
+            rows = [
+                {
+                    "call_id": call_id,
+                    "summary": CallSearchService.bigram_text(summary),
+                    "transcript": CallSearchService.bigram_text(transcript),
+                }
+                for call_id, summary, transcript in result
+            ]
+            if rows:
+                await db.execute(
+                    text("INSERT INTO call_search (rowid, summary, transcript) VALUES (:call_id, :summary, :transcript)"),
+                    rows
+                )
+
+    @staticmethod
+    def parse_terms(query: str) -> list[str]:
+        """검색어를 공백 기준으로 나눔 (중복 제거, 최대 MAX_TERMS개)"""
+        terms = []
+        for term in query.split():
+            if term.lower() not in (t.lower() for t in terms):
+                terms.append(term)
+        return terms[:CallSearchService.MAX_TERMS]
+
+    @staticmethod
+    def build_snippet(content: str, terms: list[str]) -> tuple[str, list[tuple[int, int]]]:
+        """
+        첫 검색어 주변을 잘라서 snippet과 강조 위치 계산
+
+        Args:
+            content: 대화 내용 또는 요약
+            terms: 검색어 (대소문자 무시)
+
+        Returns:
+            (snippet, snippet 안의 검색어 위치 [start, end) 리스트) 튜플, 검색어가 없으면 ("", [])
+        """
+        pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+        first = pattern.search(content)
+        if first is None:
+            return "", []
+
+        radius = CallSearchService.SNIPPET_RADIUS
+        start = max(0, first.start() - radius)
+        end = min(len(content), first.end() + radius)
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(content) else ""
+
+        # 메시지 구분 줄바꿈은 공백으로 (길이가 같아서 위치는 그대로)
+        snippet = prefix + content[start:end].replace("\n", " ") + suffix
+        highlights = [
+            (match.start() - start + len(prefix), match.end() - start + len(prefix))
+            for match in pattern.finditer(content, start, end)
+        ]
+        return snippet, highlights
+
+    @staticmethod
+    def _match_phrases(term: str) -> list[str] | None:
+        """
+        검색어를 FTS5 phrase로 변환 (단어마다 bigram phrase, 1글자 단어가 있으면 None)
+
+        "물리치료" -> ['"물리 리치 치료"']
+        """
+        words = WORD_PATTERN.findall(term.lower())
+        if not words or any(len(word) < 2 for word in words):
+            return None
+        return ['"' + CallSearchService.bigram_text(word) + '"' for word in words]
+
+    @staticmethod
+    def _sqlite_ranked_query(terms: list[str]) -> tuple[str, dict]:
+        """FTS5 검색 쿼리 (2글자 이상 단어는 bigram phrase MATCH, 1글자가 섞인 검색어는 요약 / 대화 내용 instr)"""
+        phrases = []
+        short_terms = []
+        for term in terms:
+            term_phrases = CallSearchService._match_phrases(term)
+            if term_phrases is None:
+                short_terms.append(term)
+            else:
+                phrases.extend(term_phrases)
+
+        # rowid IN (어르신 통화)로 거르면 FTS5가 rowid마다 MATCH를 다시 실행하므로 calls 조인으로 거름
+        conditions = ["calls.elder_id = :elder_id"]
+        params = {}
+        if phrases:
+            conditions.append("call_search MATCH :match")
+            params["match"] = " AND ".join(phrases)
+        for i, term in enumerate(short_terms):
+            # 인덱스에는 bigram만 있으므로 원문(calls.summary / call_messages)에서 찾음
+            conditions.append(
+                f"(instr(lower(coalesce(calls.summary, '')), :term{i}) > 0 OR EXISTS ("
+                f"SELECT 1 FROM call_messages m WHERE m.call_id = calls.id AND instr(lower(m.message), :term{i}) > 0))"
+            )
+            params[f"term{i}"] = term.lower()
+
+        # bm25는 MATCH가 있을 때만 계산 가능 (요약 일치에 가중치 2배)
+        order = "bm25(call_search, 2.0, 1.0), calls.started_at DESC" if phrases else "calls.started_at DESC"
+        sql = (
+            "SELECT calls.id FROM call_search JOIN calls ON calls.id = call_search.rowid "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {order}, calls.id DESC LIMIT :limit OFFSET :offset"
+        )
+        return sql, params
+
+    @staticmethod
+    def _postgresql_ranked_query(terms: list[str]) -> tuple[str, dict]:
+        """pg_trgm 검색 쿼리 (ILIKE는 trigram GIN 인덱스 사용)"""
+        conditions = ["s.elder_id = :elder_id"]
+        params = {"query": " ".join(terms)}
+        for i, term in enumerate(terms):
+            conditions.append(f"(s.summary ILIKE :term{i} OR s.transcript ILIKE :term{i})")
+            escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params[f"term{i}"] = f"%{escaped}%"
+
+        sql = (
+            "SELECT calls.id FROM call_search s JOIN calls ON calls.id = s.call_id "
+            f"WHERE {' AND '.join(conditions)} "
+            "ORDER BY word_similarity(:query, s.summary) * 2 + word_similarity(:query, s.transcript) DESC, "
+            "calls.started_at DESC, calls.id DESC LIMIT :limit OFFSET :offset"
+        )
+        return sql, params
+
+    @staticmethod
+    async def search_calls(
+        db: AsyncSession,
+        elder_id: int,
+        query: str,
+        page: int = 1,
+        page_size: int = 10
+    ) -> CallSearchResponse:
+        """
+        어르신 통화를 요약 / 대화 내용으로 검색 (모든 검색어를 포함하는 통화, 관련도순)
+
+        Args:
+            db: 데이터베이스 세션
+            elder_id: 어르신 ID
+            query: 검색어 (공백으로 여러 개)
+            page: 페이지 번호 (1부터 시작)
+            page_size: 페이지당 항목 수
+
+        Returns:
+            CallSearchResponse 객체
+
+        Raises:
+            ValueError: 검색어가 비어 있음
+        """
+        terms = CallSearchService.parse_terms(query)
+        if not terms:
+            raise ValueError("검색어를 입력해주세요")
+
+        if db.bind.dialect.name == "sqlite":
+            sql, params = CallSearchService._sqlite_ranked_query(terms)
+        else:
+            sql, params = CallSearchService._postgresql_ranked_query(terms)
+
+        # 1. 순위대로 통화 ID 조회 (다음 페이지 존재 여부 확인용으로 한 개 더)
+        result = await db.execute(text(sql), {
+            **params,
+            "elder_id": elder_id,
+            "limit": page_size + 1,
+            "offset": (page - 1) * page_size,
+        })
+        call_ids = list(result.scalars().all())
+        has_next = len(call_ids) > page_size
+        call_ids = call_ids[:page_size]
+
+        # 2. 이번 페이지 통화 + 대화 내용 조회 (검색 인덱스의 값은 SQLite에서 bigram이므로 원문에서)
+        calls = {}
+        transcripts: dict[int, list[str]] = {}
+        if call_ids:
+            result = await db.execute(select(Call).where(Call.id.in_(call_ids)))
+            calls = {call.id: call for call in result.scalars()}
+            result = await db.execute(
+                select(CallMessage.call_id, CallMessage.message)
+                .where(CallMessage.call_id.in_(call_ids))
+                .order_by(CallMessage.call_id, CallMessage.timestamp, CallMessage.id)
+            )
+            for call_id, message in result:
+                transcripts.setdefault(call_id, []).append(message)
+
+        # 3. snippet (대화 내용에 검색어가 없으면 요약에서)
+        items = []
+        for call_id in call_ids:
+            call = calls[call_id]
+            transcript = "\n".join(transcripts.get(call_id, []))
+            snippet, highlights = CallSearchService.build_snippet(transcript, terms)
+            if not snippet:
+                snippet, highlights = CallSearchService.build_snippet(call.summary or "", terms)
+            items.append(CallSearchItem(
+                id=call.id,
+                date=call.started_at.strftime("%Y.%m.%d"),
+                time=call.started_at.strftime("%H:%M"),
+                summary=call.summary or "",
+                emotion=call.emotion,
+                tags=call.tags if call.tags else [],
+                snippet=snippet,
+                highlights=highlights,
+            ))
+
+        return CallSearchResponse(
+            query=" ".join(terms),
+            items=items,
+            page=page,
+            page_size=page_size,
+            has_next=has_next,
+        )
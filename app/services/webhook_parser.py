@@ -0,0 +1,201 @@
+"""Vapi 웹훅 body 파싱 및 보관용 projection
+
+end-of-call-report에는 전체 messages 배열, 원문 transcript, artifact 등이 함께 들어 있어
+긴 통화는 body가 수 MB가 됩니다. 큰 body는 디스크에 받아둔 뒤 ijson으로
+저장에 필요한 필드만 추출하고, messages는 한 건씩 lazy하게 읽습니다.
+
+로그 보관 시에도 같은 필드 목록(REPORT_FIELDS + 화이트리스트)만 남겨 compact JSON으로 씁니다.
+"""
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import ijson
+import orjson
+
+# 이 크기 이하의 body는 한 번에 파싱 (status-update, transcript 등 작은 이벤트)
+STREAM_PARSE_THRESHOLD_BYTES = 64 * 1024
+
+# ijson이 파일에서 한 번에 읽는 크기 (한 번에 읽은 분량의 이벤트를 모두 만든 뒤 넘겨주므로
+# 기본값 64KB에서는 이벤트만으로 peak가 1MB 가까이 됨)
+PARSE_BUFFER_SIZE = 8 * 1024
+
+# CallService.save_call_from_webhook에서 사용하는 필드 (messages 제외)
+REPORT_FIELDS = {
+    "message.type",
+    "message.call.id",
+    "message.call.assistantOverrides.metadata",
+    "message.call.metadata",
+    "message.startedAt",
+    "message.endedAt",
+    "message.endedReason",
+    "message.durationSeconds",
+    "message.analysis.summary",
+    "message.analysis.structuredData",
+}
+
+# 실시간 통화 상태(live_call)에서 사용하는 필드 (큰 status-update body 대비, 보관 projection에는 미포함)
+LIVE_EVENT_FIELDS = {
+    "message.status",
+    "message.role",
+    "message.transcriptType",
+}
+
+# CallService.save_call_from_webhook에서 사용하는 message.messages 항목 필드 / role
+MESSAGE_FIELDS = ("role", "message", "time")
+MESSAGE_ROLES = {"user", "bot"}
+
+MESSAGES_PREFIX = "message.messages.item"
+
+SCALAR_EVENTS = {"string", "number", "boolean", "null"}
+
+
+def _assign(target: dict, prefix: str, value) -> None:
+    """'message.call.id' 형태의 prefix 위치에 값 저장 (중간 dict는 생성)"""
+    keys = prefix.split(".")
+    for key in keys[:-1]:
+        target = target.setdefault(key, {})
+    target[keys[-1]] = value
+
+
+def read_report_fields(path: Path, extra_fields: Iterable[str] = ()) -> dict:
+    """
+    웹훅 파일에서 저장에 필요한 필드만 스트리밍으로 추출
+
+    messages, artifact, costs 등은 읽기만 하고 메모리에 올리지 않습니다.
+
+    Args:
+        path: 웹훅 body JSON 파일 경로
+        extra_fields: 추가로 추출할 필드 ('message.cost' 형태)
+
+    Returns:
+        {"message": {...}} 형태의 body (필요한 필드만 포함)
+    """
+    fields = REPORT_FIELDS | LIVE_EVENT_FIELDS | set(extra_fields)
+    body: dict = {}
+    builder = None
+    build_prefix = None
+
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True, buf_size=PARSE_BUFFER_SIZE):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == build_prefix and event in ("end_map", "end_array"):
+                    _assign(body, build_prefix, builder.value)
+                    builder = None
+                continue
+
+            if prefix not in fields:
+                continue
+
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                build_prefix = prefix
+            elif event in SCALAR_EVENTS:
+                _assign(body, prefix, value)
+
+    return body
+
+
+def iter_report_messages(path: Path) -> Iterator[dict]:
+    """
+    웹훅 파일의 message.messages 항목을 하나씩 반환
+
+    Args:
+        path: 웹훅 body JSON 파일 경로
+
+    Yields:
+        Vapi 메시지 딕셔너리 (role, message, time, ...)
+    """
+    with open(path, "rb") as f:
+        yield from ijson.items(f, MESSAGES_PREFIX, use_float=True, buf_size=PARSE_BUFFER_SIZE)
+
+
+def load_webhook_body(path: Path, extra_fields: Iterable[str] = ()) -> dict:
+    """
+    웹훅 파일 파싱
+
+    작은 body는 orjson으로 전체를 읽고, 큰 body는 필요한 필드만 스트리밍으로 추출합니다.
+    큰 body의 messages는 포함되지 않으므로 iter_report_messages로 따로 읽습니다.
+
+    Args:
+        path: 웹훅 body JSON 파일 경로
+        extra_fields: 큰 body에서 추가로 추출할 필드
+
+    Returns:
+        웹훅 body 딕셔너리
+
+    Raises:
+        ValueError: JSON이 아니거나 잘렸거나, 최상위가 객체가 아닌 body
+    """
+    try:
+        if path.stat().st_size <= STREAM_PARSE_THRESHOLD_BYTES:
+            body = orjson.loads(path.read_bytes())
+        else:
+            body = read_report_fields(path, extra_fields)
+    except ijson.JSONError as e:
+        raise ValueError(f"잘못된 JSON body: {e}") from e
+
+    if not isinstance(body, dict):
+        raise ValueError("웹훅 body가 JSON 객체가 아닙니다")
+    return body
+
+
+def project_body(body: dict, extra_fields: Iterable[str] = ()) -> dict:
+    """
+    이미 파싱된 body에서 REPORT_FIELDS + extra_fields만 남긴 dict 생성 (messages 제외)
+
+    Args:
+        body: 웹훅 body 딕셔너리
+        extra_fields: 추가로 남길 필드
+
+    Returns:
+        projection된 body
+    """
+    projected: dict = {}
+    for field in REPORT_FIELDS | set(extra_fields):
+        value = body
+        for key in field.split("."):
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            _assign(projected, field, value)
+    return projected
+
+
+def write_projected_archive(path: Path, body: dict, messages: Iterable[dict]) -> int:
+    """
+    projection된 body와 messages를 compact JSON 한 파일로 저장
+
+    messages는 MESSAGE_ROLES 항목의 MESSAGE_FIELDS만 남기고 한 건씩 기록하므로
+    전체를 메모리에 올리지 않습니다.
+
+    Args:
+        path: 저장할 파일 경로
+        body: projection된 body (messages 제외)
+        messages: Vapi 메시지 항목
+
+    Returns:
+        기록한 메시지 개수
+    """
+    message = body.get("message", {})
+    rest = {key: value for key, value in body.items() if key != "message"}
+    count = 0
+
+    with open(path, "wb") as f:
+        # {..., "message": {..., "messages": [...]}} 형태로 message 객체 끝에 messages를 이어 씀
+        f.write(orjson.dumps(rest)[:-1])
+        f.write(b',"message":' if rest else b'"message":')
+        f.write(orjson.dumps(message)[:-1])
+        f.write(b',"messages":[' if message else b'"messages":[')
+        for msg in messages:
+            if msg.get("role") not in MESSAGE_ROLES:
+                continue
+            if count:
+                f.write(b",")
+            f.write(orjson.dumps({key: msg[key] for key in MESSAGE_FIELDS if key in msg}))
+            count += 1
+        f.write(b"]}}")
+
+    return count
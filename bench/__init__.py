@@ -0,0 +1 @@
+"""Benchmark scripts for performance regression checks"""
@@ -0,0 +1,173 @@
+"""통화 목록(GET /dashboard/{elder_id}/call-list) 페이지네이션 벤치마크
+
+통화 기록이 많이 쌓인 어르신 한 명의 통화 목록을 페이지 깊이별로
+- page: COUNT + OFFSET (app.services.dashboard.get_call_list_paginated)
+- cursor: (started_at, id) keyset (app.services.dashboard.get_call_list_by_cursor)
+두 방식으로 조회해서 같은 항목이 나오는지 확인하고 평균 지연 시간을 출력합니다.
+started_at이 같은 통화도 섞어서 넣고, cursor로 끝까지 넘겼을 때 빠지거나 중복된 통화가 없는지도 확인합니다.
+
+사용법:
+    cd server
+    python -m bench.call_list_bench
+    python -m bench.call_list_bench --calls 50000 --iterations 50
+    python -m bench.call_list_bench --database-url postgresql+asyncpg://user:pw@localhost/bench
+"""
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.base import Base
+from app.db.models.call import Call
+from app.db.models.elder import Elder
+from app.db.models.user import User
+from app.services.dashboard import (
+    get_call_list_paginated,
+    get_call_list_by_cursor,
+    encode_call_cursor,
+)
+import app.db.models  # noqa: F401  (테이블 등록)
+
+PAGE_SIZE = 5
+
+
+async def seed(session_factory, args) -> None:
+    """보호자 1명, 어르신 2명, 대상 어르신(id=1)에 통화 args.calls건 (일부는 started_at 중복) 생성"""
+    rng = random.Random(42)
+    now = datetime(2025, 3, 12, 12, 0)
+    async with session_factory() as db:
+        db.add(User(id=1, email="bench@example.com"))
+        for elder_id in (1, 2):
+            db.add(Elder(
+                id=elder_id, user_id=1, name=f"어르신{elder_id}", gender="female", age=80,
+                relation="grandmother", phone="01000000000", residence_type="alone",
+                health_condition="good", begin_date=now - timedelta(days=365 * 3),
+                invite_code=f"{elder_id:06d}"
+            ))
+        await db.flush()
+
+        rows = []
+        for elder_id in (1, 2):
+            started_at = now
+            for _ in range(args.calls):
+                # 10% 정도는 직전 통화와 같은 시각 (정렬 tiebreaker 확인용)
+                if rng.random() > 0.1:
+                    started_at -= timedelta(seconds=rng.randint(60, 86400))
+                rows.append({
+                    "elder_id": elder_id, "user_id": 1, "started_at": started_at,
+                    "ended_at": started_at + timedelta(minutes=5), "duration_seconds": 300.0, "status": "completed",
+                    "summary": "요약", "emotion": "happy", "tags": ["식사"],
+                })
+        for i in range(0, len(rows), 5000):
+            await db.execute(insert(Call), rows[i:i + 5000])
+        await db.commit()
+
+
+async def walk_cursor(session_factory) -> list[int]:
+    """cursor 방식으로 마지막 페이지까지 넘기면서 통화 ID 수집"""
+    ids, cursor = [], None
+    async with session_factory() as db:
+        while True:
+            items, cursor = await get_call_list_by_cursor(db, 1, cursor, PAGE_SIZE)
+            ids += [item.id for item in items]
+            if cursor is None:
+                return ids
+
+
+async def measure(session_factory, fn, iterations: int) -> tuple[list, float]:
+    """fn을 iterations번 실행해서 (마지막 결과, 평균 지연 시간) 반환"""
+    timings = []
+    items = None
+    for _ in range(iterations):
+        async with session_factory() as db:
+            start = time.perf_counter()
+            items = await fn(db)
+            timings.append(time.perf_counter() - start)
+    return items, sum(timings) / len(timings)
+
+
+async def run(args, database_url: str) -> bool:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(session_factory, args)
+
+    # 각 페이지 직전 항목으로 cursor를 만들기 위한 기대 정렬 순서
+    async with session_factory() as db:
+        result = await db.execute(
+            select(Call.id, Call.started_at)
+            .where(Call.elder_id == 1)
+            .order_by(Call.started_at.desc(), Call.id.desc())
+        )
+        ordered = result.all()
+
+    total_pages = (len(ordered) + PAGE_SIZE - 1) // PAGE_SIZE
+    pages = sorted({p for p in (1, 10, 100, 1000, total_pages // 2, total_pages) if 1 <= p <= total_pages})
+
+    print("=" * 60)
+    print(f"📄 Call list benchmark: {args.calls} calls, page_size {PAGE_SIZE}, "
+          f"{args.iterations} iterations, {engine.dialect.name}")
+    print("=" * 60)
+
+    ok = True
+    for page in pages:
+        offset = (page - 1) * PAGE_SIZE
+        cursor = encode_call_cursor(ordered[offset - 1].started_at, ordered[offset - 1].id) if offset else None
+
+        async def by_page(db, page=page):
+            items, _, _ = await get_call_list_paginated(db, 1, page, PAGE_SIZE)
+            return items
+
+        async def by_cursor(db, cursor=cursor):
+            items, _ = await get_call_list_by_cursor(db, 1, cursor, PAGE_SIZE)
+            return items
+
+        await measure(session_factory, by_page, 2)  # warm-up
+        page_items, page_mean = await measure(session_factory, by_page, args.iterations)
+        cursor_items, cursor_mean = await measure(session_factory, by_cursor, args.iterations)
+        same = page_items == cursor_items
+        ok = ok and same
+        print(f"{'✅' if same else '❌'} page {page:>6}: page {page_mean * 1000:7.2f}ms, "
+              f"cursor {cursor_mean * 1000:7.2f}ms ({page_mean / cursor_mean:.1f}x)")
+
+    walked = await walk_cursor(session_factory)
+    complete = walked == [row.id for row in ordered]
+    ok = ok and complete
+    print(f"\n{'✅' if complete else '❌'} cursor 전체 순회: {len(walked)}건 / {len(ordered)}건, "
+          f"중복 {len(walked) - len(set(walked))}건")
+    print("=" * 60)
+
+    await engine.dispose()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통화 목록 페이지네이션 벤치마크")
+    parser.add_argument("--calls", type=int, default=20000, help="대상 어르신의 통화 수")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--database-url", help="벤치마크용 DB (기본값: 임시 SQLite)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        ok = asyncio.run(run(args, args.database_url))
+    else:
+        with tempfile.TemporaryDirectory() as db_dir:
+            ok = asyncio.run(run(args, f"sqlite+aiosqlite:///{db_dir}/bench.db"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
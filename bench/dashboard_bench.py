@@ -0,0 +1,251 @@
+"""대시보드(GET /dashboard/{elder_id}) 조립 벤치마크
+
+임시 SQLite DB에 통화 기록을 넣고 대시보드 응답을
+- before: 어르신 → 주간 통계 → 최근 통화 → 일정 순으로 쿼리 4개를 차례로 실행 (이전 구현)
+- after: app.routers.dashboard.get_dashboard (어르신 + 주간 통계 + 최근 통화 1개, 일정 1개), 캐시 없이
+- cached: get_dashboard + 대시보드 응답 캐시 (memory 백엔드, 어르신 수만큼 miss 후 hit, hit도 데이터 버전 조회 1개)
+- revalidated: 이전 응답의 ETag를 If-None-Match로 보내는 재방문 (데이터 버전 조회 후 304)
+세 방식으로 만들어서 응답이 같은지(재방문은 모두 304인지) 확인하고, 요청당 쿼리 수와 평균 / p95 지연 시간을 출력합니다.
+
+SQLite는 같은 프로세스 안에서 실행되어 쿼리 왕복 비용이 거의 없으므로,
+--rtt-ms로 쿼리마다 네트워크 왕복 지연을 더해서 원격 DB(PostgreSQL) 환경을 흉내낼 수 있습니다.
+
+사용법:
+    cd server
+    python -m bench.dashboard_bench
+    python -m bench.dashboard_bench --calls 5000 --rtt-ms 1 --iterations 200
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import orjson
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+STATUSES = ["completed"] * 7 + ["failed", "no_answer", "busy"]
+
+
+def make_request(headers: dict[str, str] | None = None):
+    """라우터 함수를 직접 호출할 때 넘길 GET 요청 (헤더만 사용)"""
+    from starlette.requests import Request
+
+    raw_headers = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+async def get_dashboard_before(elder_id: int, db):
+    """이전 구현: 쿼리 4개를 차례로 실행해서 대시보드 응답 구성"""
+    from sqlalchemy import select
+    from app.db.models.call_schedule import CallSchedule
+    from app.db.models.elder import Elder
+    from app.schemas.dashboard import DashboardResponse
+    from app.services import dashboard
+    from app.services.call_schedule import CallScheduleService
+
+    result = await db.execute(select(Elder).where(Elder.id == elder_id))
+    elder = result.scalar_one_or_none()
+    elder_info = await dashboard.build_elder_basic_info(elder)
+    week_start, week_end = dashboard.get_week_range()
+    weekly_stats = await dashboard.get_weekly_stats(db, elder_id, week_start, week_end)
+    recent_calls = await dashboard.get_recent_calls(db, elder_id, limit=10)
+    schedule_result = await db.execute(select(CallSchedule).where(CallSchedule.elder_id == elder_id))
+    schedule_offsets = CallScheduleService.build_schedule_offsets(schedule_result.scalars().all())
+    return DashboardResponse(
+        elder=elder_info,
+        today_highlight=dashboard.get_today_highlight(recent_calls),
+        weekly_stats=weekly_stats,
+        recent_calls=recent_calls,
+        next_scheduled_call=dashboard.find_next_scheduled_call(schedule_offsets),
+        this_week_schedule=dashboard.build_weekly_schedule(schedule_offsets, week_start)
+    )
+
+
+async def seed(args) -> None:
+    """보호자 1명, 어르신 args.elders명, 어르신별 통화 args.calls건 (최근 90일, 오늘 포함) 생성"""
+    from datetime import time as dt_time
+    from sqlalchemy import insert
+    from app.db.base import Base
+    from app.db.models.call import Call
+    from app.db.models.call_schedule import CallSchedule
+    from app.db.models.elder import Elder
+    from app.db.models.user import User
+    from app.db.session import engine, AsyncSessionLocal
+    from app.services.daily_stats import DailyStatsService
+    import app.db.models  # noqa: F401  (테이블 등록)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(42)
+    now = datetime.now()
+    async with AsyncSessionLocal() as db:
+        db.add(User(id=1, email="bench@example.com"))
+        for elder_id in range(1, args.elders + 1):
+            db.add(Elder(
+                id=elder_id, user_id=1, name=f"어르신{elder_id}", gender="female", age=80,
+                relation="grandmother", phone="01000000000", residence_type="alone",
+                health_condition="good", begin_date=now - timedelta(days=365),
+                invite_code=f"{elder_id:06d}",
+                # 월 / 수 / 금 09:30 (CallScheduleService.build_schedule_offsets 결과)
+                schedule_offsets=[34200, 207000, 379800]
+            ))
+            for day in ("monday", "wednesday", "friday"):
+                db.add(CallSchedule(elder_id=elder_id, day_of_week=day, time=dt_time(9, 30)))
+        await db.flush()
+
+        rows = []
+        for elder_id in range(1, args.elders + 1):
+            for _ in range(args.calls):
+                started_at = now - timedelta(seconds=rng.uniform(0, 90 * 86400))
+                status = rng.choice(STATUSES)
+                duration = rng.uniform(30, 1800) if status == "completed" else None
+                rows.append({
+                    "elder_id": elder_id, "user_id": 1, "started_at": started_at,
+                    "ended_at": started_at + timedelta(seconds=duration) if duration else None,
+                    "duration_seconds": duration,
+                    "status": status, "summary": "어르신께서 오늘 식사를 잘 하셨습니다.",
+                    "emotion": "happy", "tags": ["식사", "건강"],
+                })
+            # 오늘의 하이라이트용 통화
+            rows.append({
+                "elder_id": elder_id, "user_id": 1, "started_at": now - timedelta(minutes=5),
+                "ended_at": now - timedelta(minutes=1), "duration_seconds": 240.0, "status": "completed",
+                "summary": "오늘 통화", "emotion": "happy", "tags": ["산책"],
+            })
+        for i in range(0, len(rows), 5000):
+            await db.execute(insert(Call), rows[i:i + 5000])
+        await DailyStatsService.rebuild(db)
+        await db.commit()
+
+
+async def measure(fn, args, statements: list) -> tuple[list[float], float, object]:
+    """fn을 iterations번 실행해서 (지연 시간 리스트, 요청당 쿼리 수, 마지막 응답) 반환"""
+    from app.db.session import AsyncSessionLocal
+
+    timings = []
+    response = None
+    statements.clear()
+    for i in range(args.iterations):
+        elder_id = i % args.elders + 1
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            response = await fn(elder_id, db)
+            timings.append(time.perf_counter() - start)
+    return sorted(timings), len(statements) / args.iterations, response
+
+
+async def run(args) -> bool:
+    from sqlalchemy import event
+    from app.db.session import engine
+    from app.db.session import AsyncSessionLocal
+    from app.routers.dashboard import get_dashboard
+    from app.services.dashboard_cache import dashboard_cache
+
+    await seed(args)
+
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+        if args.rtt_ms:
+            # DB 스레드에서 실행되므로 쿼리 왕복 지연을 그대로 흉내냄
+            time.sleep(args.rtt_ms / 1000)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+
+    print("=" * 60)
+    print(f"🏠 Dashboard benchmark: {args.elders} elders x {args.calls} calls, "
+          f"{args.iterations} requests, rtt {args.rtt_ms}ms")
+    print("=" * 60)
+
+    async def get_dashboard_fresh(elder_id: int, db):
+        return await get_dashboard(elder_id, make_request(), db)
+
+    # 재방문: 어르신별로 마지막에 받은 ETag를 보냄 (cached 단계에서 채움)
+    etags: dict[int, str] = {}
+    statuses: list[int] = []
+
+    async def get_dashboard_revalidated(elder_id: int, db):
+        response = await get_dashboard(elder_id, make_request({"If-None-Match": etags[elder_id]}), db)
+        statuses.append(response.status_code)
+        return response
+
+    results = {}
+    phases = [
+        ("before", get_dashboard_before),
+        ("after", get_dashboard_fresh),
+        ("cached", get_dashboard_fresh),
+        ("revalidated", get_dashboard_revalidated),
+    ]
+    for name, fn in phases:
+        if name == "cached":
+            dashboard_cache.ttl_seconds = 60
+        elif name == "revalidated":
+            for elder_id in range(1, args.elders + 1):
+                async with AsyncSessionLocal() as db:
+                    etags[elder_id] = (await get_dashboard_fresh(elder_id, db)).headers["etag"]
+        else:
+            await measure(fn, args, statements)  # warm-up
+        dashboard_cache.reset_stats()
+        timings, queries, response = await measure(fn, args, statements)
+        # before는 DashboardResponse, after / cached는 직렬화된 JSON 응답, revalidated는 본문 없는 304
+        if name == "before":
+            results[name] = response.model_dump(mode="json")
+        elif name != "revalidated":
+            results[name] = orjson.loads(response.body)
+        mean = sum(timings) / len(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"\n📊 {name}")
+        print(f"  - 요청당 쿼리: {queries:.1f}개")
+        print(f"  - 지연 시간: 평균 {mean * 1000:.2f}ms, p95 {p95 * 1000:.2f}ms")
+        if name == "cached":
+            stats = dashboard_cache.stats()
+            print(f"  - 캐시: hit {stats['hits']} / miss {stats['misses']} (hit rate {stats['hit_rate']:.1%})")
+        if name == "revalidated":
+            print(f"  - 304 응답: {statuses.count(304)} / {len(statuses)}")
+
+    await engine.dispose()
+
+    same = results["before"] == results["after"] == results["cached"]
+    not_modified = bool(statuses) and all(status == 304 for status in statuses)
+    print(f"\n{'✅' if same else '❌'} 응답 일치: {same}")
+    print(f"{'✅' if not_modified else '❌'} 재방문 304: {not_modified}")
+    print("=" * 60)
+    return same and not_modified
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 조립 벤치마크")
+    parser.add_argument("--calls", type=int, default=2000, help="어르신별 통화 수 (최근 90일)")
+    parser.add_argument("--elders", type=int, default=10, help="어르신 수")
+    parser.add_argument("--iterations", type=int, default=200, help="요청 수")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="쿼리당 추가할 왕복 지연 (ms)")
+    args = parser.parse_args()
+
+    # app 설정은 처음 import할 때 읽으므로 import 전에 환경변수 지정
+    db_dir = tempfile.TemporaryDirectory()
+    os.environ.update({
+        "DEBUG": "False",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{db_dir.name}/bench.db",
+        "DASHBOARD_CACHE_BACKEND": "memory",
+        "DASHBOARD_CACHE_TTL_SECONDS": "0",  # cached 단계에서만 사용
+    })
+
+    try:
+        same = asyncio.run(run(args))
+    finally:
+        db_dir.cleanup()
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
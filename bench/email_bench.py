@@ -0,0 +1,267 @@
+"""이메일 발송 경로 벤치마크
+
+로컬 SendGrid stand-in(bench.sendgrid_stub)을 띄우고 통화 리포트 이메일 N건을 보내
+처리량, 지연 시간 percentile, 스레드 수, SendGrid 연결/요청 수를 출력합니다.
+- direct: app.services.email.send_call_report_email을 N건 동시에 호출 (건당 요청 1개)
+- outbox: email_outbox에 N건을 넣고 EmailOutboxService.deliver_due로 모두 발송 (personalizations batch)
+
+outbox 모드는 임시 SQLite DB를 사용하므로 실제 DB에는 영향이 없습니다.
+
+사용법:
+    cd server
+    python -m bench.email_bench
+    python -m bench.email_bench --count 5000 --concurrency 20 --latency-ms 120
+    python -m bench.email_bench --mode outbox --failure-rate 0.1
+    python -m bench.email_bench --sendgrid-url http://127.0.0.1:8025   # 이미 띄운 stub 사용
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+SUMMARY = (
+    "어르신께서는 오늘 아침 식사로 된장국과 밥을 드셨고, 혈압약도 챙겨 드셨다고 하셨습니다. "
+    "오후에는 경로당에 가서 친구분들과 화투를 치실 예정이며, 최근 무릎 통증이 조금 줄었다고 말씀하셨습니다. "
+    "전반적으로 기분이 좋으신 상태였습니다."
+)
+
+
+def percentile(values: list[float], p: float) -> float:
+    """정렬된 값의 p 분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(p / 100 * len(values)) - 1))
+    return values[index]
+
+
+def start_stub(args) -> tuple[subprocess.Popen, str]:
+    """bench.sendgrid_stub를 별도 프로세스로 실행"""
+    url = f"http://127.0.0.1:{args.stub_port}"
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "bench.sendgrid_stub",
+            "--port", str(args.stub_port),
+            "--latency-ms", str(args.latency_ms),
+            "--jitter-ms", str(args.jitter_ms),
+            "--failure-rate", str(args.failure_rate),
+            "--seed", "42",
+        ],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+    )
+    return proc, url
+
+
+async def wait_for_stub(url: str, timeout: float = 10.0) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                await client.get(f"{url}/stats")
+                return
+            except httpx.TransportError:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"SendGrid stub에 연결할 수 없습니다: {url}")
+                await asyncio.sleep(0.1)
+
+
+async def stub_stats(url: str, reset: bool = False) -> dict:
+    async with httpx.AsyncClient() as client:
+        if reset:
+            await client.post(f"{url}/stats/reset")
+            return {}
+        return (await client.get(f"{url}/stats")).json()
+
+
+@contextlib.asynccontextmanager
+async def thread_sampler():
+    """실행 중 최대 스레드 수 측정"""
+    peak = {"threads": threading.active_count()}
+    stop = asyncio.Event()
+
+    async def sample():
+        while not stop.is_set():
+            peak["threads"] = max(peak["threads"], threading.active_count())
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(sample())
+    try:
+        yield peak
+    finally:
+        stop.set()
+        await task
+
+
+async def bench_direct(args) -> dict:
+    """send_call_report_email N건 동시 호출"""
+    from app.services.email import send_call_report_email
+
+    latencies: list[float] = []
+    results: list[bool] = []
+
+    async def send_one(i: int):
+        start = time.perf_counter()
+        ok = await send_call_report_email(
+            email=f"guardian{i}@example.com",
+            elder_name="김영희",
+            call_id=i,
+            elder_id=i % 100 + 1,
+            summary=SUMMARY,
+            emotion="happy"
+        )
+        latencies.append(time.perf_counter() - start)
+        results.append(ok)
+
+    async with thread_sampler() as peak:
+        start = time.perf_counter()
+        # 건별 성공/실패 로그는 숨김
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            await asyncio.gather(*(send_one(i) for i in range(args.count)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed": elapsed,
+        "sent": sum(results),
+        "failed": len(results) - sum(results),
+        "latencies": sorted(latencies),
+        "threads": peak["threads"],
+    }
+
+
+async def bench_outbox(args) -> dict:
+    """email_outbox N건 적재 후 deliver_due로 모두 발송"""
+    from app.db.base import Base
+    from app.db.session import engine, AsyncSessionLocal
+    from app.services.email_outbox import EmailOutboxService
+    import app.db.models  # noqa: F401  (테이블 등록)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as db:
+        for i in range(args.count):
+            EmailOutboxService.enqueue_call_report(
+                db,
+                email=f"guardian{i}@example.com",
+                elder_name="김영희",
+                call_id=i + 1,
+                elder_id=i % 100 + 1,
+                summary=SUMMARY,
+                emotion="happy"
+            )
+        await db.commit()
+
+    latencies: list[float] = []
+    totals = {"sent": 0, "retry": 0, "failed": 0}
+
+    async with thread_sampler() as peak:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            while True:
+                async with AsyncSessionLocal() as db:
+                    counts = await EmailOutboxService.deliver_due(db, args.batch_size)
+                if not counts["claimed"]:
+                    break
+                # batch 안의 이메일은 batch가 끝난 시각에 발송 완료
+                latencies.extend([time.perf_counter() - start] * counts["sent"])
+                for key in totals:
+                    totals[key] += counts[key]
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    return {
+        "elapsed": elapsed,
+        "sent": totals["sent"],
+        "failed": totals["retry"] + totals["failed"],
+        "latencies": sorted(latencies),
+        "threads": peak["threads"],
+    }
+
+
+def print_result(name: str, result: dict, stats: dict) -> None:
+    latencies = result["latencies"]
+    print(f"\n📊 {name}")
+    print(f"  - 발송: {result['sent']}건 성공 / {result['failed']}건 실패(재시도 대기 포함)")
+    print(f"  - 소요 시간: {result['elapsed']:.2f}s ({result['sent'] / result['elapsed']:.0f} emails/s)")
+    print(f"  - 지연 시간: p50 {percentile(latencies, 50) * 1000:.0f}ms, "
+          f"p95 {percentile(latencies, 95) * 1000:.0f}ms, p99 {percentile(latencies, 99) * 1000:.0f}ms")
+    print(f"  - 최대 스레드 수: {result['threads']}")
+    print(f"  - SendGrid 요청: {stats['requests']}회, 연결 {stats['connections']}개, "
+          f"최대 동시 요청 {stats['max_in_flight']}")
+
+
+async def run(args, url: str) -> None:
+    from app.services.email import close_sendgrid_client
+
+    await wait_for_stub(url)
+    print("=" * 60)
+    print(f"📧 Email benchmark: {args.count} emails, concurrency {args.concurrency}, "
+          f"latency {args.latency_ms}ms, failure {args.failure_rate:.0%}")
+    print("=" * 60)
+
+    if args.mode in ("direct", "both"):
+        await stub_stats(url, reset=True)
+        result = await bench_direct(args)
+        print_result("direct (send_call_report_email)", result, await stub_stats(url))
+
+    if args.mode in ("outbox", "both"):
+        await stub_stats(url, reset=True)
+        result = await bench_outbox(args)
+        print_result(f"outbox (deliver_due, batch {args.batch_size})", result, await stub_stats(url))
+
+    await close_sendgrid_client()
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이메일 발송 경로 벤치마크")
+    parser.add_argument("--mode", choices=["direct", "outbox", "both"], default="both")
+    parser.add_argument("--count", type=int, default=2000, help="발송할 이메일 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="SENDGRID_MAX_CONCURRENCY")
+    parser.add_argument("--batch-size", type=int, default=500, help="outbox 모드 deliver_due batch 크기")
+    parser.add_argument("--latency-ms", type=float, default=80, help="stub 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=20, help="stub 응답 지연 편차 (±ms)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="stub 실패 응답 비율 (0~1)")
+    parser.add_argument("--stub-port", type=int, default=8025)
+    parser.add_argument("--sendgrid-url", help="이미 실행 중인 stub 주소 (없으면 직접 실행)")
+    args = parser.parse_args()
+
+    proc = None
+    url = args.sendgrid_url
+    if not url:
+        proc, url = start_stub(args)
+
+    # app 설정은 처음 import할 때 읽으므로 import 전에 환경변수 지정
+    db_dir = tempfile.TemporaryDirectory()
+    os.environ.update({
+        "DEBUG": "False",
+        "SENDGRID_API_URL": url,
+        "SENDGRID_API_KEY": os.environ.get("SENDGRID_API_KEY", "bench-key"),
+        "SENDGRID_MAX_CONCURRENCY": str(args.concurrency),
+        "DATABASE_URL": f"sqlite+aiosqlite:///{db_dir.name}/bench.db",
+    })
+
+    try:
+        asyncio.run(run(args, url))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+        db_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
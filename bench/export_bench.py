@@ -0,0 +1,207 @@
+"""통화 기록 내보내기(GET /dashboard/{elder_id}/export) 메모리 벤치마크
+
+통화 기록이 수천 건 쌓인 어르신 한 명의 전체 기록을 CSV로 만들 때
+- paged: 통화 목록 API처럼 페이지 단위로 Call + messages를 ORM으로 로드해서 CSV를 모두 만든 뒤 반환
+- stream: CallExportService.iter_export (server-side cursor, chunk마다 인코딩 후 버림)
+두 방식의 peak 메모리(tracemalloc) / 소요 시간을 비교하고, 만들어진 CSV 내용이 같은지 확인합니다.
+
+기본값은 임시 SQLite DB이며, --database-url로 PostgreSQL 등 다른 DB를 지정할 수 있습니다.
+(지정한 DB의 테이블은 create_all로 생성되고 벤치마크 데이터가 추가되므로 빈 DB를 사용하세요.)
+
+사용법:
+    cd server
+    python -m bench.export_bench
+    python -m bench.export_bench --calls 5000 --messages 80
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import selectinload
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.base import Base
+from app.db.models.call import Call
+from app.db.models.call_message import CallMessage
+from app.db.models.elder import Elder
+from app.db.models.user import User
+from app.services.export import CallExportService
+import app.db.models  # noqa: F401  (테이블 등록)
+
+WORDS = ["오늘", "식사", "점심", "산책", "날씨", "손녀", "병원", "약", "혈압", "무릎", "텔레비전", "시장"]
+PAGE_SIZE = 50
+
+
+async def export_paged(db: AsyncSession, elder_id: int) -> bytes:
+    """이전 방식: 페이지마다 Call + messages를 로드하고 CSV 전체를 메모리에 만든 뒤 반환"""
+    chunks = []
+    offset = 0
+    while True:
+        result = await db.execute(
+            select(Call)
+            .options(selectinload(Call.messages))
+            .where(Call.elder_id == elder_id)
+            .order_by(Call.started_at, Call.id)
+            .limit(PAGE_SIZE)
+            .offset(offset)
+        )
+        calls = result.scalars().all()
+        if not calls:
+            break
+        rows = []
+        for call in calls:
+            messages = sorted(call.messages, key=lambda m: (m.timestamp, m.id)) or [None]
+            for msg in messages:
+                rows.append(_PagedRow(call, msg))
+        chunks.append(CallExportService._csv_chunk(rows))
+        offset += PAGE_SIZE
+    return b"".join(chunks)
+
+
+class _PagedRow:
+    """ORM 객체를 export_query 결과 행과 같은 속성으로 감쌈"""
+
+    def __init__(self, call: Call, msg: CallMessage | None):
+        self.id = call.id
+        self.started_at = call.started_at
+        self.ended_at = call.ended_at
+        self.duration_seconds = call.duration_seconds
+        self.status = call.status
+        self.emotion = call.emotion
+        self.tags = call.tags
+        self.summary = call.summary
+        self.role = msg.role if msg else None
+        self.message = msg.message if msg else None
+        self.timestamp = msg.timestamp if msg else None
+
+
+async def export_stream(db: AsyncSession, elder_id: int) -> bytes:
+    """스트리밍: chunk는 응답으로 보내는 대신 해시만 갱신하고 버림 (반환값은 비교용 해시)"""
+    digest = hashlib.sha256()
+    first = True
+    async for chunk in CallExportService.iter_export(db, elder_id, "csv"):
+        if first:
+            # 헤더 행은 paged 결과에 없으므로 제외
+            first = False
+            continue
+        digest.update(chunk)
+    return digest.digest()
+
+
+async def seed(session_factory, args) -> None:
+    """보호자 1명, 어르신 2명, 대상 어르신(id=1)에 통화 args.calls건 (통화마다 메시지 args.messages개)"""
+    rng = random.Random(42)
+    base = datetime(2025, 3, 12, 12, 0)
+    async with session_factory() as db:
+        db.add(User(id=1, email="bench@example.com"))
+        for elder_id in (1, 2):
+            db.add(Elder(
+                id=elder_id, user_id=1, name=f"어르신{elder_id}", gender="female", age=80,
+                relation="grandmother", phone="01000000000", residence_type="alone",
+                health_condition="good", begin_date=base - timedelta(days=365),
+                invite_code=f"{elder_id:06d}"[-6:]
+            ))
+        await db.flush()
+
+        call_rows = []
+        for i in range(args.calls * 2):
+            started_at = base - timedelta(hours=i)
+            call_rows.append({
+                "id": i + 1, "elder_id": 1 if i % 2 == 0 else 2, "user_id": 1,
+                "started_at": started_at, "ended_at": started_at + timedelta(minutes=10),
+                "duration_seconds": 600.0, "status": "completed",
+                "summary": " ".join(rng.choices(WORDS, k=20)), "emotion": "calm",
+                "tags": rng.sample(WORDS, 3),
+            })
+        for i in range(0, len(call_rows), 5000):
+            await db.execute(insert(Call), call_rows[i:i + 5000])
+
+        message_rows = []
+        for call in call_rows:
+            for j in range(args.messages):
+                message_rows.append({
+                    "call_id": call["id"], "role": "user" if j % 2 else "assistant",
+                    "message": " ".join(rng.choices(WORDS, k=15)),
+                    "timestamp": call["started_at"] + timedelta(seconds=j * 10),
+                })
+            if len(message_rows) >= 10000:
+                await db.execute(insert(CallMessage), message_rows)
+                message_rows = []
+        if message_rows:
+            await db.execute(insert(CallMessage), message_rows)
+        await db.commit()
+
+
+async def measure(session_factory, fn) -> tuple[int, float, bytes]:
+    """(peak bytes, 경과 ms, 결과) 측정 (시간은 tracemalloc 없이 따로 측정)"""
+    async with session_factory() as db:
+        start = time.perf_counter()
+        output = await fn(db, 1)
+        elapsed = (time.perf_counter() - start) * 1000
+
+    async with session_factory() as db:
+        tracemalloc.start()
+        await fn(db, 1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak, elapsed, output
+
+
+async def run(args, database_url: str) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print("=" * 60)
+    print(f"📦 Export benchmark: {args.calls} calls x {args.messages} messages "
+          f"(+{args.calls} other elder calls), {engine.dialect.name}")
+    print("=" * 60)
+    await seed(session_factory, args)
+
+    paged_peak, paged_ms, paged_csv = await measure(session_factory, export_paged)
+    stream_peak, stream_ms, stream_hash = await measure(session_factory, export_stream)
+
+    print(f"  - paged : peak {paged_peak / 1024 / 1024:.1f}MB, {paged_ms:.0f}ms, CSV {len(paged_csv) / 1024 / 1024:.1f}MB")
+    print(f"  - stream: peak {stream_peak / 1024 / 1024:.1f}MB, {stream_ms:.0f}ms")
+    print(f"  - stream peak 메모리가 paged의 {stream_peak / paged_peak * 100:.1f}%")
+
+    same = hashlib.sha256(paged_csv).digest() == stream_hash
+    print(f"\n{'✅' if same else '❌'} 결과 일치: {same}")
+    print("=" * 60)
+
+    await engine.dispose()
+    if not same:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통화 기록 내보내기 메모리 벤치마크")
+    parser.add_argument("--calls", type=int, default=2000, help="대상 어르신의 통화 수")
+    parser.add_argument("--messages", type=int, default=40, help="통화당 메시지 수")
+    parser.add_argument("--database-url", help="벤치마크용 DB (기본값: 임시 SQLite)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(run(args, args.database_url))
+        return
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        asyncio.run(run(args, f"sqlite+aiosqlite:///{db_dir}/bench.db"))
+
+
+if __name__ == "__main__":
+    main()
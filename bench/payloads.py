@@ -0,0 +1,197 @@
+"""벤치마크용 더미 데이터 생성
+
+실제 Vapi end-of-call-report 웹훅과 같은 구조의 payload와
+대시보드 / 통화 상세 응답 모델을 생성합니다.
+"""
+import random
+from datetime import datetime, timedelta
+
+from app.schemas.dashboard import (
+    ElderBasicInfo,
+    TodayHighlight,
+    WeeklyStats,
+    CallAttemptsStats,
+    CallSuccessStats,
+    AvgDurationStats,
+    RecentCallItem,
+    NextScheduledCall,
+    WeeklyScheduleItem,
+    CallMessageItem,
+    CallDetailResponse,
+    DashboardResponse,
+)
+
+
+SAMPLE_LINES = [
+    ("bot", "안녕하세요! 오늘 하루는 어떠셨어요?"),
+    ("user", "아, 잘 지냈어요. 아침에 일찍 일어나서 산책도 다녀왔어요."),
+    ("bot", "산책 다녀오셨군요! 날씨는 어땠어요?"),
+    ("user", "날씨가 참 좋더라고요. 햇살도 따듯하고. 그런데 무릎이 조금 쑤시더라고요."),
+    ("bot", "무릎이 쑤시셨군요. 많이 불편하셨어요?"),
+    ("user", "걸을 때 좀 불편해요. 내일 병원 가기로 했어요."),
+]
+
+# 한 번의 발화가 평균 4초 정도 걸린다고 가정
+SECONDS_PER_TURN = 4
+
+
+def build_end_of_call_report(
+    minutes: int = 20,
+    vapi_call_id: str = "bench-call",
+    elder_id: int = 1,
+) -> dict:
+    """
+    Vapi end-of-call-report 웹훅 body 생성
+    
+    실제 payload처럼 messages 외에 artifact, costs, 중복 transcript 등
+    저장에 사용하지 않는 필드도 함께 채웁니다.
+    
+    Args:
+        minutes: 통화 길이 (분)
+        vapi_call_id: Vapi 통화 ID
+        elder_id: metadata에 넣을 어르신 ID
+    
+    Returns:
+        웹훅 body 딕셔너리
+    """
+    started_at = datetime(2025, 1, 20, 9, 0, 0)
+    ended_at = started_at + timedelta(minutes=minutes)
+    start_ms = int(started_at.timestamp() * 1000)
+    
+    turns = minutes * 60 // SECONDS_PER_TURN
+    messages = [{"role": "system", "message": "You are a compassionate assistant named Sori " * 40, "time": start_ms}]
+    for i in range(turns):
+        role, text = SAMPLE_LINES[i % len(SAMPLE_LINES)]
+        time_ms = start_ms + i * SECONDS_PER_TURN * 1000
+        messages.append({
+            "role": role,
+            "message": text,
+            "time": time_ms,
+            "endTime": time_ms + 3000,
+            "secondsFromStart": i * SECONDS_PER_TURN,
+            "duration": 3000,
+            "source": "",
+        })
+    
+    transcript = "\n".join(
+        f"{'AI' if m['role'] == 'bot' else 'User'}: {m['message']}" for m in messages[1:]
+    )
+    openai_messages = [
+        {"role": "assistant" if m["role"] == "bot" else m["role"], "content": m["message"]}
+        for m in messages
+    ]
+    call = {
+        "id": vapi_call_id,
+        "orgId": "org-bench",
+        "type": "webCall",
+        "status": "ended",
+        "assistantOverrides": {"metadata": {"elder_id": str(elder_id)}},
+        "monitor": {"listenUrl": "wss://example.invalid/listen", "controlUrl": "https://example.invalid/control"},
+    }
+    
+    return {
+        "message": {
+            "timestamp": int(ended_at.timestamp() * 1000),
+            "type": "end-of-call-report",
+            "analysis": {
+                "summary": "오늘은 어르신께서 무릎이 조금 쑤신다고 하셨는데, 산책은 다녀오셨다고 합니다.",
+                "structuredData": {"emotion": "보통", "tags": ["통증", "산책", "병원"]},
+                "successEvaluation": "true",
+            },
+            "artifact": {
+                "messages": messages,
+                "messagesOpenAIFormatted": openai_messages,
+                "transcript": transcript,
+                "recordingUrl": "https://example.invalid/recording.wav",
+            },
+            "startedAt": started_at.isoformat() + "Z",
+            "endedAt": ended_at.isoformat() + "Z",
+            "endedReason": "customer-ended-call",
+            "cost": 0.42,
+            "costBreakdown": {"transport": 0, "stt": 0.1, "llm": 0.2, "tts": 0.1, "vapi": 0.02, "total": 0.42},
+            "costs": [{"type": "model", "cost": 0.2, "promptTokens": 12000, "completionTokens": 800}] * 6,
+            "durationSeconds": minutes * 60,
+            "durationMs": minutes * 60 * 1000,
+            "transcript": transcript,
+            "recordingUrl": "https://example.invalid/recording.wav",
+            "summary": "오늘은 어르신께서 무릎이 조금 쑤신다고 하셨는데, 산책은 다녀오셨다고 합니다.",
+            "messages": messages,
+            "messagesOpenAIFormatted": openai_messages,
+            "call": call,
+            "assistant": {"name": "Sori", "model": {"messages": [{"role": "system", "content": "x" * 4000}]}},
+        }
+    }
+
+
+def build_call_detail_response(minutes: int = 20) -> CallDetailResponse:
+    """트랜스크립트가 긴 통화 상세 응답 생성"""
+    now = datetime(2025, 1, 20, 9, 0, 0)
+    turns = minutes * 60 // SECONDS_PER_TURN
+    messages = [
+        CallMessageItem(
+            role="user" if SAMPLE_LINES[i % len(SAMPLE_LINES)][0] == "user" else "assistant",
+            message=SAMPLE_LINES[i % len(SAMPLE_LINES)][1],
+            timestamp=now + timedelta(seconds=i * SECONDS_PER_TURN),
+        )
+        for i in range(turns)
+    ]
+    return CallDetailResponse(
+        id=1,
+        elder_name="김영희",
+        date="2025년 01월 20일",
+        time="09:00 AM",
+        duration=f"{minutes}분 0초",
+        status="completed",
+        emotion="보통",
+        summary="오늘은 어르신께서 무릎이 조금 쑤신다고 하셨는데, 산책은 다녀오셨다고 합니다.",
+        tags=["통증", "산책", "병원"],
+        messages=messages,
+    )
+
+
+def build_dashboard_response() -> DashboardResponse:
+    """최근 통화 10개와 주간 일정이 채워진 대시보드 응답 생성"""
+    now = datetime(2025, 1, 20, 9, 0, 0)
+    recent_calls = [
+        RecentCallItem(
+            id=i,
+            date=(now - timedelta(days=i)).strftime("%Y.%m.%d"),
+            time="09:00",
+            duration_minutes=random.randint(5, 20),
+            summary="오늘은 어르신께서 무릎이 조금 쑤신다고 하셨는데, 산책은 다녀오셨다고 합니다. " * 3,
+            tags=["통증", "산책", "병원"],
+            emotion="보통",
+            status="completed",
+        )
+        for i in range(10)
+    ]
+    return DashboardResponse(
+        elder=ElderBasicInfo(id=1, name="김영희", relation="어머니", service_days=90),
+        today_highlight=TodayHighlight(
+            message=recent_calls[0].summary,
+            call_time="09:00",
+            emotion="보통",
+            tags=recent_calls[0].tags,
+        ),
+        weekly_stats=WeeklyStats(
+            call_attempts=CallAttemptsStats(count=14),
+            call_success_count=CallSuccessStats(count=12),
+            avg_duration=AvgDurationStats(minutes=11),
+        ),
+        recent_calls=recent_calls,
+        next_scheduled_call=NextScheduledCall(
+            datetime=now + timedelta(hours=11),
+            date_display="2025년 1월 20일",
+            time_display="20:00",
+            is_today=True,
+        ),
+        this_week_schedule=[
+            WeeklyScheduleItem(
+                day_of_week="월요일",
+                date=(now + timedelta(days=d)).strftime("%Y-%m-%d"),
+                date_display=f"1월 {20 + d}일",
+                scheduled_times=["09:00", "20:00"],
+            )
+            for d in range(7)
+        ],
+    )
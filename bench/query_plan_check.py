@@ -0,0 +1,229 @@
+"""통화 조회 쿼리 실행 계획 확인
+
+대시보드 / 통화 상세 / digest 조회가 calls, call_messages, elder_daily_stats 인덱스를 타는지 확인합니다.
+임시 SQLite DB에 더미 데이터를 넣고 ANALYZE한 뒤, 실제 서비스 함수가 실행하는 SQL을 그대로 잡아서
+EXPLAIN QUERY PLAN 결과에
+- 기대한 인덱스가 사용되는지
+- 테이블 전체 SCAN이 없는지
+- (정렬이 필요한 쿼리는) 인덱스 순서로 읽어서 TEMP B-TREE 정렬이 없는지
+검사합니다. 하나라도 실패하면 exit code 1로 종료합니다.
+
+사용법:
+    cd server
+    python -m bench.query_plan_check
+    python -m bench.query_plan_check --calls 20000 --verbose
+"""
+import argparse
+import asyncio
+import random
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.base import Base
+from app.db.models.call import Call
+from app.db.models.call_message import CallMessage
+from app.db.models.elder import Elder
+from app.db.models.user import User
+from app.services import dashboard
+from app.services.daily_stats import DailyStatsService
+from app.services.digest import DigestService
+import app.db.models  # noqa: F401  (테이블 등록)
+
+STATUSES = ["completed", "completed", "completed", "failed", "no_answer"]
+
+
+async def seed(session_factory, args) -> None:
+    """보호자 / 어르신 / 통화 / 메시지 더미 데이터 생성 후 ANALYZE"""
+    rng = random.Random(7)
+    now = datetime(2025, 3, 12, 12, 0)
+    async with session_factory() as db:
+        for user_id in range(1, args.users + 1):
+            db.add(User(id=user_id, email=f"guardian{user_id}@example.com", report_email_mode="digest"))
+        for elder_id in range(1, args.elders + 1):
+            db.add(Elder(
+                id=elder_id, user_id=(elder_id - 1) % args.users + 1, name=f"어르신{elder_id}",
+                gender="female", age=80, relation="grandmother", phone="01000000000",
+                residence_type="alone", health_condition="good", begin_date=now - timedelta(days=365),
+                invite_code=f"{elder_id:06d}"
+            ))
+        await db.flush()
+
+        calls = []
+        for call_id in range(1, args.calls + 1):
+            elder_id = rng.randint(1, args.elders)
+            started_at = now - timedelta(seconds=rng.uniform(0, 180 * 86400))
+            duration = rng.uniform(60, 1200)
+            calls.append({
+                "id": call_id, "elder_id": elder_id, "user_id": (elder_id - 1) % args.users + 1,
+                "started_at": started_at, "ended_at": started_at + timedelta(seconds=duration),
+                "duration_seconds": duration,
+                "status": rng.choice(STATUSES), "summary": "요약", "emotion": "happy",
+                # 최근 하루 통화만 digest 대기
+                "digest_pending": started_at > now - timedelta(days=1),
+            })
+        for i in range(0, len(calls), 5000):
+            await db.execute(insert(Call), calls[i:i + 5000])
+
+        messages = [
+            {
+                "call_id": call["id"], "role": "assistant" if n % 2 else "user", "message": "안녕하세요",
+                "timestamp": call["started_at"] + timedelta(seconds=n * 5),
+            }
+            for call in calls
+            for n in range(args.messages)
+        ]
+        for i in range(0, len(messages), 10000):
+            await db.execute(insert(CallMessage), messages[i:i + 10000])
+        await DailyStatsService.rebuild(db)
+        # 인덱스 선택에 쓰이는 통계 갱신
+        await (await db.connection()).exec_driver_sql("ANALYZE")
+        await db.commit()
+
+
+async def check_weekly_stats(db: AsyncSession) -> None:
+    week_start, week_end = dashboard.get_week_range(datetime(2025, 3, 12))
+    await dashboard.get_weekly_stats(db, 1, week_start, week_end)
+
+
+async def check_dashboard_summary(db: AsyncSession) -> None:
+    week_start, week_end = dashboard.get_week_range(datetime(2025, 3, 12))
+    await dashboard.get_dashboard_summary(db, 1, week_start, week_end)
+
+
+async def check_recent_calls(db: AsyncSession) -> None:
+    await dashboard.get_recent_calls(db, 1)
+
+
+async def check_call_list(db: AsyncSession) -> None:
+    await dashboard.get_call_list_paginated(db, 1, page=3, page_size=5)
+
+
+async def check_call_list_cursor(db: AsyncSession) -> None:
+    _, next_cursor = await dashboard.get_call_list_by_cursor(db, 1, page_size=5)
+    await dashboard.get_call_list_by_cursor(db, 1, next_cursor, page_size=5)
+    await dashboard.count_calls(db, 1, limit=dashboard.CALL_LIST_COUNT_LIMIT)
+
+
+async def check_transcript_pages(db: AsyncSession) -> None:
+    # 첫 페이지 + cursor로 다음 페이지
+    _, next_cursor = await dashboard.get_transcript_page(db, 1, None, 5)
+    await dashboard.get_transcript_page(db, 1, next_cursor, 5)
+
+
+async def check_guardian_overview(db: AsyncSession) -> None:
+    await dashboard.get_guardian_overview(db, 1, datetime(2025, 3, 12, 12, 0))
+
+
+async def check_pending_digests(db: AsyncSession) -> None:
+    # 아직 digest에 포함되지 않은 통화 조회 (마지막 검사라 digest_pending 해제는 그대로 커밋)
+    await DigestService.build_due_digests(db, now=datetime(2025, 3, 12, 12, 0))
+
+
+# elder_daily_stats (elder_id, day) 복합 primary key에 SQLite가 만드는 인덱스
+DAILY_STATS_PK = "sqlite_autoindex_elder_daily_stats_1"
+
+# (이름, 실행 함수, 테이블, 기대 인덱스, 인덱스 순서로 정렬되어야 하는지)
+CHECKS = [
+    ("weekly stats", check_weekly_stats, "elder_daily_stats", DAILY_STATS_PK, False),
+    ("dashboard summary", check_dashboard_summary, "elder_daily_stats", DAILY_STATS_PK, False),
+    ("dashboard summary", check_dashboard_summary, "calls", "ix_calls_elder_id_started_at", False),
+    ("recent calls", check_recent_calls, "calls", "ix_calls_elder_id_started_at", True),
+    ("call list", check_call_list, "calls", "ix_calls_elder_id_started_at", True),
+    ("call list cursor", check_call_list_cursor, "calls", "ix_calls_elder_id_started_at", True),
+    ("call transcript pages", check_transcript_pages, "call_messages", "ix_call_messages_call_id_timestamp", True),
+    ("guardian overview", check_guardian_overview, "elder_daily_stats", DAILY_STATS_PK, False),
+    ("guardian overview", check_guardian_overview, "calls", "ix_calls_elder_id_started_at", False),
+    ("pending digests", check_pending_digests, "calls", "ix_calls_digest_pending_user_id_started_at", True),
+]
+
+
+def validate_plan(plan: list[str], table: str, index: str, ordered: bool) -> list[str]:
+    """EXPLAIN QUERY PLAN detail 목록을 검사해서 문제 목록 반환"""
+    problems = []
+    # 서브쿼리에서 같은 테이블을 aliased로 쓰면 calls_1처럼 표시됨
+    table_steps = [step for step in plan if re.search(rf"\b(SCAN|SEARCH) {table}(_\d+)?\b", step)]
+    if not any(index in step for step in table_steps):
+        problems.append(f"{index} 미사용")
+    for step in table_steps:
+        if step.startswith("SCAN") and "INDEX" not in step:
+            problems.append(f"전체 스캔: {step}")
+    if ordered and any("TEMP B-TREE" in step for step in plan):
+        problems.append("인덱스 순서 대신 임시 정렬 사용")
+    return problems
+
+
+async def run(args, database_url: str) -> bool:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(session_factory, args)
+
+    captured: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, tuple(parameters)))
+
+    print("=" * 60)
+    print(f"🔎 Query plan check: {args.calls} calls, {args.calls * args.messages} messages")
+    print("=" * 60)
+
+    ok = True
+    for name, fn, table, index, ordered in CHECKS:
+        captured.clear()
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        async with session_factory() as db:
+            await fn(db)
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        statements = [(sql, params) for sql, params in captured if re.search(rf"\bFROM {table}\b", sql)]
+        if not statements:
+            print(f"❌ {name}: {table} 조회 쿼리를 찾지 못했습니다")
+            ok = False
+            continue
+
+        async with engine.connect() as conn:
+            for sql, params in statements:
+                result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = [row[-1] for row in result.all()]
+                problems = validate_plan(plan, table, index, ordered)
+                print(f"{'❌' if problems else '✅'} {name}: {'; '.join(problems) or index}")
+                if problems or args.verbose:
+                    print("    " + " ".join(sql.split())[:200])
+                    for step in plan:
+                        print(f"    └ {step}")
+                ok = ok and not problems
+
+    print("=" * 60)
+    await engine.dispose()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통화 조회 쿼리 실행 계획 확인")
+    parser.add_argument("--calls", type=int, default=5000, help="통화 수")
+    parser.add_argument("--messages", type=int, default=10, help="통화당 메시지 수")
+    parser.add_argument("--elders", type=int, default=50, help="어르신 수")
+    parser.add_argument("--users", type=int, default=25, help="보호자 수")
+    parser.add_argument("--verbose", action="store_true", help="통과한 쿼리의 실행 계획도 출력")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        ok = asyncio.run(run(args, f"sqlite+aiosqlite:///{db_dir}/plan.db"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
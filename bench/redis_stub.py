@@ -0,0 +1,184 @@
+"""로컬 Redis stand-in (RESP2 / RESP3)
+
+Redis 서버 없이 DASHBOARD_CACHE_BACKEND=redis 경로를 실행해보기 위한 최소 구현입니다.
+대시보드 캐시가 쓰는 명령만 지원합니다.
+- HELLO (redis-py 기본값인 RESP3 전환), PING, GET, SET (EX / PX / NX / XX), DEL, EXISTS, PTTL,
+  DBSIZE, FLUSHDB / FLUSHALL, SELECT
+- CLIENT (redis-py 연결 시 보내는 SETINFO 등은 OK로 응답)
+- STATS: 명령 수 / GET hit / miss / 연결 수 (stand-in 전용)
+
+만료는 조회할 때 확인하며 모든 DB 번호가 같은 keyspace를 씁니다.
+
+사용법:
+    cd server
+    python -m bench.redis_stub --port 6380 --latency-ms 0.5
+    DASHBOARD_CACHE_BACKEND=redis DASHBOARD_CACHE_REDIS_URL=redis://127.0.0.1:6380/0 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import time
+
+
+class RedisStub:
+    """RESP 명령을 처리하는 in-memory key-value 저장소"""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self._data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands = 0
+        self.hits = 0
+        self.misses = 0
+        self.connections = 0
+
+    def _get_entry(self, key: bytes) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def execute(self, args: list[bytes]):
+        """명령 실행 후 응답 값 반환 (bytes: bulk string, str: simple string, int, None, Exception)"""
+        self.commands += 1
+        command = args[0].upper().decode()
+
+        if command == "PING":
+            return args[1] if len(args) > 1 else "PONG"
+        if command == "GET":
+            value = self._get_entry(args[1])
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+        if command == "SET":
+            return self._set(args[1], args[2], args[3:])
+        if command == "DEL":
+            deleted = 0
+            for key in args[1:]:
+                if self._get_entry(key) is not None:
+                    del self._data[key]
+                    deleted += 1
+            return deleted
+        if command == "EXISTS":
+            return sum(1 for key in args[1:] if self._get_entry(key) is not None)
+        if command == "PTTL":
+            if self._get_entry(args[1]) is None:
+                return -2
+            expires_at = self._data[args[1]][1]
+            return -1 if expires_at is None else int((expires_at - time.monotonic()) * 1000)
+        if command == "DBSIZE":
+            return sum(1 for key in list(self._data) if self._get_entry(key) is not None)
+        if command in ("FLUSHDB", "FLUSHALL"):
+            self._data.clear()
+            return "OK"
+        if command in ("SELECT", "CLIENT"):
+            return "OK"
+        if command == "STATS":
+            return (
+                f"commands:{self.commands} hits:{self.hits} misses:{self.misses} "
+                f"connections:{self.connections} keys:{len(self._data)}"
+            ).encode()
+        return ValueError(f"ERR unknown command '{command}'")
+
+    def _set(self, key: bytes, value: bytes, options: list[bytes]):
+        expires_at = None
+        i = 0
+        while i < len(options):
+            option = options[i].upper()
+            if option in (b"EX", b"PX"):
+                amount = int(options[i + 1])
+                expires_at = time.monotonic() + (amount if option == b"EX" else amount / 1000)
+                i += 2
+                continue
+            if option == b"NX" and self._get_entry(key) is not None:
+                return None
+            if option == b"XX" and self._get_entry(key) is None:
+                return None
+            i += 1
+        self._data[key] = (value, expires_at)
+        return "OK"
+
+    @staticmethod
+    def hello(protocol: int) -> dict:
+        return {"server": "redis", "version": "7.2.0", "proto": protocol, "id": 1, "mode": "standalone", "role": "master", "modules": []}
+
+    @staticmethod
+    def encode(value, protocol: int = 2) -> bytes:
+        if value is None:
+            return b"_\r\n" if protocol == 3 else b"$-1\r\n"
+        if isinstance(value, dict):
+            items = [item for pair in value.items() for item in pair]
+            header = f"%{len(value)}\r\n" if protocol == 3 else f"*{len(items)}\r\n"
+            return header.encode() + b"".join(RedisStub.encode(item, protocol) for item in items)
+        if isinstance(value, list):
+            return f"*{len(value)}\r\n".encode() + b"".join(RedisStub.encode(item, protocol) for item in value)
+        if isinstance(value, str) and value not in ("OK", "PONG"):
+            return b"$%d\r\n%s\r\n" % (len(value.encode()), value.encode())
+        if isinstance(value, Exception):
+            return f"-{value}\r\n".encode()
+        if isinstance(value, str):
+            return f"+{value}\r\n".encode()
+        if isinstance(value, int):
+            return f":{value}\r\n".encode()
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        protocol = 2
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.startswith(b"*"):
+                    # inline 명령 (redis-cli 등)
+                    args = line.split()
+                else:
+                    args = []
+                    for _ in range(int(line[1:])):
+                        length = int((await reader.readline())[1:])
+                        args.append((await reader.readexactly(length + 2))[:-2])
+                if not args:
+                    continue
+                if self.latency_ms:
+                    await asyncio.sleep(self.latency_ms / 1000)
+                if args[0].upper() == b"HELLO":
+                    # 연결별 프로토콜 전환 (HELLO 3 → RESP3)
+                    protocol = int(args[1]) if len(args) > 1 else protocol
+                    writer.write(self.encode(self.hello(protocol), protocol))
+                else:
+                    writer.write(self.encode(self.execute(args), protocol))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str, port: int, latency_ms: float) -> None:
+    stub = RedisStub(latency_ms)
+    server = await asyncio.start_server(stub.handle, host, port)
+    print(f"🧰 Redis stub: redis://{host}:{port}/0 (latency {latency_ms}ms)")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Redis stand-in (RESP2)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6380)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="명령당 응답 지연 (ms)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.latency_ms))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""다음 예정 통화 / 이번 주 일정 계산 micro-benchmark
+
+스케줄이 n개인 어르신의 대시보드 일정 부분을 두 방식으로 계산합니다.
+- schedules: 이전 구현 (CallSchedule 목록 × 8일을 돌면서 strftime("%A") / 요일 문자열 비교)
+- offsets: 스케줄 변경 시 미리 계산한 정렬된 주간 offset(Elder.schedule_offsets)에서 bisect
+여러 현재 시각에 대해 두 결과가 같은지 확인한 뒤 호출당 평균 시간을 출력합니다. DB는 사용하지 않습니다.
+
+사용법:
+    cd server
+    python -m bench.schedule_bench
+    python -m bench.schedule_bench --sizes 3 14 50 --iterations 20000
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, time as dt_time
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.schemas.dashboard import NextScheduledCall, WeeklyScheduleItem
+from app.services.call_schedule import CallScheduleService
+from app.services.dashboard import find_next_scheduled_call, build_weekly_schedule, get_week_range, WEEKDAY_KR
+
+DAYS = list(CallScheduleService.WEEKDAY_TO_NUM)
+
+
+def find_next_scheduled_call_before(call_schedules, now: datetime) -> NextScheduledCall | None:
+    """이전 구현: 스케줄마다 8일을 돌면서 요일 문자열 비교"""
+    if not call_schedules:
+        return None
+    upcoming_calls = []
+    for schedule in call_schedules:
+        for day_offset in range(8):
+            target_date = now.date() + timedelta(days=day_offset)
+            target_weekday = target_date.strftime("%A").lower()
+            if schedule.day_of_week.lower() == target_weekday:
+                scheduled_datetime = datetime.combine(target_date, schedule.time)
+                if scheduled_datetime > now:
+                    upcoming_calls.append((scheduled_datetime, schedule))
+    if not upcoming_calls:
+        return None
+    upcoming_calls.sort(key=lambda x: x[0])
+    next_datetime, _ = upcoming_calls[0]
+    return NextScheduledCall(
+        datetime=next_datetime,
+        date_display=next_datetime.strftime("%Y년 %m월 %d일").lstrip("0").replace("월 0", "월 "),
+        time_display=next_datetime.strftime("%H:%M"),
+        is_today=next_datetime.date() == now.date()
+    )
+
+
+def build_weekly_schedule_before(call_schedules, week_start: datetime) -> list[WeeklyScheduleItem]:
+    """이전 구현: 요일마다 전체 스케줄을 돌면서 요일 문자열 비교"""
+    weekly_items = []
+    for day_offset in range(7):
+        target_date = week_start.date() + timedelta(days=day_offset)
+        target_weekday_en = target_date.strftime("%A").lower()
+        scheduled_times = sorted(
+            schedule.time.strftime("%H:%M")
+            for schedule in call_schedules
+            if schedule.day_of_week.lower() == target_weekday_en
+        )
+        weekly_items.append(WeeklyScheduleItem(
+            day_of_week=WEEKDAY_KR.get(target_weekday_en, target_weekday_en),
+            date=target_date.strftime("%Y-%m-%d"),
+            date_display=target_date.strftime("%m월 %d일").lstrip("0").replace("월 0", "월 "),
+            scheduled_times=scheduled_times
+        ))
+    return weekly_items
+
+
+def build_schedules(rng: random.Random, size: int) -> list[SimpleNamespace]:
+    """요일 / 시간이 무작위인 스케줄 size개 (CallSchedule과 같은 속성)"""
+    return [
+        SimpleNamespace(day_of_week=rng.choice(DAYS), time=dt_time(rng.randint(6, 21), rng.choice([0, 15, 30, 45])))
+        for _ in range(size)
+    ]
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다음 예정 통화 / 이번 주 일정 계산 micro-benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 14, 50, 200], help="어르신 한 명의 스케줄 수")
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    base = datetime(2025, 3, 10)
+
+    print("=" * 60)
+    print(f"🗓️ Schedule benchmark: sizes={args.sizes}, {args.iterations} iterations")
+    print("=" * 60)
+
+    same = True
+    for size in args.sizes:
+        schedules = build_schedules(rng, size)
+        offsets = CallScheduleService.build_schedule_offsets(schedules)
+
+        # 두 주 동안 무작위 시각 + 스케줄 시각 정각에서 결과 비교
+        nows = [base + timedelta(seconds=rng.randint(0, 14 * 86400)) for _ in range(300)]
+        nows += [base + timedelta(seconds=offset) for offset in offsets]
+        matched = all(
+            find_next_scheduled_call_before(schedules, now) == find_next_scheduled_call(offsets, now)
+            and build_weekly_schedule_before(schedules, get_week_range(now)[0])
+            == build_weekly_schedule(offsets, get_week_range(now)[0])
+            for now in nows
+        )
+        same = same and matched
+
+        now = nows[0]
+        week_start = get_week_range(now)[0]
+        print(f"\n📊 스케줄 {size}개 {'✅' if matched else '❌'}")
+        for name, before, after in [
+            ("next call", lambda: find_next_scheduled_call_before(schedules, now),
+             lambda: find_next_scheduled_call(offsets, now)),
+            ("weekly grid", lambda: build_weekly_schedule_before(schedules, week_start),
+             lambda: build_weekly_schedule(offsets, week_start)),
+        ]:
+            before_us = per_call_us(before, args.iterations)
+            after_us = per_call_us(after, args.iterations)
+            print(f"  - {name}: schedules {before_us:.1f}µs, offsets {after_us:.1f}µs ({before_us / after_us:.1f}배)")
+
+    print(f"\n{'✅' if same else '❌'} 결과 일치: {same}")
+    print("=" * 60)
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""통화 검색(GET /dashboard/{elder_id}/search) 벤치마크
+
+대화 내용이 긴 통화가 수천 건 쌓인 어르신 한 명의 통화를
+- like: calls.summary / call_messages.message LIKE '%검색어%' (인덱스 없이 전체 메시지 스캔)
+- index: 검색 인덱스(call_search, SQLite는 bigram FTS5) 조회 (app.services.search.CallSearchService.search_calls)
+두 방식으로 검색하고, 일치하는 통화 집합이 같은지 확인한 뒤 첫 페이지 평균 / p95 지연 시간을 출력합니다.
+검색 인덱스는 통화를 넣은 뒤 CallSearchService.index_calls로 채웁니다.
+
+기본값은 임시 SQLite DB이며, --database-url로 PostgreSQL 등 다른 DB를 지정할 수 있습니다.
+(지정한 DB의 테이블은 create_all로 생성되고 벤치마크 데이터가 추가되므로 빈 DB를 사용하세요.)
+
+사용법:
+    cd server
+    python -m bench.search_bench
+    python -m bench.search_bench --calls 5000 --messages 60 --iterations 20
+    python -m bench.search_bench --database-url postgresql+asyncpg://user:pw@localhost/bench
+"""
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import select, insert, or_, exists
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.base import Base
+from app.db.models.call import Call
+from app.db.models.call_message import CallMessage
+from app.db.models.elder import Elder
+from app.db.models.user import User
+from app.services.search import CallSearchService
+import app.db.models  # noqa: F401  (테이블 등록)
+
+WORDS = [
+    "오늘", "식사", "점심", "산책", "날씨", "손녀", "아들", "병원", "약", "혈압",
+    "무릎", "허리", "잠", "텔레비전", "시장", "김치", "노인정", "친구", "전화", "운동",
+]
+# 흔한 2글자 / 흔한 3글자 이상 / 드문 여러 단어 / 드문 단어 / 없는 단어 / 1글자 + 2글자 (1글자는 instr)
+QUERIES = ["무릎", "텔레비전", "병원 예약", "물리치료", "보청기", "약 보청기"]
+RARE_PHRASES = ["병원 예약", "물리치료"]
+
+
+async def search_like(db: AsyncSession, elder_id: int, query: str, limit: int | None) -> list[int]:
+    """인덱스 없는 검색: 모든 검색어가 요약 또는 메시지에 있는 통화 (최신순)"""
+    stmt = select(Call.id).where(Call.elder_id == elder_id)
+    for term in CallSearchService.parse_terms(query):
+        pattern = f"%{term}%"
+        stmt = stmt.where(or_(
+            Call.summary.ilike(pattern),
+            exists().where(CallMessage.call_id == Call.id).where(CallMessage.message.ilike(pattern)),
+        ))
+    stmt = stmt.order_by(Call.started_at.desc(), Call.id.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def search_index(db: AsyncSession, elder_id: int, query: str, limit: int | None) -> list[int]:
+    """검색 인덱스 조회 (limit=None이면 모든 페이지)"""
+    if limit is not None:
+        response = await CallSearchService.search_calls(db, elder_id, query, 1, limit)
+        return [item.id for item in response.items]
+
+    call_ids, page = [], 1
+    while True:
+        response = await CallSearchService.search_calls(db, elder_id, query, page, 50)
+        call_ids += [item.id for item in response.items]
+        if not response.has_next:
+            return call_ids
+        page += 1
+
+
+async def seed(session_factory, args) -> None:
+    """보호자 1명, 어르신 args.elders명, 대상 어르신(id=1)에 통화 args.calls건 (통화마다 메시지 args.messages개)"""
+    rng = random.Random(42)
+    base = datetime(2025, 3, 12, 12, 0)
+    async with session_factory() as db:
+        db.add(User(id=1, email="bench@example.com"))
+        for elder_id in range(1, args.elders + 1):
+            db.add(Elder(
+                id=elder_id, user_id=1, name=f"어르신{elder_id}", gender="female", age=80,
+                relation="grandmother", phone="01000000000", residence_type="alone",
+                health_condition="good", begin_date=base - timedelta(days=365),
+                invite_code=f"{elder_id:06d}"[-6:]
+            ))
+        await db.flush()
+
+        call_rows = []
+        for i in range(args.calls * 2):
+            # 절반은 대상 어르신, 나머지는 다른 어르신 통화 (필터링 대상)
+            elder_id = 1 if i % 2 == 0 else rng.randint(2, args.elders)
+            call_rows.append({
+                "id": i + 1, "elder_id": elder_id, "user_id": 1,
+                "started_at": base - timedelta(hours=i), "status": "completed",
+                "summary": " ".join(rng.choices(WORDS, k=8)),
+            })
+
+        message_rows = []
+        for call in call_rows:
+            for j in range(args.messages):
+                message = " ".join(rng.choices(WORDS, k=12))
+                # 드문 검색어는 일부 통화에만
+                if rng.random() < 0.002:
+                    message += " " + rng.choice(RARE_PHRASES)
+                message_rows.append({
+                    "call_id": call["id"], "role": "user" if j % 2 else "assistant",
+                    "message": message, "timestamp": call["started_at"] + timedelta(seconds=j * 10),
+                })
+
+        for i in range(0, len(call_rows), 5000):
+            await db.execute(insert(Call), call_rows[i:i + 5000])
+        for i in range(0, len(message_rows), 5000):
+            await db.execute(insert(CallMessage), message_rows[i:i + 5000])
+
+        start = time.perf_counter()
+        await CallSearchService.index_calls(db)
+        await db.commit()
+        print(f"🗂️ 검색 인덱스 생성: {time.perf_counter() - start:.2f}s")
+
+
+async def measure(session_factory, fn, query: str, iterations: int, page_size: int):
+    """fn을 iterations번 실행해서 (첫 페이지 결과, 지연 시간 리스트) 반환"""
+    timings = []
+    call_ids = []
+    for _ in range(iterations):
+        async with session_factory() as db:
+            start = time.perf_counter()
+            call_ids = await fn(db, 1, query, page_size)
+            timings.append(time.perf_counter() - start)
+    return call_ids, sorted(timings)
+
+
+async def run(args, database_url: str) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print("=" * 60)
+    print(f"🔎 Call search benchmark: {args.calls} calls x {args.messages} messages "
+          f"(+{args.calls} other elder calls), {args.iterations} iterations, {engine.dialect.name}")
+    print("=" * 60)
+    await seed(session_factory, args)
+
+    same = True
+    for query in QUERIES:
+        # 일치하는 통화 집합 비교 (순서는 like: 최신순, index: 관련도순)
+        async with session_factory() as db:
+            like_ids = set(await search_like(db, 1, query, None))
+            index_ids = set(await search_index(db, 1, query, None))
+        matched = like_ids == index_ids
+        same = same and matched
+
+        print(f"\n📊 q={query!r}: 일치 통화 {len(index_ids)}건 {'✅' if matched else '❌'}")
+        means = {}
+        for name, fn in [("like", search_like), ("index", search_index)]:
+            # warm-up
+            await measure(session_factory, fn, query, 2, args.page_size)
+            _, timings = await measure(session_factory, fn, query, args.iterations, args.page_size)
+            means[name] = sum(timings) / len(timings)
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"  - {name}: 평균 {means[name] * 1000:.2f}ms, p95 {p95 * 1000:.2f}ms")
+        print(f"  - index가 like보다 {means['like'] / means['index']:.1f}배 빠름")
+
+    print(f"\n{'✅' if same else '❌'} 결과 일치: {same}")
+    print("=" * 60)
+
+    await engine.dispose()
+    if not same:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통화 검색 벤치마크")
+    parser.add_argument("--calls", type=int, default=2000, help="대상 어르신의 통화 수")
+    parser.add_argument("--messages", type=int, default=40, help="통화당 메시지 수")
+    parser.add_argument("--elders", type=int, default=20, help="어르신 수 (대상 1명 + 나머지)")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--database-url", help="벤치마크용 DB (기본값: 임시 SQLite)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(run(args, args.database_url))
+        return
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        asyncio.run(run(args, f"sqlite+aiosqlite:///{db_dir}/bench.db"))
+
+
+if __name__ == "__main__":
+    main()
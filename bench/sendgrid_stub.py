@@ -0,0 +1,149 @@
+"""로컬 SendGrid v3 /mail/send stand-in
+
+실제 SendGrid 키 없이 이메일 경로(app/services/email.py, email_outbox)를 실행해보기 위한 HTTP 서버입니다.
+- POST /v3/mail/send: 요청 body 형식 확인 후 지연(latency) 뒤 202 또는 설정한 비율로 실패 응답
+- GET /stats: 받은 요청 / personalization / 실패 수, 클라이언트 연결 수, 최대 동시 처리 수
+- POST /stats/reset: 통계 초기화
+
+사용법:
+    cd server
+    python -m bench.sendgrid_stub --port 8025 --latency-ms 80 --failure-rate 0.05
+    SENDGRID_API_URL=http://127.0.0.1:8025 DEBUG=False uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import random
+
+import orjson
+import uvicorn
+
+
+class SendGridStub:
+    """SendGrid v3 mail send API를 흉내내는 ASGI 앱"""
+
+    def __init__(
+        self,
+        latency_ms: float,
+        jitter_ms: float,
+        failure_rate: float,
+        failure_status: int,
+        seed: int | None = None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.random = random.Random(seed)
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.personalizations = 0
+        self.failures = 0
+        self.invalid = 0
+        self.clients: set[tuple] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "personalizations": self.personalizations,
+            "failures": self.failures,
+            "invalid": self.invalid,
+            "connections": len(self.clients),
+            "max_in_flight": self.max_in_flight,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        path, method = scope["path"], scope["method"]
+        if path == "/stats" and method == "GET":
+            return await self._respond(send, 200, self.stats())
+        if path == "/stats/reset" and method == "POST":
+            self.reset()
+            return await self._respond(send, 200, {"ok": True})
+        if path != "/v3/mail/send" or method != "POST":
+            return await self._respond(send, 404, {"errors": [{"message": "not found"}]})
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        self.requests += 1
+        if scope.get("client"):
+            self.clients.add(tuple(scope["client"]))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await self._mail_send(scope, body, send)
+        finally:
+            self.in_flight -= 1
+
+    async def _mail_send(self, scope, body: bytes, send):
+        headers = dict(scope["headers"])
+        if not headers.get(b"authorization", b"").startswith(b"Bearer "):
+            self.invalid += 1
+            return await self._respond(send, 401, {"errors": [{"message": "authorization required"}]})
+
+        try:
+            payload = orjson.loads(body)
+            personalizations = payload["personalizations"]
+            assert payload["from"]["email"] and payload["content"]
+            assert 1 <= len(personalizations) <= 1000
+            assert all(p["to"][0]["email"] for p in personalizations)
+        except Exception:
+            self.invalid += 1
+            return await self._respond(send, 400, {"errors": [{"message": "invalid request body"}]})
+
+        delay = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        await asyncio.sleep(max(delay, 0) / 1000)
+
+        if self.random.random() < self.failure_rate:
+            self.failures += 1
+            return await self._respond(send, self.failure_status, {"errors": [{"message": "stub failure"}]})
+
+        self.personalizations += len(personalizations)
+        return await self._respond(send, 202, None)
+
+    @staticmethod
+    async def _respond(send, status: int, data: dict | None):
+        body = orjson.dumps(data) if data is not None else b""
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 SendGrid /v3/mail/send stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--latency-ms", type=float, default=80, help="응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=20, help="응답 지연 편차 (±ms)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="실패 응답 비율 (0~1)")
+    parser.add_argument("--failure-status", type=int, default=503, help="실패 응답 status code")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    app = SendGridStub(args.latency_ms, args.jitter_ms, args.failure_rate, args.failure_status, args.seed)
+    print(f"📮 SendGrid stub: http://{args.host}:{args.port}/v3/mail/send "
+          f"(latency {args.latency_ms}±{args.jitter_ms}ms, failure {args.failure_rate:.0%} → {args.failure_status})")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""응답 직렬화 / 웹훅 파싱 벤치마크 (stdlib json vs orjson)
+
+측정 항목:
+- 통화 상세(CallDetailResponse), 대시보드(DashboardResponse) 응답
+  : FastAPI 기본 경로(Pydantic 직렬화) vs ORJSONResponse
+- assistant config (response_model 없는 dict 응답)
+  : 기본 JSONResponse(jsonable_encoder + json.dumps) vs ORJSONResponse
+- end-of-call-report 웹훅 body 파싱 및 로그 파일 직렬화
+
+사용법:
+    cd server
+    python -m bench.serialization_bench
+    python -m bench.serialization_bench --minutes 20 --iterations 500
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import warnings
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import orjson
+from fastapi import FastAPI
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.responses import ORJSONResponse
+from app.schemas.dashboard import CallDetailResponse, DashboardResponse
+from app.services.call import CallService
+from bench.payloads import (
+    build_end_of_call_report,
+    build_call_detail_response,
+    build_dashboard_response,
+)
+
+
+def build_app(detail: CallDetailResponse, dashboard: DashboardResponse, config: dict, use_orjson: bool) -> FastAPI:
+    """before(기본 JSON) / after(orjson) 비교용 최소 앱"""
+    app = FastAPI(default_response_class=ORJSONResponse) if use_orjson else FastAPI()
+    
+    @app.get("/detail", response_model=CallDetailResponse)
+    async def get_detail():
+        return detail
+    
+    @app.get("/dashboard", response_model=DashboardResponse)
+    async def get_dashboard():
+        return dashboard
+    
+    @app.get("/config")
+    async def get_config():
+        if use_orjson:
+            return ORJSONResponse(config)
+        return config
+    
+    return app
+
+
+async def time_requests(app: FastAPI, path: str, iterations: int) -> float:
+    """ASGI 앱에 직접 요청하여 평균 응답 시간(ms) 측정"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(20):
+            await client.get(path)
+        
+        start = time.perf_counter()
+        for _ in range(iterations):
+            response = await client.get(path)
+            response.raise_for_status()
+        return (time.perf_counter() - start) / iterations * 1000
+
+
+def time_call(func, iterations: int) -> float:
+    """함수 호출 평균 시간(ms) 측정"""
+    for _ in range(5):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def print_row(label: str, before: float, after: float):
+    print(f"  {label:<32} {before:>9.3f}ms {after:>9.3f}ms  x{before / after:.2f}")
+
+
+async def main(minutes: int, iterations: int):
+    warnings.simplefilter("ignore")
+    
+    detail = build_call_detail_response(minutes)
+    dashboard = build_dashboard_response()
+    elder = SimpleNamespace(
+        name="김영희", age=75, gender="여", residence_type="독거", health_condition="양호",
+        ask_meal=True, ask_medication=True, ask_emotion=True, ask_special_event=True,
+        additional_info="무릎 통증으로 병원 진료 중",
+    )
+    config = await CallService.get_assistant_config(elder)
+    report = build_end_of_call_report(minutes)
+    raw_report = json.dumps(report, ensure_ascii=False).encode("utf-8")
+    
+    print("=" * 70)
+    print(f"📊 직렬화 벤치마크 (통화 {minutes}분, 메시지 {len(detail.messages)}개, 반복 {iterations}회)")
+    print(f"   웹훅 body 크기: {len(raw_report) / 1024:.1f} KB")
+    print("=" * 70)
+    print(f"  {'':<32} {'stdlib':>11} {'orjson':>11}")
+    
+    before_app = build_app(detail, dashboard, config, use_orjson=False)
+    after_app = build_app(detail, dashboard, config, use_orjson=True)
+    for label, path in [
+        ("GET call-detail (response_model)", "/detail"),
+        ("GET dashboard (response_model)", "/dashboard"),
+        ("GET assistant-config (dict)", "/config"),
+    ]:
+        before = await time_requests(before_app, path, iterations)
+        after = await time_requests(after_app, path, iterations)
+        print_row(label, before, after)
+    
+    print_row(
+        "webhook body parse",
+        time_call(lambda: json.loads(raw_report), iterations),
+        time_call(lambda: orjson.loads(raw_report), iterations),
+    )
+    print_row(
+        "webhook log dump (indent=2)",
+        time_call(lambda: json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8"), iterations),
+        time_call(lambda: orjson.dumps(report, option=orjson.OPT_INDENT_2), iterations),
+    )
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="stdlib json vs orjson 직렬화 벤치마크")
+    parser.add_argument("--minutes", type=int, default=20, help="통화 길이 (분)")
+    parser.add_argument("--iterations", type=int, default=300, help="반복 횟수")
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.minutes, args.iterations))
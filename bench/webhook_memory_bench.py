@@ -0,0 +1,120 @@
+"""end-of-call-report 파싱 메모리 벤치마크
+
+20분 통화 웹훅을 두 방식으로 처리할 때의 peak 메모리(tracemalloc)를 비교합니다.
+- 전체 로드: body 전체를 받아 한 번에 파싱하고 CallMessage 행을 모두 만든 뒤 insert
+- 스트리밍: body를 파일로 흘려 쓰고, 필요한 필드만 추출한 뒤 messages를 batch 단위로 처리
+
+DB insert는 실행하지 않고, insert에 넘길 행(dict)을 만드는 데까지만 측정합니다.
+
+사용법:
+    cd server
+    python -m bench.webhook_memory_bench
+    python -m bench.webhook_memory_bench --minutes 20 --bursts 10
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.webhook_parser import load_webhook_body, iter_report_messages
+from bench.payloads import build_end_of_call_report
+
+CHUNK_SIZE = 64 * 1024
+BATCH_SIZE = 500
+
+
+def to_rows(messages, call_id: int = 1):
+    """CallService와 같은 방식으로 CallMessage insert용 행 생성"""
+    for msg in messages:
+        if msg.get("role") not in ["user", "bot"]:
+            continue
+        yield {
+            "call_id": call_id,
+            "role": "user" if msg["role"] == "user" else "assistant",
+            "message": msg.get("message", ""),
+            "timestamp": datetime.fromtimestamp(msg["time"] / 1000.0),
+        }
+
+
+def ingest_full(raw: bytes) -> int:
+    """기존 방식: body 전체 로드 + 행 전체 생성"""
+    body_bytes = bytes(raw)  # await request.body()
+    body = orjson.loads(body_bytes)
+    rows = list(to_rows(body["message"]["messages"]))
+    return len(rows)
+
+
+def ingest_streaming(raw: bytes, directory: Path) -> int:
+    """스트리밍 방식: 파일로 흘려 쓰고 필요한 필드 + batch 단위 행 생성"""
+    path = directory / "report.json"
+    with open(path, "wb") as f:
+        for i in range(0, len(raw), CHUNK_SIZE):
+            f.write(raw[i:i + CHUNK_SIZE])  # async for chunk in request.stream()
+    
+    body = load_webhook_body(path)
+    messages = body["message"].get("messages")
+    if messages is None:
+        messages = iter_report_messages(path)
+    
+    count = 0
+    batch = []
+    for row in to_rows(messages):
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            count += len(batch)
+            batch = []
+    return count + len(batch)
+
+
+def measure(func, *args) -> tuple[int, float, int]:
+    """(peak bytes, 경과 ms, 결과) 측정 (시간은 tracemalloc 없이 따로 측정)"""
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = (time.perf_counter() - start) * 1000
+    
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, result
+
+
+def main(minutes: int, bursts: int):
+    report = build_end_of_call_report(minutes)
+    raw = orjson.dumps(report)
+    
+    print("=" * 70)
+    print(f"🧠 end-of-call-report 메모리 벤치마크 (통화 {minutes}분)")
+    print(f"   body 크기: {len(raw) / 1024 / 1024:.2f} MB, 메시지 {len(report['message']['messages'])}개")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        full_peak, full_ms, full_count = measure(ingest_full, raw)
+        stream_peak, stream_ms, stream_count = measure(ingest_streaming, raw, Path(tmp))
+    
+    assert full_count == stream_count
+    
+    print(f"  {'':<12} {'peak memory':>14} {'time':>10}")
+    print(f"  {'전체 로드':<10} {full_peak / 1024 / 1024:>12.2f}MB {full_ms:>8.1f}ms")
+    print(f"  {'스트리밍':<10} {stream_peak / 1024 / 1024:>12.2f}MB {stream_ms:>8.1f}ms")
+    print(f"  동시 {bursts}건 기준 추정 peak: "
+          f"{full_peak * bursts / 1024 / 1024:.1f}MB → {stream_peak * bursts / 1024 / 1024:.1f}MB")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="end-of-call-report 파싱 메모리 벤치마크")
+    parser.add_argument("--minutes", type=int, default=20, help="통화 길이 (분)")
+    parser.add_argument("--bursts", type=int, default=10, help="동시에 처리한다고 가정할 웹훅 수")
+    args = parser.parse_args()
+    
+    main(args.minutes, args.bursts)
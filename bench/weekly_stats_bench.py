@@ -0,0 +1,212 @@
+"""대시보드 주간 통계(get_weekly_stats) 벤치마크
+
+통화 기록이 수천 건 쌓인 어르신 한 명의 주간 통계를
+- python: 이번 주 Call 행을 모두 ORM 객체로 가져와서 Python에서 집계 (첫 구현)
+- sql: calls에서 COUNT / SUM(CASE) / AVG를 한 번에 집계 (이전 구현)
+- rollup: 어르신 일별 집계(elder_daily_stats) 7행 합산 (app.services.dashboard.get_weekly_stats)
+세 방식으로 계산하고, 결과가 같은지 확인한 뒤 평균 / p95 지연 시간을 출력합니다.
+일별 집계는 통화를 넣은 뒤 DailyStatsService.rebuild로 채웁니다.
+
+기본값은 임시 SQLite DB이며, --database-url로 PostgreSQL 등 다른 DB를 지정할 수 있습니다.
+(지정한 DB의 테이블은 create_all로 생성되고 벤치마크 데이터가 추가되므로 빈 DB를 사용하세요.)
+
+사용법:
+    cd server
+    python -m bench.weekly_stats_bench
+    python -m bench.weekly_stats_bench --calls 20000 --iterations 50
+    python -m bench.weekly_stats_bench --database-url postgresql+asyncpg://user:pw@localhost/bench
+"""
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import select, insert, func, case
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.base import Base
+from app.db.models.call import Call
+from app.db.models.elder import Elder
+from app.db.models.user import User
+from app.schemas.dashboard import WeeklyStats, CallAttemptsStats, CallSuccessStats, AvgDurationStats
+from app.services.daily_stats import DailyStatsService
+from app.services.dashboard import get_week_range, get_weekly_stats, build_weekly_stats
+import app.db.models  # noqa: F401  (테이블 등록)
+
+STATUSES = ["completed"] * 7 + ["failed", "no_answer", "busy"]
+
+
+async def get_weekly_stats_python(
+    db: AsyncSession,
+    elder_id: int,
+    week_start: datetime,
+    week_end: datetime
+) -> WeeklyStats:
+    """이전 구현: 이번 주 통화를 모두 로드해서 Python에서 집계"""
+    result = await db.execute(
+        select(Call)
+        .where(Call.elder_id == elder_id)
+        .where(Call.started_at >= week_start)
+        .where(Call.started_at < week_end)
+    )
+    week_calls = result.scalars().all()
+
+    success_calls = [c for c in week_calls if c.status == "completed"]
+    durations = [
+        (c.ended_at - c.started_at).total_seconds() / 60
+        for c in success_calls
+        if c.ended_at
+    ]
+    avg_duration_minutes = int(sum(durations) / len(durations)) if durations else 0
+
+    return WeeklyStats(
+        call_attempts=CallAttemptsStats(count=len(week_calls)),
+        call_success_count=CallSuccessStats(count=len(success_calls)),
+        avg_duration=AvgDurationStats(minutes=avg_duration_minutes)
+    )
+
+
+async def get_weekly_stats_sql(
+    db: AsyncSession,
+    elder_id: int,
+    week_start: datetime,
+    week_end: datetime
+) -> WeeklyStats:
+    """이전 구현: 이번 주 calls 행을 DB에서 한 번에 집계"""
+    completed = Call.status == "completed"
+    result = await db.execute(
+        select(
+            func.count(Call.id).label("attempts"),
+            func.coalesce(func.sum(case((completed, 1), else_=0)), 0).label("success"),
+            func.avg(case((completed, Call.duration_seconds), else_=None)).label("avg_seconds"),
+        )
+        .where(Call.elder_id == elder_id)
+        .where(Call.started_at >= week_start)
+        .where(Call.started_at < week_end)
+    )
+    stats = result.one()
+    return build_weekly_stats(stats.attempts, stats.success, stats.avg_seconds)
+
+
+async def seed(session_factory, args, week_start: datetime) -> None:
+    """보호자 1명, 어르신 args.elders명, 대상 어르신(id=1)에 이번 주 통화 args.calls건 생성"""
+    rng = random.Random(42)
+    async with session_factory() as db:
+        db.add(User(id=1, email="bench@example.com"))
+        for elder_id in range(1, args.elders + 1):
+            db.add(Elder(
+                id=elder_id, user_id=1, name=f"어르신{elder_id}", gender="female", age=80,
+                relation="grandmother", phone="01000000000", residence_type="alone",
+                health_condition="good", begin_date=week_start - timedelta(days=365),
+                invite_code=f"{elder_id:06d}"[-6:]
+            ))
+        await db.flush()
+
+        def build_call(elder_id: int, start_range: tuple[datetime, datetime]) -> dict:
+            span = (start_range[1] - start_range[0]).total_seconds()
+            started_at = start_range[0] + timedelta(seconds=rng.uniform(0, span))
+            status = rng.choice(STATUSES)
+            # 완료된 통화 일부는 ended_at이 비어 있는 경우도 포함
+            ended_at = None
+            if status == "completed" and rng.random() > 0.05:
+                ended_at = started_at + timedelta(seconds=rng.uniform(30, 1800))
+            return {
+                "elder_id": elder_id, "user_id": 1, "started_at": started_at,
+                "ended_at": ended_at, "status": status,
+                "duration_seconds": (ended_at - started_at).total_seconds() if ended_at else None,
+            }
+
+        this_week = (week_start, week_start + timedelta(days=7))
+        last_weeks = (week_start - timedelta(days=90), week_start)
+        rows = [build_call(1, this_week) for _ in range(args.calls)]
+        # 지난 기록 / 다른 어르신 통화 (필터링 대상)
+        rows += [build_call(1, last_weeks) for _ in range(args.calls)]
+        rows += [build_call(rng.randint(2, args.elders), this_week) for _ in range(args.calls)]
+
+        for i in range(0, len(rows), 5000):
+            await db.execute(insert(Call), rows[i:i + 5000])
+        await DailyStatsService.rebuild(db)
+        await db.commit()
+
+
+async def measure(session_factory, fn, week_start: datetime, week_end: datetime, iterations: int):
+    """fn을 iterations번 실행해서 (결과, 지연 시간 리스트) 반환"""
+    timings = []
+    stats = None
+    for _ in range(iterations):
+        async with session_factory() as db:
+            start = time.perf_counter()
+            stats = await fn(db, 1, week_start, week_end)
+            timings.append(time.perf_counter() - start)
+    return stats, sorted(timings)
+
+
+async def run(args, database_url: str) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    # 주 중간 시각 기준 (week_start 직후 / week_end 직전 통화가 모두 포함되도록)
+    week_start, week_end = get_week_range(datetime(2025, 3, 12, 12, 0))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(session_factory, args, week_start)
+
+    print("=" * 60)
+    print(f"📈 Weekly stats benchmark: {args.calls} calls this week "
+          f"(+{args.calls * 2} other rows), {args.iterations} iterations, {engine.dialect.name}")
+    print("=" * 60)
+
+    results = {}
+    for name, fn in [("python", get_weekly_stats_python), ("sql", get_weekly_stats_sql), ("rollup", get_weekly_stats)]:
+        # warm-up
+        await measure(session_factory, fn, week_start, week_end, 2)
+        stats, timings = await measure(session_factory, fn, week_start, week_end, args.iterations)
+        results[name] = (stats, timings)
+        mean = sum(timings) / len(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"\n📊 {name}")
+        print(f"  - 결과: 시도 {stats.call_attempts.count}건, 성공 {stats.call_success_count.count}건, "
+              f"평균 {stats.avg_duration.minutes}분")
+        print(f"  - 지연 시간: 평균 {mean * 1000:.2f}ms, p95 {p95 * 1000:.2f}ms")
+
+    python_stats, python_timings = results["python"]
+    same = all(stats == python_stats for stats, _ in results.values())
+    print(f"\n{'✅' if same else '❌'} 결과 일치: {same}")
+    python_mean = sum(python_timings) / len(python_timings)
+    for name in ("sql", "rollup"):
+        timings = results[name][1]
+        print(f"  - {name}이 python보다 {python_mean / (sum(timings) / len(timings)):.1f}배 빠름")
+    print("=" * 60)
+
+    await engine.dispose()
+    if not same:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 주간 통계 벤치마크")
+    parser.add_argument("--calls", type=int, default=5000, help="대상 어르신의 이번 주 통화 수")
+    parser.add_argument("--elders", type=int, default=20, help="어르신 수 (대상 1명 + 나머지)")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--database-url", help="벤치마크용 DB (기본값: 임시 SQLite)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(run(args, args.database_url))
+        return
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        asyncio.run(run(args, f"sqlite+aiosqlite:///{db_dir}/bench.db"))
+
+
+if __name__ == "__main__":
+    main()
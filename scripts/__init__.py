@@ -0,0 +1 @@
+"""Maintenance scripts (backfill, rebuild 등)"""
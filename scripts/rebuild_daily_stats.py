@@ -0,0 +1,91 @@
+"""어르신 일별 통화 집계(elder_daily_stats) 재계산
+
+통화 저장 시 증분으로 갱신되는 elder_daily_stats를 calls에서 다시 계산합니다.
+- 집계 규칙을 바꿨거나, 집계 없이 통화를 직접 넣었거나, 집계가 어긋난 것 같을 때 실행
+- 재계산 전후를 비교해서 달라진 (어르신, 날짜) 행 수를 출력
+- 한 트랜잭션에서 삭제 후 다시 채우므로 실행 중에도 조회는 이전 집계를 봄
+
+사용법:
+    cd server
+    python -m scripts.rebuild_daily_stats
+    python -m scripts.rebuild_daily_stats --elder-id 3
+    python -m scripts.rebuild_daily_stats --dry-run
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import select
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.models.elder_daily_stats import ElderDailyStats
+from app.db.session import AsyncSessionLocal
+from app.services.daily_stats import DailyStatsService
+
+SNAPSHOT_COLUMNS = (
+    "attempts", "completions", "total_duration_seconds", "duration_count", "emotion_counts", "tag_counts",
+)
+
+
+async def snapshot(db, elder_id: int | None) -> dict:
+    """(elder_id, day)별 집계 값"""
+    query = select(ElderDailyStats)
+    if elder_id is not None:
+        query = query.where(ElderDailyStats.elder_id == elder_id)
+    result = await db.execute(query.execution_options(populate_existing=True))
+    return {
+        (row.elder_id, row.day): tuple(
+            round(getattr(row, column), 3) if column == "total_duration_seconds" else getattr(row, column)
+            for column in SNAPSHOT_COLUMNS
+        )
+        for row in result.scalars()
+    }
+
+
+async def rebuild(elder_id: int | None, dry_run: bool) -> None:
+    print("=" * 60)
+    print("🧮 어르신 일별 통화 집계 재계산")
+    print(f"👵 Elder: {elder_id or '전체'}, Dry run: {dry_run}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        before = await snapshot(db, elder_id)
+        counts = await DailyStatsService.rebuild(db, elder_id)
+        after = await snapshot(db, elder_id)
+
+        if dry_run:
+            await db.rollback()
+        else:
+            await db.commit()
+    elapsed = time.perf_counter() - start
+
+    changed = sum(1 for key in before.keys() & after.keys() if before[key] != after[key])
+    added = len(after.keys() - before.keys())
+    removed = len(before.keys() - after.keys())
+
+    print(f"📊 결과 요약:")
+    print(f"  - 읽은 통화: {counts['calls']}건")
+    print(f"  - 집계 행: {counts['rows']}개 (이전 {len(before)}개)")
+    print(f"  - 변경: 값 변경 {changed}개, 추가 {added}개, 삭제 {removed}개")
+    print(f"  - 소요 시간: {elapsed:.2f}s")
+    print(f"{'🔍 dry run - 저장하지 않음' if dry_run else '✨ 저장 완료'}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="어르신 일별 통화 집계 재계산")
+    parser.add_argument("--elder-id", type=int, help="특정 어르신만 재계산 (기본값: 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="비교 결과만 출력하고 저장하지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(rebuild(args.elder_id, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
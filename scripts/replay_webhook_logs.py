@@ -0,0 +1,196 @@
+"""웹훅 로그 replay / 통화 기록 bulk backfill
+
+웹훅 저장이 실패했던 기간의 통화를 data/webhook_logs의 JSON 파일로부터 다시 저장합니다.
+- 파일명(YYYYMMDD_HHMMSS_ffffff_<type>.json)으로 end-of-call-report와 날짜 범위를 먼저 거름
+- 파일 파싱은 process pool에서 병렬 처리 (CallService.parse_call_report / parse_call_messages)
+- 저장은 CallService.bulk_save_calls로 batch 단위 처리, 이미 저장된 vapi_call_id는 건너뜀
+- 이메일은 발송하지 않음
+
+사용법:
+    cd server
+    python -m scripts.replay_webhook_logs --from 2025-01-01 --to 2025-01-31
+    python -m scripts.replay_webhook_logs --dry-run
+    python -m scripts.replay_webhook_logs --log-dir /backup/webhook_logs --workers 8 --batch-size 500
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.session import AsyncSessionLocal
+from app.routers.webhook import WEBHOOK_LOG_DIR
+from app.services.call import CallService
+from app.services.webhook_parser import load_webhook_body, iter_report_messages
+
+REPORT_SUFFIX = "_end-of-call-report.json"
+FILENAME_TIME_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def scan_report_files(log_dir: Path, date_from: datetime | None, date_to: datetime | None) -> list[str]:
+    """
+    로그 디렉토리에서 날짜 범위 내의 end-of-call-report 파일 경로 수집 (파일은 열지 않음)
+    
+    Args:
+        log_dir: 웹훅 로그 디렉토리
+        date_from: 시작 시각 (포함, None이면 제한 없음)
+        date_to: 종료 시각 (미포함, None이면 제한 없음)
+    
+    Returns:
+        파일 경로 리스트 (수신 시각 순)
+    """
+    paths = []
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(REPORT_SUFFIX):
+                continue
+            
+            try:
+                received_at = datetime.strptime(entry.name[:15], FILENAME_TIME_FORMAT)
+            except ValueError:
+                continue
+            
+            if date_from and received_at < date_from:
+                continue
+            if date_to and received_at >= date_to:
+                continue
+            
+            paths.append(entry.path)
+    
+    # 파일명이 수신 시각으로 시작하므로 이름순 = 시간순
+    paths.sort()
+    return paths
+
+
+def parse_report_file(path: str) -> tuple[str, str, tuple[dict, list[dict]] | str | None]:
+    """
+    (worker 프로세스) 웹훅 로그 파일 하나를 저장용 값으로 파싱
+    
+    Returns:
+        (결과, 파일 경로, 값) 튜플
+        - ("ok", path, (Call 컬럼 값, CallMessage 컬럼 값 리스트))
+        - ("skipped", path, None): end-of-call-report가 아님
+        - ("error", path, 에러 메시지)
+    """
+    try:
+        body = load_webhook_body(Path(path))
+        message = body.get("message", {})
+        if message.get("type") != "end-of-call-report":
+            return "skipped", path, None
+        
+        call_values = CallService.parse_call_report(message)
+        
+        messages = message.get("messages")
+        if messages is None:
+            messages = iter_report_messages(Path(path))
+        message_rows = list(CallService.parse_call_messages(messages, call_values["started_at"]))
+        
+        return "ok", path, (call_values, message_rows)
+    except Exception as e:
+        return "error", path, f"{type(e).__name__}: {e}"
+
+
+def chunked(items: list, size: int):
+    """리스트를 size개씩 나눠서 반환"""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+async def replay(
+    log_dir: Path,
+    date_from: datetime | None,
+    date_to: datetime | None,
+    workers: int,
+    batch_size: int,
+    dry_run: bool,
+):
+    """웹훅 로그를 파싱하여 통화 기록 backfill"""
+    print("=" * 60)
+    print("🔁 웹훅 로그 replay 시작")
+    print(f"📂 Log dir: {log_dir}")
+    print(f"📅 Range: {date_from or '-'} ~ {date_to or '-'}")
+    print(f"⚙️ Workers: {workers}, Batch size: {batch_size}, Dry run: {dry_run}")
+    print("=" * 60)
+    
+    start = time.perf_counter()
+    paths = scan_report_files(log_dir, date_from, date_to)
+    print(f"🔍 대상 파일 {len(paths)}개 (scan {time.perf_counter() - start:.2f}s)")
+    
+    totals = {"parsed": 0, "skipped": 0, "errors": 0, "inserted": 0, "existing": 0, "no_elder": 0, "no_call_id": 0, "messages": 0}
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        async with AsyncSessionLocal() as db:
+            for batch_paths in chunked(paths, batch_size):
+                # 파싱은 process pool에서 (이벤트 루프를 막지 않도록 executor 결과를 스레드에서 수집)
+                results = await asyncio.to_thread(
+                    lambda: list(executor.map(parse_report_file, batch_paths, chunksize=max(1, batch_size // (workers * 4))))
+                )
+                
+                reports = []
+                for status, path, value in results:
+                    if status == "ok":
+                        reports.append(value)
+                    elif status == "skipped":
+                        totals["skipped"] += 1
+                    else:
+                        totals["errors"] += 1
+                        print(f"⚠️ {Path(path).name}: {value}")
+                totals["parsed"] += len(reports)
+                
+                if not dry_run and reports:
+                    try:
+                        counts = await CallService.bulk_save_calls(db, reports)
+                    except Exception:
+                        await db.rollback()
+                        raise
+                    for key, value in counts.items():
+                        totals[key] += value
+                
+                elapsed = time.perf_counter() - start
+                done = totals["parsed"] + totals["skipped"] + totals["errors"]
+                print(
+                    f"   ... {done}/{len(paths)} files, inserted {totals['inserted']}, "
+                    f"{done / elapsed:.0f} files/s"
+                )
+    
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    print("✨ replay 완료")
+    print("=" * 60)
+    print(f"📊 결과 요약:")
+    print(f"  - 대상 파일: {len(paths)}개")
+    print(f"  - 파싱 성공: {totals['parsed']}개 (에러 {totals['errors']}개, 통화 리포트 아님 {totals['skipped']}개)")
+    print(f"  - 저장: {totals['inserted']}건 (CallMessage {totals['messages']}개)")
+    print(f"  - 건너뜀: 이미 저장됨 {totals['existing']}건, 어르신 없음 {totals['no_elder']}건, vapi_call_id 없음 {totals['no_call_id']}건")
+    print(f"  - 소요 시간: {elapsed:.2f}s ({len(paths) / elapsed if elapsed else 0:.0f} files/s, "
+          f"{totals['inserted'] / elapsed if elapsed else 0:.0f} calls/s)")
+    print("=" * 60)
+
+
+def parse_date(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="웹훅 로그 replay / 통화 기록 backfill")
+    parser.add_argument("--log-dir", type=Path, default=WEBHOOK_LOG_DIR, help="웹훅 로그 디렉토리")
+    parser.add_argument("--from", dest="date_from", type=parse_date, help="시작 날짜 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--to", dest="date_to", type=parse_date, help="종료 날짜 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="파싱 worker 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 저장할 파일 수")
+    parser.add_argument("--dry-run", action="store_true", help="파싱만 하고 저장하지 않음")
+    args = parser.parse_args()
+    
+    # --to는 해당 날짜 하루 전체를 포함
+    date_to = args.date_to + timedelta(days=1) if args.date_to else None
+    
+    asyncio.run(replay(args.log_dir, args.date_from, date_to, args.workers, args.batch_size, args.dry_run))